@@ -14,6 +14,7 @@ from ._season import Season
 from ._unit import Unit
 
 from ._map import Map
+from ._zobrist import Zobrist
 from ._variant import Variant
 
 __all__ = [
@@ -25,5 +26,6 @@ __all__ = [
     "Province",
     "Season",
     "Unit",
-    "Variant"
+    "Variant",
+    "Zobrist"
 ]
@@ -4,7 +4,6 @@
 
 from adjudicator import Geography
 from lib.classes import despecify
-from lib.lists import first_named
 
 class Location:
     """ A location is a geography paired with a province. That is,
@@ -52,6 +51,13 @@ class Location:
     province : Province
         The province instance associated with the location.
 
+    connected : frozenset of integers
+        The set of adjacent locations, identified by `id`.
+
+    reached : frozenset of Provinces
+        The set of provinces of the adjacent locations. Set by the
+        `load` method of the map.
+
     Notes
     -----
     The location specifies adjacencies.
@@ -65,6 +71,9 @@ class Location:
 
     """
 
+    __slots__ = ('id', 'name', 'connections', 'connected', 'map',
+                 'geography', 'force', 'province', 'reached')
+
     def __init__(self, id, name, connections, geography, map):
         """ Constructor.
 
@@ -72,16 +81,34 @@ class Location:
         self.id = int(id)
         self.name = name
         self.connections = tuple(connections)
+        self.connected = frozenset(self.connections)
         self.map = map
 
         self.geography = map.instance(geography, Geography)
         self.force = self.geography.force
 
-        self.province = first_named(
-            map.provinces,
-            despecify(self.name, self.geography)
+        self.province = map.instance(
+            despecify(self.name, self.geography),
+            'provinces'
         )
 
+    def __getstate__(self):
+        """ Returns the state to pickle, without the set of connections, as
+        a tuple, which unpickles faster than a dictionary.
+
+        """
+        return (self.id, self.name, self.connections, self.map,
+                self.geography, self.force, self.province,
+                getattr(self, 'reached', None))
+
+    def __setstate__(self, state):
+        """ Restores a pickled state.
+
+        """
+        (self.id, self.name, self.connections, self.map, self.geography,
+         self.force, self.province, self.reached) = state
+        self.connected = frozenset(self.connections)
+
     def __str__(self):
         """ Print format.
 
@@ -95,10 +122,10 @@ class Location:
 
         """
         try:
-            return location.id in self.connections
+            return location.id in self.connected
 
         except AttributeError:
-            return location in self.connections
+            return location in self.connected
 
     def reaches_province(self, province):
         """ Tests if the instance reaches any location associated with 
@@ -107,12 +134,8 @@ class Location:
         Might be rewritten to also allow string inputs (province names),
         but there is currently no need.
 
-        Uses that the id of a location is equal to its position in the
-        list `self.map.locations`.
-
         """
-        return province in [self.map.locations[k].province
-                            for k in self.connections]
+        return province in self.reached
 
     def named(self, name):
         """ Tests if the instance is associated with the given name.
@@ -6,11 +6,13 @@ from json import load as json_load
 
 from collections import ChainMap
 
+import numpy as np
+
 from adjudicator import Force, Geography, Location, Province
 
 from lib.errors import MapError
 from lib.classes import make_instances
-from lib.lists import attr_select, flatten
+from lib.lists import attr_select, name_index
 
 
 class Map:
@@ -57,6 +59,43 @@ class Map:
     supply_centers : list of Provinces
         A list of all provinces that are supply centers.
 
+    location_provinces : numpy array of integers
+        The index in `provinces` of the province of each location.
+
+    adjacency : numpy array of booleans
+        Location to location adjacency table.
+
+    reaches : numpy array of booleans
+        Location to province adjacency table. See
+        `Location.reaches_province`.
+
+    province_adjacency : dictionary
+        A dictionary whose keys are forces, and whose values are province
+        to province adjacency tables for units of the force. The row of a
+        province with several locations of the force, e.g. coasts, merges
+        the adjacencies of its locations; the other rows are exact.
+
+    neighbours : list of integers
+        The adjacent locations of each location, indexed by location id,
+        as bitsets of location ids; i.e. bit k is set if the location with
+        id k is adjacent.
+
+    reaching : dictionary
+        A dictionary whose keys are provinces, and whose values are the
+        bitsets of the ids of the locations reaching the province. See
+        `has_path`.
+
+    names : dictionary
+        A dictionary whose keys are the names of the attributes holding
+        instances, e.g. 'provinces', and whose values are dictionaries of
+        the instances by name. Filled by the `instance` method on demand,
+        and not pickled.
+
+    located : dictionary
+        A dictionary whose keys are pairs of a force and a name, and whose
+        values are tuples of the locations of the force with the name, or
+        whose province has the name or abbreviation. See `locate`.
+
     Notes
     -----
     The information in the corresponding JSON file in the `maps`
@@ -78,6 +117,15 @@ class Map:
         """
         return self.name
 
+    def __getstate__(self):
+        """ Returns the state to pickle, without the name index.
+
+        """
+        state = dict(self.__dict__)
+        state['names'] = {}
+
+        return state
+
     def info(self, string):
         """ Retrieves information as a string.
 
@@ -92,6 +140,8 @@ class Map:
         with open(f'maps/{self.name}.json') as file:
             data = json_load(file)
 
+        self.names = {}
+
         self.orders = tuple(data['orders'])
 
         # Create all class instances
@@ -138,8 +188,67 @@ class Map:
         if False in id_check:
             raise MapError("Location id's doesn't match `map.locations` indices.")
 
+        self.__compile_tables__()
+        self.__compile_names__()
+
         self.loaded = True
 
+    def __compile_tables__(self):
+        """ Computes the adjacency tables and bitsets of the map, and the
+        sets of provinces reached by each location.
+
+        """
+        index = {province: k for k, province in enumerate(self.provinces)}
+        size = len(self.locations)
+
+        self.location_provinces = np.array([index[location.province]
+                                            for location in self.locations])
+        self.adjacency = np.zeros((size, size), dtype=bool)
+        self.reaches = np.zeros((size, len(index)), dtype=bool)
+        self.province_adjacency = {
+            force: np.zeros((len(index), len(index)), dtype=bool)
+            for force in self.forces
+        }
+
+        for location in self.locations:
+            connections = list(location.connections)
+            provinces = self.location_provinces[connections]
+            self.adjacency[location.id, connections] = True
+            self.reaches[location.id, provinces] = True
+            self.province_adjacency[location.force][
+                index[location.province], provinces] = True
+            location.reached = frozenset(self.locations[k].province
+                                         for k in connections)
+
+        self.neighbours = [sum(1 << k for k in location.connected)
+                           for location in self.locations]
+        self.reaching = {province: 0 for province in self.provinces}
+        for location in self.locations:
+            for province in location.reached:
+                self.reaching[province] |= 1 << location.id
+
+    def __compile_names__(self):
+        """ Computes the locations of each force by name; see `located`.
+
+        """
+        shorts = {}
+        for short, name in self.abbreviations.items():
+            shorts.setdefault(name, []).append(short)
+
+        located = {}
+        for location in self.locations:
+            for name in dict.fromkeys([location.name, location.province.name]):
+                located.setdefault((location.force, name), []).append(location)
+
+        names = set(located)
+        for location in self.locations:
+            for short in shorts.get(location.province.name, []):
+                if (location.force, short) not in names:
+                    located.setdefault((location.force, short),
+                                       []).append(location)
+
+        self.located = {key: tuple(value) for key, value in located.items()}
+
     def instance(self, name, class_):
         """ Finds the instance of a given class with a given name.
 
@@ -149,14 +258,16 @@ class Map:
                       Geography: 'geographies',
                       Province: 'provinces'}
 
+        attribute = attributes.get(class_, class_)
+
+        # Index the instances by name on the first lookup.
         try:
-            objects = getattr(self, attributes[class_])
+            names = self.names[attribute]
 
         except KeyError:
-            objects = getattr(self, class_)
-    
-        return next((obj for obj in objects if obj.name == name),
-                    None)
+            names = self.names[attribute] = name_index(getattr(self, attribute))
+
+        return names.get(name)
 
     def instances(self, lst, class_):
         """ Finds the instances of a given class with given names.
@@ -211,15 +322,13 @@ class Map:
             return self.locations[identifier]
         
         # In the second case is if the identifier is a province or the
-        # name of a province or location.
-        locations = [loc for loc in self.locations
-                     if loc.named(str(identifier))
-                     and loc.force == force]
+        # name or abbreviation of a province, or the name of a location.
+        locations = list(self.located.get((force, str(identifier)), ()))
 
         # Filter by reachable from origin location
         if len(locations) > 1 and origin is not None:
             locations = [loc for loc in locations
-                         if origin.id in loc.connections]
+                         if origin.id in loc.connected]
 
         # Filter by specifier.
         if len(locations) > 1 and specifier is not None:
@@ -245,10 +354,33 @@ class Map:
         
         """
         return next((True for loc in locations
-                     if loc.reaches_province(province)),
+                     if province in loc.reached),
                     False)
 
-    def has_path(self, source, target, via):
+    @staticmethod
+    def bitset(locations):
+        """ Returns the bitset of the ids of a list of locations.
+
+        """
+        bits = 0
+        for location in locations:
+            bits |= 1 << location.id
+        return bits
+
+    def __spread__(self, bits):
+        """ Returns the bitset of the locations adjacent to a bitset of
+        locations.
+
+        """
+        neighbours = self.neighbours
+        spread = 0
+        while bits:
+            low = bits & -bits
+            spread |= neighbours[low.bit_length() - 1]
+            bits ^= low
+        return spread
+
+    def has_path(self, source, target, via, memo=None):
         """ Tests if there is a path from a source province to a target 
         province via a set of given locations. 
         
@@ -256,28 +388,92 @@ class Map:
         if there is no path, then the method returns `False`, even if the
         two provinces are adjacent. This is intentional.
 
-        The algorithm is by graph contractions, and does not identify the
-        explicit path. Checking for explicit paths is much slower.
+        The search is breadth first over bitsets of location ids, and does
+        not identify the explicit path; see `convoy_path`.
+
+        Parameters
+        ----------
+        source : Province
+
+        target : Province
+
+        via : list of Locations or integer
+            The locations, or the bitset of their ids; see `bitset`.
+
+        memo : dictionary, optional
+            A dictionary in which the results are kept, keyed by the source,
+            the target and the bitset of the locations, e.g. for the
+            duration of an adjudication.
 
         """
-        # Identify all location adjacent to the source province and
-        # check if we can reach the target using only one `via` location.
-        reached = [loc for loc in via if loc.reaches_province(source)]
-        arrived = self.one_adjacent(reached, target)
+        if not isinstance(via, int):
+            via = self.bitset(via)
 
-        # Iteratively expand the set of location that we have reached.
-        new = reached
-        while not arrived and len(new) > 0:
+        if memo is not None:
+            key = (source, target, via)
+            arrived = memo.get(key)
+            if arrived is None:
+                arrived = memo[key] = self.has_path(source, target, via)
+            return arrived
 
-            # Find the locations that we reach in this step.
-            ids = flatten([loc.connections for loc in new])
-            new = [loc for loc in via if loc.id in ids 
-                   and loc not in reached]
-            
-            # Check if we can arrive at the target.
-            arrived = self.one_adjacent(new, target)
+        goal = self.reaching[target]
+        reached = new = via & self.reaching[source]
+
+        while new:
+            if new & goal:
+                return True
+            new = self.__spread__(new) & via & ~reached
+            reached |= new
+
+        return False
+
+    def convoy_path(self, source, target, via):
+        """ Returns a shortest chain of given locations from a source
+        province to a target province, e.g. the fleets convoying a unit in
+        the order they carry it, or None if there is no such chain. See
+        `has_path`.
 
-            # Remember all locations that we've reached so far. 
+        """
+        locations = [location for location in via
+                     if source in location.reached]
+        previous = {location: None for location in locations}
+
+        while locations:
+            arrived = next((location for location in locations
+                            if target in location.reached), None)
+            if arrived is not None:
+                path = []
+                while arrived is not None:
+                    path.insert(0, arrived)
+                    arrived = previous[arrived]
+                return path
+
+            new = []
+            for location in via:
+                if location in previous:
+                    continue
+                before = next((other for other in locations
+                               if location.id in other.connected), None)
+                if before is not None:
+                    previous[location] = before
+                    new.append(location)
+            locations = new
+
+        return None
+
+    def convoy_reach(self, source, via):
+        """ Returns the locations from a set of given locations which can
+        be reached from a source province by a chain of those locations,
+        e.g. the fleets which can take part in convoying a unit.
+
+        """
+        reached = [loc for loc in via if source in loc.reached]
+
+        new = reached
+        while len(new) > 0:
+            ids = set().union(*[loc.connected for loc in new])
+            new = [loc for loc in via if loc.id in ids
+                   and loc not in reached]
             reached = reached + new
 
-        return arrived
+        return reached
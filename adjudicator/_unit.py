@@ -20,6 +20,10 @@ class Unit:
     location : Location
         The current location of the unit.
 
+    game : Game, optional
+        The game the unit is placed in. If given, the position hash of
+        the game is updated when the unit moves.
+
     Attributes
     ----------
     id : integer
@@ -34,6 +38,9 @@ class Unit:
     location : Location
         See Parameters.
 
+    game : Game or None
+        See Parameters.
+
     specifiers : list of strings
         A list of the specifiers which may appear in the names
         of locations holding the unit.
@@ -47,7 +54,9 @@ class Unit:
 
     """
 
-    def __init__(self, id, owner, force, location):
+    __slots__ = ('id', 'owner', 'force', 'location', 'game')
+
+    def __init__(self, id, owner, force, location, game=None):
         """ Constructor.
 
         """
@@ -55,6 +64,7 @@ class Unit:
         self.owner = owner
         self.force = force
         self.location = location
+        self.game = game
 
     def __str__(self, suffix='.'):
         """ Print format.
@@ -85,10 +95,15 @@ class Unit:
         return f'{self.owner}{self.id}'
 
     def move_to(self, location):
-        """ Changes the unit's location and province.
+        """ Changes the unit's location and province, and updates the
+        position hash of the game holding the unit.
 
         """
+        if self.game is not None:
+            self.game.__toggle_unit__(self)
         self.location = location
+        if self.game is not None:
+            self.game.__toggle_unit__(self)
 
     def reaches(self, location):
         """ Checks if the unit can reach a given location.
@@ -2,11 +2,24 @@
 
 """
 
-from json import load as json_load
+import gc
+import os
+import pickle
+import sys
 
-from adjudicator import Map, Power
+from hashlib import sha256
+from json import dumps as json_dumps, load as json_load, loads as json_loads
 
+import numpy as np
+
+from adjudicator import (Force, Geography, Location, Map, Power, Province,
+                         Season, Zobrist)
+
+from lib import classes, lists
+from lib.automaton import Automaton
 from lib.classes import make_instances
+from lib.itemlist import literal
+from lib.lists import name_index
 
 class Variant:
     """ This is a class of which an instance is variant of
@@ -57,14 +70,48 @@ class Variant:
 
     marker_size : integer
         The marker size to be used by the graphics package.
+
+    zobrist : Zobrist
+        The table of keys used to hash the positions of the variant.
+
+    names : dictionary
+        A dictionary whose keys are the names of the attributes holding
+        instances, i.e. 'powers', and whose values are dictionaries of the
+        instances by name. Filled by the `instance` method on demand.
+
+    matcher : Automaton
+        The automaton finding the words of orders; see `matcher`.
         
     Notes
     -----
     The attributes are loaded when the `load` method is called the
     first time, and not on initialization.
 
+    Loading the JSON files rebuilds and checks every province, geography
+    and location of the map. The variant may therefore be compiled to an
+    artifact in the `artifacts` folder by `compile`, e.g. by running
+    `python3 -m adjudicator.compile`, which is a pickle of the attributes
+    preceded by a header line giving the format version, the SHA-256
+    checksum of the pickle, and the SHA-256 digest of the paths,
+    modification times and sizes of the sources it was compiled from: the
+    JSON files of the variant and its map, and the modules whose code
+    builds the pickled attributes, together with the version of numpy.
+    The artifact is only used while the version and the digests match.
+    The name index and the matcher are not compiled.
+    Loading never writes the artifact. Like the JSON files, the folder is
+    relative to the working directory.
+
+    The variants returned by `get` are shared by every game of the process,
+    and must be treated as read-only.
+
     """
 
+    artifacts = 'variants/compiled'
+    artifact_version = 2
+
+    # The loaded variants of the process, keyed by name; see `get`.
+    registry = {}
+
     def __init__(self, name):
         """ Constructor.
 
@@ -72,13 +119,49 @@ class Variant:
         self.name = name
         self.loaded = False
 
+    @classmethod
+    def get(cls, name):
+        """ Returns the loaded variant with a given name, which is loaded
+        once per process and then shared; e.g. by all games of the variant.
+
+        Parameters
+        ----------
+        name : string
+            The name of the variant.
+
+        """
+        variant = cls.registry.get(name)
+        if variant is None:
+            variant = cls(name)
+            variant.load()
+            cls.registry[name] = variant
+
+        return variant
+
     def __str__(self, suffix='.'):
         """ Print format.
 
         """
         return self.name
 
-    def load(self):
+    def load(self, compiled=True):
+        """ Loads the variant information from the compiled artifact of
+        the variant if it is fresh, and otherwise from the JSON file with
+        the name of the variant. A missing or stale artifact is not
+        written; see `compile`.
+
+        Parameters
+        ----------
+        compiled : boolean, optional
+            Whether to use the compiled artifact. Default is True.
+
+        """
+        if compiled and self.__load_artifact__():
+            return
+
+        self.__load_json__()
+
+    def __load_json__(self):
         """ Loads the variant information from the JSON file with
         the name of the variant.
 
@@ -90,12 +173,151 @@ class Variant:
             setattr(self, key, value)
 
         self.powers = make_instances(self.powers, Power)
+        self.names = {}
         
         self.map = Map(self.map)
         self.map.load()
 
+        self.zobrist = Zobrist(self)
+
         self.loaded = True
 
+    def __artifact__(self):
+        """ Returns the path of the compiled artifact of the variant.
+
+        """
+        return os.path.join(self.artifacts, f'{self.name}.pickle')
+
+    def __digest__(self, map_name):
+        """ Returns the digest of the sources of the variant, or None if
+        one of them cannot be found. As for the cached bytecode of modules,
+        the sources are identified by their paths, modification times and
+        sizes, such that they need not be read on every load.
+
+        """
+        paths = [f'variants/{self.name}.json', f'maps/{map_name}.json'] + [
+            module.__file__ for module in self.__modules__()
+        ]
+        digest = sha256(sys.implementation.cache_tag.encode())
+        digest.update(np.__version__.encode())
+
+        try:
+            for path in paths:
+                stat = os.stat(path)
+                digest.update(f'{path}:{stat.st_mtime_ns}:{stat.st_size}\n'
+                              .encode())
+
+        except OSError:
+            return None
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def __modules__():
+        """ Returns the modules whose code builds the attributes of a
+        variant: those of the pickled classes, of the seasons hashed by the
+        Zobrist keys, and of the functions building the map.
+
+        """
+        return [sys.modules[cls.__module__] for cls in
+                (Force, Geography, Location, Map, Power, Province, Season,
+                 Variant, Zobrist)] + [classes, lists]
+
+    def compile(self):
+        """ Writes the compiled artifact of the variant, which is loaded
+        from the JSON files first if it is not loaded.
+
+        """
+        if not self.loaded:
+            self.load(compiled=False)
+
+        # The name index and the matcher are rebuilt on demand.
+        payload = pickle.dumps(
+            {key: value for key, value in vars(self).items()
+             if key not in ('loaded', 'names', '_matcher')},
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+        header = json_dumps({
+            'version': self.artifact_version,
+            'map': self.map.name,
+            'sources': self.__digest__(self.map.name),
+            'sha256': sha256(payload).hexdigest(),
+        })
+
+        # Write to a temporary file first, such that concurrent loads
+        # never see a partial artifact.
+        path = self.__artifact__()
+        temporary = f'{path}.{os.getpid()}.tmp'
+        os.makedirs(self.artifacts, exist_ok=True)
+        with open(temporary, 'wb') as file:
+            file.write(header.encode() + b'\n' + payload)
+        os.replace(temporary, path)
+
+    def __load_artifact__(self):
+        """ Loads the variant information from the compiled artifact.
+        Returns whether the artifact was fresh and valid.
+
+        """
+        try:
+            with open(self.__artifact__(), 'rb') as file:
+                header = json_loads(file.readline())
+                payload = file.read()
+
+        except (OSError, ValueError):
+            return False
+
+        if not (isinstance(header, dict)
+                and header.get('version') == self.artifact_version
+                and header.get('sha256') == sha256(payload).hexdigest()
+                and header.get('sources') is not None
+                and header.get('sources') == self.__digest__(header.get('map'))):
+            return False
+
+        # Unpickling allocates many small objects, none of them garbage,
+        # which would trigger the cyclic garbage collector several times.
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            state = pickle.loads(payload)
+
+        except (pickle.UnpicklingError, AttributeError, EOFError,
+                ImportError, TypeError):
+            return False
+
+        finally:
+            if enabled:
+                gc.enable()
+
+        self.names = {}
+        for key, value in state.items():
+            setattr(self, key, value)
+
+        self.loaded = True
+
+        return True
+
+    @property
+    def matcher(self):
+        """ The automaton finding the province, order, force, specifier and
+        power names, and the digits, of the variant in lower case order
+        strings; see `lib.itemlist.ItemList`. Built on first use.
+
+        """
+        try:
+            return self._matcher
+
+        except AttributeError:
+            words = [province.name for province in self.map.provinces]
+            words += list(self.map.orders)
+            words += [force.name for force in self.map.forces]
+            words += [specifier for force in self.map.forces
+                      for specifier in force.specifiers]
+            words += [power.name for power in self.powers]
+            words += [str(digit) for digit in range(10)]
+            self._matcher = Automaton(literal(word) for word in words)
+
+            return self._matcher
+
     def instance(self, name, class_type):
         """ Returns the instance of a class with a given name.
 
@@ -116,12 +338,13 @@ class Variant:
 
         """
         classes = {Power: 'powers'}
+        attribute = classes.get(class_type, class_type)
 
+        # Index the instances by name on the first lookup.
         try:
-            objects = getattr(self, classes[class_type])
+            names = self.names[attribute]
 
         except KeyError:
-            objects = getattr(self, class_type)            
+            names = self.names[attribute] = name_index(getattr(self, attribute))
 
-        return next((obj for obj in objects if obj.name == name),
-                    None)
+        return names.get(name)
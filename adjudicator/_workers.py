@@ -0,0 +1,22 @@
+""" The game of a worker process, shared by the process pools of the
+`rollouts` and `evaluation` modules.
+
+Each worker loads the variant once, in a game which every task restores to
+the position it starts from.
+
+"""
+
+
+from adjudicator.game import Game
+
+
+# The game of the current worker process; see `initialize`.
+game = None
+
+
+def initialize(variant_name, engine):
+    """ Initializer of the worker processes; loads the variant once.
+
+    """
+    global game
+    game = Game(variant_name, engine=engine)
@@ -0,0 +1,108 @@
+""" The Zobrist class
+
+"""
+
+from array import array
+from itertools import product
+from random import Random
+
+from adjudicator import Season
+
+
+class Zobrist:
+    """ A table of random 64-bit keys for Zobrist hashing of the positions
+    of a variant. The hash of a position is the exclusive or of the keys of
+    its units, its supply center ownerships and its season phase, such that
+    it can be updated incrementally whenever one of them changes.
+
+    Parameters
+    ----------
+    variant : Variant
+        A loaded variant.
+
+    seed : string, optional
+        The seed of the random number generator. The keys only depend on
+        the variant and the seed, so hashes may be compared across games
+        and processes. Default is 'Zobrist'.
+
+    Attributes
+    ----------
+    units : dictionary
+        A dictionary whose keys are pairs of a power and a location, and
+        whose values are the keys of a unit of the power in the location.
+        The force of the unit is given by the location.
+
+    centers : dictionary
+        A dictionary whose keys are pairs of a power and a supply center,
+        and whose values are the keys of the power owning the center.
+
+    seasons : dictionary
+        A dictionary whose keys are pairs of a season name and a phase,
+        and whose values are the keys of the season phase.
+
+    Notes
+    -----
+    The keys are pickled as arrays, which are much faster to load than
+    dictionaries keyed by tuples of instances.
+
+    """
+
+    def __init__(self, variant, seed='Zobrist'):
+        """ Constructor.
+
+        """
+        rng = Random(f'{variant.name}-{seed}')
+        self.units = {(power, location): rng.getrandbits(64)
+                      for power in variant.powers
+                      for location in variant.map.locations}
+        self.centers = {(power, province): rng.getrandbits(64)
+                        for power in variant.powers
+                        for province in variant.map.supply_centers}
+        phases = sorted(set(Season.phases.values())) + ['Pregame', 'Postgame']
+        self.seasons = {(name, phase): rng.getrandbits(64)
+                        for name in sorted(set(Season.names.values()))
+                        for phase in phases}
+
+    def __getstate__(self):
+        """ Returns the state to pickle.
+
+        """
+        powers = list(dict.fromkeys(power for power, _ in self.units))
+        locations = list(dict.fromkeys(location for _, location in self.units))
+        provinces = list(dict.fromkeys(province for _, province
+                                       in self.centers))
+
+        return (powers, locations, provinces,
+                array('Q', [self.units[power, location] for power in powers
+                            for location in locations]).tobytes(),
+                array('Q', [self.centers[power, province] for power in powers
+                            for province in provinces]).tobytes(),
+                self.seasons)
+
+    def __setstate__(self, state):
+        """ Restores a pickled state.
+
+        """
+        powers, locations, provinces, units, centers, self.seasons = state
+        self.units = dict(zip(product(powers, locations),
+                              array('Q', units).tolist()))
+        self.centers = dict(zip(product(powers, provinces),
+                                array('Q', centers).tolist()))
+
+    def unit(self, unit):
+        """ Returns the key of a unit.
+
+        """
+        return self.units[unit.owner, unit.location]
+
+    def center(self, power, province):
+        """ Returns the key of a power owning a supply center.
+
+        """
+        return self.centers[power, province]
+
+    def season(self, season):
+        """ Returns the key of the phase of a season.
+
+        """
+        return self.seasons[season.name, season.phase]
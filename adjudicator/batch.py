@@ -0,0 +1,784 @@
+""" The BatchAdjudicator class
+
+"""
+
+
+import numpy as np
+
+from adjudicator import Unit
+from adjudicator.orders import Convoy, Hold, Move, Support
+from adjudicator.orders.lib import DiplomacyOrders, OrderStatus
+
+
+# Encoding of unknown, False and True for partially resolved booleans.
+UNKNOWN, FALSE, TRUE = -1, 0, 1
+
+# Numerical values of order statuses; see OrderStatus.
+ILLEGAL, BROKEN, CUT, NO_EFFECT, VALID = map(int, (
+    OrderStatus.ILLEGAL, OrderStatus.BROKEN, OrderStatus.CUT,
+    OrderStatus.NO_EFFECT, OrderStatus.VALID
+))
+
+
+class BatchAdjudicator:
+    """ An adjudicator for the diplomacy phases of many independent
+    positions at once. The positions are given as arrays, and are resolved
+    together by vectorized computations of strengths and bounces.
+
+    Parameters
+    ----------
+    variant : Variant
+        The (loaded) variant of the positions.
+
+    Attributes
+    ----------
+    variant : Variant
+        See Parameters.
+
+    provinces : numpy array of integers
+        The index in `variant.map.provinces` of the province of each
+        location, indexed by location id.
+
+    adjacent : numpy array of booleans
+        Location to location adjacency table.
+
+    reaches : numpy array of booleans
+        Location to province adjacency table. See `Location.reaches_province`.
+
+    armies : numpy array of booleans
+        Whether each location is a location of armies, indexed by location
+        id.
+
+    game : Game or None
+        The game used to resolve positions which are not resolved by the
+        vectorized computations. Created when first needed.
+
+    fallbacks : integer
+        The number of positions of the last batch which were resolved by
+        the game.
+
+    Notes
+    -----
+    A batch of N positions with at most U units each is given by three
+    arrays:
+
+    locations : integers of shape (N, U)
+        The location id of each unit; -1 marks an empty slot.
+
+    owners : integers of shape (N, U)
+        The index in `variant.powers` of the owner of each unit.
+
+    orders : integers of shape (N, U, 3)
+        The order of each unit, encoded as (kind, object, target). The kind
+        is one of the class attributes HOLD, MOVE, CONVOYED_MOVE, SUPPORT
+        and CONVOY. The object is the location id of the unit supported or
+        convoyed, and the target is the location id of the target of the
+        move, or of the supported or convoyed move; unused entries are -1.
+
+    The vectorized computations follow the rules of the order classes
+    exactly, including the webDip convoy rule, convoy routes and the
+    circular movement rule. Positions whose resolution stalls with an
+    unresolved convoy or move via convoy, i.e. convoy paradoxes, and
+    positions which are not fully resolved by the vectorized computations,
+    are resolved one by one by the default engine of the Game class.
+
+    """
+
+    HOLD, MOVE, CONVOYED_MOVE, SUPPORT, CONVOY = range(5)
+
+    def __init__(self, variant):
+        """ Constructor.
+
+        """
+        self.variant = variant
+        self.game = None
+        self.fallbacks = 0
+
+        self.provinces = variant.map.location_provinces
+        self.adjacent = variant.map.adjacency
+        self.reaches = variant.map.reaches
+        self.armies = np.array([location.force.name == 'Army'
+                                for location in variant.map.locations])
+
+    def encode(self, positions):
+        """ Encodes positions, given as lists of diplomacy orders, as arrays
+        of locations, owners and orders. See Notes of the class.
+
+        """
+        powers = {power.name: k for k, power in enumerate(self.variant.powers)}
+        positions = [list(position) for position in positions]
+        size = max([len(position) for position in positions] + [1])
+
+        # The entries are collected in lists, and converted at once.
+        locations, owners, orders = [], [], []
+        for position in positions:
+            padding = size - len(position)
+            locations.append([order.unit.location.id for order in position]
+                             + [-1] * padding)
+            owners.append([powers[order.unit.owner.name] for order in position]
+                          + [0] * padding)
+            orders.append([self.__encode_order__(order) for order in position]
+                          + [(-1, -1, -1)] * padding)
+
+        shape = (len(positions), size)
+        return (np.array(locations, dtype=int).reshape(shape),
+                np.array(owners, dtype=int).reshape(shape),
+                np.array(orders, dtype=int).reshape(shape + (3,)))
+
+    def __encode_order__(self, order):
+        """ Encodes a single order as a triple (kind, object, target).
+
+        """
+        if order.name == 'move':
+            kind = self.CONVOYED_MOVE if order.ordered_convoy else self.MOVE
+            return kind, -1, order.target.id
+
+        if order.name in ('support', 'convoy'):
+            kind = self.SUPPORT if order.name == 'support' else self.CONVOY
+            object_order = order.object_order
+            target = (object_order.target.id if object_order.name == 'move'
+                      else -1)
+            return kind, object_order.unit.location.id, target
+
+        return self.HOLD, -1, -1
+
+    def adjudicate(self, locations, owners, orders):
+        """ Main method to adjudicate a batch of positions.
+
+        Returns
+        -------
+        succeeded : numpy array of booleans of shape (N, U)
+            Whether the order of each unit succeeds; for moves, whether the
+            move takes place, and for supports and convoys, whether the
+            order is valid and not cut or disrupted. Holds always succeed.
+
+        dislodged : numpy array of booleans of shape (N, U)
+            Whether each unit is dislodged.
+
+        """
+        locations = np.asarray(locations)
+        owners = np.asarray(owners)
+        orders = np.asarray(orders)
+
+        batch = _Batch(self, locations, owners, orders)
+        batch.resolve()
+        succeeded, dislodged = batch.results()
+
+        rows = np.flatnonzero(batch.fallback | ~batch.resolved())
+        self.fallbacks = len(rows)
+        for row in rows:
+            succeeded[row], dislodged[row] = self.__adjudicate_one__(
+                locations[row], owners[row], orders[row]
+            )
+
+        return succeeded, dislodged
+
+    def __adjudicate_one__(self, locations, owners, orders):
+        """ Method to adjudicate a single position with the default engine
+        of the Game class.
+
+        """
+        if self.game is None:
+            # Imported here; the game module is only needed as a fallback.
+            from adjudicator.game import Game
+            self.game = Game(self.variant.name)
+            self.game.start()
+
+        game_map = self.game.variant.map
+        slots = np.flatnonzero(locations >= 0)
+        units = {}
+        for col in slots:
+            location = game_map.locations[locations[col]]
+            units[location.province] = Unit(col, self.game.powers[owners[col]],
+                                            location.force, location)
+
+        def unit_at(location_id):
+            return units[game_map.locations[location_id].province]
+
+        game_orders = []
+        for col in slots:
+            unit = unit_at(locations[col])
+            kind, object_, target = orders[col]
+            if kind in (self.MOVE, self.CONVOYED_MOVE):
+                game_orders.append(Move(unit, kind == self.CONVOYED_MOVE,
+                                        game_map.locations[target]))
+            elif kind == self.SUPPORT and target < 0:
+                game_orders.append(Support(unit, Hold(unit_at(object_))))
+            elif kind == self.SUPPORT:
+                game_orders.append(Support(unit, Move(
+                    unit_at(object_), False, game_map.locations[target]
+                )))
+            elif kind == self.CONVOY:
+                game_orders.append(Convoy(unit, Move(
+                    unit_at(object_), True, game_map.locations[target]
+                )))
+            else:
+                game_orders.append(Hold(unit))
+
+        self.game.units = list(units.values())
+        self.game.orders = DiplomacyOrders(Hold)
+        self.game.orders.insert(list(game_orders))
+        self.game.__resolve_diplomacy__()
+
+        succeeded = np.zeros(len(locations), dtype=bool)
+        dislodged = np.zeros(len(locations), dtype=bool)
+        for col, order in zip(slots, game_orders):
+            if order.name == 'move':
+                succeeded[col] = order.moves()
+                attacked = self.game.orders.order_in(order.target.province)
+                if (order.moves() and attacked is not None
+                        and not attacked.moves()):
+                    dislodged[attacked.unit.id] = True
+            elif order.name == 'hold':
+                succeeded[col] = True
+            else:
+                succeeded[col] = order.resolved and order.max_status == VALID
+
+        return succeeded, dislodged
+
+
+class _Batch:
+    """ The partial resolutions of a batch of positions. The orders of all
+    positions are stored in flat arrays, with the orders of a position in
+    consecutive entries, and relations between orders are stored as arrays
+    of pairs of indices. The methods mirror the resolution methods of the
+    order classes. Used by the BatchAdjudicator class only.
+
+    """
+
+    def __init__(self, adjudicator, locations, owners, orders):
+        """ Constructor. Computes everything which does not change during
+        the resolution.
+
+        """
+        kinds = BatchAdjudicator
+        self.shape = locations.shape
+        size, width = self.shape
+        offset = np.repeat(np.arange(size) * width, width)
+
+        locations = locations.ravel()
+        self.owner = owners.ravel()
+        kind, object_, target = orders.reshape(-1, 3).T
+
+        self.unit = locations >= 0
+        loc = np.maximum(locations, 0)
+        self.prov = np.where(self.unit, adjudicator.provinces[loc], -1)
+        kind = np.where(self.unit, kind, -1)
+        self.fallback = np.zeros(size, dtype=bool)
+        self.move = (kind == kinds.MOVE) | (kind == kinds.CONVOYED_MOVE)
+        self.support = kind == kinds.SUPPORT
+        self.convoy = kind == kinds.CONVOY
+        self.target = np.where(target >= 0,
+                               adjudicator.provinces[np.maximum(target, 0)], -1)
+
+        # The index of the unit in each province of each position.
+        provinces = len(adjudicator.reaches[0])
+        occupant = np.full(size * provinces, -1)
+        units = np.flatnonzero(self.unit)
+        occupant[offset[units] // width * provinces + self.prov[units]] = units
+
+        def unit_in(province):
+            index = offset // width * provinces + np.maximum(province, 0)
+            return np.where(province >= 0, occupant[index], -1)
+
+        # Convoys: the convoyed unit, legality, and pairs of a convoy and
+        # the move it aids; see Convoy.__legalize__.
+        carried = np.where(
+            self.convoy & (object_ >= 0),
+            unit_in(np.where(object_ >= 0,
+                             adjudicator.provinces[np.maximum(object_, 0)], -1)),
+            -1
+        )
+        carried_target = self.__gather__(np.where(self.move, target, -1), carried)
+        self.convoy_legal = (self.convoy & (carried >= 0)
+                             & adjudicator.armies[np.maximum(
+                                 self.__gather__(locations, carried), 0)]
+                             & (carried_target == target))
+        aiding = (self.convoy & (carried >= 0)
+                  & (self.__gather__(self.target, carried) == self.target))
+        self.carriers = np.flatnonzero(aiding)
+        self.carried = carried[self.carriers]
+
+        # Moves via convoy, after the webDip convoy rule; see
+        # Move.__adjacent_convoy__.
+        adjacent_convoys = np.bincount(
+            self.carried,
+            adjudicator.reaches[loc[self.carriers], self.prov[self.carried]],
+            len(locations)
+        )
+        self.convoyed = (kind == kinds.CONVOYED_MOVE) & (adjacent_convoys > 0)
+
+        # Tables for the searches of convoy routes; see __routes__.
+        self.location = loc
+        self.adjacent = adjudicator.adjacent
+        self.reaches = adjudicator.reaches
+
+        # Moves: legality over land, and the order in the target province.
+        self.land_legal = (self.move & ~self.convoyed
+                           & adjudicator.adjacent[loc, np.maximum(target, 0)])
+        self.attacked = np.where(self.move, unit_in(self.target), -1)
+
+        # Supports: the supported order, legality, and the aided order.
+        supported = np.where(
+            self.support & (object_ >= 0),
+            unit_in(np.where(object_ >= 0,
+                             adjudicator.provinces[np.maximum(object_, 0)], -1)),
+            -1
+        )
+        moving = self.__gather__(self.move, supported)
+        supported_target = self.__gather__(self.target, supported)
+        reached = adjudicator.reaches[loc, np.maximum(
+            np.where(self.target >= 0, supported_target,
+                     self.__gather__(self.prov, supported)), 0
+        )]
+        hold_support = self.support & (self.target < 0) & (supported >= 0)
+        move_support = self.support & (self.target >= 0) & (supported >= 0)
+        self.support_legal = ((hold_support & ~moving & reached)
+                              | (move_support & moving & reached))
+
+        aids = (hold_support & ~moving) | (move_support & moving
+                                           & (supported_target == self.target))
+        defender = self.__gather__(self.owner, self.attacked)
+        self.aids = np.flatnonzero(aids)
+        self.aided = supported[self.aids]
+        self.excluded = (self.owner[self.aids]
+                         == np.where(self.attacked >= 0, defender,
+                                     -1)[self.aided])
+
+        # Pairs of distinct moves into the same province.
+        move = self.move.reshape(self.shape)
+        key = np.where(move, self.target.reshape(self.shape), -1)
+        columns = np.arange(width)
+        rows, competing, competitor = np.nonzero(
+            move[:, :, None] & (key[:, :, None] == key[:, None, :])
+            & (columns[:, None] != columns[None, :])
+        )
+        self.competing = rows * width + competing
+        self.competitor = rows * width + competitor
+
+        # Pairs of a legal convoy and a move into its province.
+        convoy = self.convoy_legal.reshape(self.shape)
+        fleet = np.where(convoy, self.prov.reshape(self.shape), -1)
+        rows, convoys, moves = np.nonzero(
+            convoy[:, :, None] & (fleet[:, :, None] == key[:, None, :])
+        )
+        self.attacked_convoys = rows * width + convoys
+        self.convoy_attackers = rows * width + moves
+
+        # Moves into the province of a legal support of another power.
+        self.cutters = np.flatnonzero(
+            self.__gather__(self.support_legal, self.attacked)
+            & (defender != self.owner)
+        )
+
+        # Cases of move resolution; see Move.resolve.
+        attacked_move = self.__gather__(self.move, self.attacked)
+        attacked_target = self.__gather__(self.target, self.attacked)
+        attacked_support = self.__gather__(self.support, self.attacked)
+        attacked_convoyed = self.__gather__(self.convoyed, self.attacked)
+        self.empty = self.move & (self.attacked < 0)
+        self.repels = (self.move & attacked_move
+                       & ((attacked_target != self.prov) | self.convoyed
+                          | attacked_convoyed))
+        self.opposed = (self.move & attacked_move & ~self.repels
+                        & self.__gather__(self.land_legal, self.attacked))
+        self.on_self = (self.move & attacked_support
+                        & (attacked_target == self.prov))
+        self.attack = (self.move & (self.attacked >= 0) & ~self.repels
+                       & ~self.opposed & ~self.on_self)
+        self.same_owner = (self.attacked >= 0) & (defender == self.owner)
+
+        # Partial resolutions. The legality of moves via convoy is unknown,
+        # and the legality of other moves known.
+        illegal = self.move & ~self.land_legal & ~self.convoyed
+        self.min_status = np.where(self.move & ~self.land_legal, ILLEGAL,
+                                   np.where(self.move, NO_EFFECT,
+                                   np.where(self.support_legal, CUT,
+                                   np.where(self.convoy_legal, BROKEN,
+                                   np.where(self.support | self.convoy,
+                                            ILLEGAL, VALID)))))
+        self.max_status = np.where(
+            illegal | (self.support & ~self.support_legal)
+            | (self.convoy & ~self.convoy_legal), ILLEGAL, VALID
+        )
+        self.cutting = np.where(illegal, FALSE, UNKNOWN)
+        self.dislodging = self.cutting.copy()
+        self.failed = np.where(illegal, TRUE, UNKNOWN)
+        self.circular = np.zeros(size, dtype=bool)
+        self.__compute_strengths__()
+
+    def __gather__(self, array, index):
+        """ Returns the entries of an array at given indices; the entry is
+        -1 (or False) where the index is -1.
+
+        """
+        values = array[np.maximum(index, 0)]
+        return np.where(index >= 0, values, -1 if array.dtype != bool else False)
+
+    def __positions__(self, array):
+        """ Tests for each position whether an array is True for some order
+        of the position.
+
+        """
+        return array.reshape(self.shape).any(1)
+
+    def __state__(self):
+        """ Returns the partial resolutions as a single array.
+
+        """
+        return np.stack([self.min_status, self.max_status, self.cutting,
+                         self.dislodging, self.failed])
+
+    def __set__(self, attr, mask, value):
+        """ Sets a partially resolved boolean where it is unknown; see
+        Order.set_.
+
+        """
+        array = getattr(self, attr)
+        update = mask & (array == UNKNOWN) & (value != UNKNOWN)
+        np.copyto(array, value, where=update)
+
+    def __set_min__(self, mask, value):
+        """ Raises the minimal status; see Order.min_status.
+
+        """
+        self.min_status = np.where(
+            mask, np.minimum(self.max_status, np.maximum(self.min_status, value)),
+            self.min_status
+        )
+
+    def __set_max__(self, mask, value):
+        """ Lowers the maximal status; see Order.max_status.
+
+        """
+        self.max_status = np.where(mask, np.minimum(self.max_status, value),
+                                   self.max_status)
+        self.min_status = np.where(mask, np.minimum(self.min_status,
+                                                    self.max_status),
+                                   self.min_status)
+
+    def __compute_strengths__(self):
+        """ Computes hold and move strengths from the statuses of supports.
+
+        """
+        possible = self.max_status[self.aids] == VALID
+        known = self.min_status[self.aids] == VALID
+        length = len(self.unit)
+
+        def count(supports):
+            return np.bincount(self.aided, supports, length).astype(int)
+
+        max_all = 1 + count(possible)
+        min_all = 1 + count(known)
+        max_excluded = max_all - count(possible & self.excluded)
+        min_excluded = min_all - count(known & self.excluded)
+        self.decided = count(possible & ~known) == 0
+
+        # Moves not yet found legal have the initial strengths, and illegal
+        # moves have strength 0; see Move.__counted__ and Move.set_illegal.
+        legal = self.move & (self.min_status > ILLEGAL)
+        unknown = self.move & ~legal & (self.max_status > ILLEGAL)
+        self.max_move = np.where(legal, max_all, np.where(unknown, 34, 0))
+        self.min_move = np.where(legal, min_all, np.where(unknown, 1, 0))
+        self.max_move_x = np.where(legal, max_excluded, self.max_move)
+        self.min_move_x = np.where(legal, min_excluded, self.min_move)
+        self.max_hold = np.where(self.move, 1, max_all)
+        self.min_hold = np.where(self.move, 1, min_all)
+
+    def __competition__(self):
+        """ Computes, for each move, the largest maximal strength of the other
+        possible moves into the same province, and the largest minimal
+        strength of the other known moves into the same province.
+
+        """
+        competitor = self.competitor
+        strongest = np.full(len(self.unit), -1)
+        weakest = np.full(len(self.unit), -1)
+        np.maximum.at(strongest, self.competing,
+                      np.where(self.max_status[competitor] == VALID,
+                               self.max_move[competitor], -1))
+        np.maximum.at(weakest, self.competing,
+                      np.where(self.min_status[competitor] == VALID,
+                               self.min_move[competitor], -1))
+
+        return strongest, weakest
+
+    def __bounces__(self, competition, excluded):
+        """ Tests whether moves are bounced by other moves into the same
+        province; see Move.__bounces__.
+
+        """
+        min_move = self.min_move_x if excluded else self.min_move
+        max_move = self.max_move_x if excluded else self.max_move
+        strongest, weakest = competition
+
+        return np.where(min_move > strongest, FALSE,
+                        np.where(max_move <= weakest, TRUE, UNKNOWN))
+
+    def __attacks__(self):
+        """ Tests whether moves dislodge the attacked unit, discounting its
+        holding strength; see Move.__attacks__.
+
+        """
+        max_hold = self.__gather__(self.max_hold, self.attacked)
+        min_hold = self.__gather__(self.min_hold, self.attacked)
+
+        return np.where(self.same_owner, FALSE,
+                        np.where(self.min_move_x > max_hold, TRUE,
+                                 np.where(self.max_move_x <= min_hold,
+                                          FALSE, UNKNOWN)))
+
+    def __head_to_head__(self, excluded):
+        """ Tests whether moves win head to head battles; see
+        Move.__resolve_hth__.
+
+        """
+        min_move = self.min_move_x if excluded else self.min_move
+        max_move = self.max_move_x if excluded else self.max_move
+        opponent_max = self.__gather__(self.max_move, self.attacked)
+        opponent_min = self.__gather__(self.min_move, self.attacked)
+        opponent_status = self.__gather__(self.min_status, self.attacked)
+
+        return np.where(opponent_status == ILLEGAL, UNKNOWN,
+                        np.where(self.same_owner, FALSE,
+                        np.where(min_move > opponent_max, TRUE,
+                        np.where(max_move <= opponent_min, FALSE, UNKNOWN))))
+
+    def __resolve_attack__(self, mask, attacks, bounced):
+        """ Resolves moves into provinces with a defending unit; see
+        Move.__resolve_attack__.
+
+        """
+        self.__set_min__(mask, VALID)
+        self.__set__('cutting', mask, TRUE)
+        self.__set__('failed', mask & (self.dislodging == FALSE), TRUE)
+        known = mask & (bounced != UNKNOWN) & (attacks != UNKNOWN)
+        self.__set__('dislodging', known,
+                     (bounced == FALSE) & (attacks == TRUE))
+        self.__set__('failed', known, (bounced == TRUE) | (attacks == FALSE))
+
+    def __resolve_empty__(self, mask, bounced):
+        """ Resolves moves into empty or emptied provinces; see
+        Move.__resolve_empty__.
+
+        """
+        self.__set_min__(mask, VALID)
+        self.__set__('cutting', mask, FALSE)
+        self.__set__('dislodging', mask, FALSE)
+        self.__set__('failed', mask, bounced)
+
+    def __resolve_moves__(self):
+        """ Resolves the moves; see Move.resolve.
+
+        """
+        competition = self.__competition__()
+        bounced = self.__bounces__(competition, False)
+        bounced_x = self.__bounces__(competition, True)
+        attacks = self.__attacks__()
+        attacked_failed = self.__gather__(self.failed, self.attacked)
+        open_ = (self.move & (self.min_status > ILLEGAL)
+                 & ~self.__resolved_moves__())
+
+        # Moves into empty provinces.
+        self.__resolve_empty__(open_ & self.empty, bounced)
+
+        # Moves into provinces whose unit moves away.
+        repels = open_ & self.repels
+        self.__set_min__(repels, VALID)
+        self.__set__('cutting', repels, FALSE)
+        self.__resolve_empty__(repels & (attacked_failed == FALSE), bounced)
+        self.__resolve_attack__(repels & (attacked_failed == TRUE),
+                                attacks, bounced_x)
+        stuck = repels & (attacked_failed == UNKNOWN) & (bounced == TRUE)
+        self.__set__('dislodging', stuck, FALSE)
+        self.__set__('failed', stuck, TRUE)
+
+        # Head to head battles.
+        opposed = open_ & self.opposed
+        self.__set__('cutting', opposed, FALSE)
+        win = self.__head_to_head__(False)
+        modified = self.__head_to_head__(True)
+        opponent_status = self.__gather__(self.min_status, self.attacked)
+        opposed = opposed & (opponent_status != ILLEGAL)
+        lost = opposed & (attacked_failed == FALSE)
+        self.__set_max__(lost, NO_EFFECT)
+        self.__set__('dislodging', lost, FALSE)
+        self.__set__('failed', lost, TRUE)
+        won = opposed & ((attacked_failed == TRUE)
+                         | ((attacked_failed == UNKNOWN) & (win == TRUE)))
+        self.__set_min__(won, VALID)
+        known = won & (bounced_x != UNKNOWN) & (modified != UNKNOWN)
+        self.__set__('dislodging', known,
+                     (bounced_x == FALSE) & (modified == TRUE))
+        self.__set__('failed', known, (bounced_x == TRUE) | (modified == FALSE))
+        beaten = opposed & (attacked_failed == UNKNOWN) & (win == FALSE)
+        self.__set__('dislodging', beaten, FALSE)
+        self.__set__('failed', beaten, TRUE)
+
+        # Moves onto units supporting an attack on the source province.
+        on_self = open_ & self.on_self
+        self.__set_min__(on_self, VALID)
+        safe = on_self & (self.dislodging == FALSE)
+        self.__set__('cutting', safe, FALSE)
+        self.__set__('failed', safe, TRUE)
+        known = on_self & (bounced_x != UNKNOWN) & (attacks != UNKNOWN)
+        success = (bounced_x == FALSE) & (attacks == TRUE)
+        self.__set__('cutting', known, success)
+        self.__set__('dislodging', known, success)
+        self.__set__('failed', known, ~success)
+
+        # Moves into provinces with a defending unit.
+        self.__resolve_attack__(open_ & self.attack, attacks, bounced_x)
+
+    def __resolve_supports__(self):
+        """ Resolves whether supports are cut; see Support.__resolve_attacked__.
+
+        """
+        length = len(self.unit)
+        supports = self.attacked[self.cutters]
+        cutting = self.cutting[self.cutters]
+        cut = np.bincount(supports, cutting == TRUE, length) > 0
+        open_ = np.bincount(supports, cutting == UNKNOWN, length) > 0
+
+        self.__set_max__(self.support_legal & cut, CUT)
+        self.__set_min__(self.support_legal & ~cut & ~open_, VALID)
+
+    def __resolve_convoys__(self):
+        """ Resolves whether convoying fleets are dislodged; see
+        Convoy.resolve_dislodged.
+
+        """
+        length = len(self.unit)
+        fleets = self.attacked_convoys
+        failed = self.failed[self.convoy_attackers]
+        dislodged = np.bincount(fleets, failed == FALSE, length) > 0
+        open_ = np.bincount(fleets, failed == UNKNOWN, length) > 0
+        known = self.convoy_legal & (self.min_status < VALID) & ~open_
+
+        self.__set_max__(known & dislodged, BROKEN)
+        self.__set_min__(known & ~dislodged, VALID)
+
+    def __routes__(self, moves, status):
+        """ Tests for moves via convoy whether there is a convoy route via
+        the convoys of the move of a given status which is valid; see
+        Move.__convoy__ and Map.has_path. The breadth first searches of all
+        moves are made at once, as products with the adjacency table.
+
+        """
+        index = np.flatnonzero(np.isin(self.carried, moves)
+                               & (status[self.carriers] == VALID))
+        via = np.zeros((len(moves), len(self.adjacent)), dtype=bool)
+        via[np.searchsorted(moves, self.carried[index]),
+            self.location[self.carriers[index]]] = True
+
+        goal = self.reaches[:, self.target[moves]].T
+        reached = new = via & self.reaches[:, self.prov[moves]].T
+        arrived = np.zeros(len(moves), dtype=bool)
+        while new.any():
+            arrived |= (new & goal).any(1)
+            new = (new @ self.adjacent) & via & ~reached
+            reached |= new
+
+        return arrived
+
+    def __resolve_legality__(self):
+        """ Resolves the legality of moves via convoy; see
+        Move.__resolve_legality__.
+
+        """
+        moves = np.flatnonzero(self.convoyed & (self.min_status == ILLEGAL)
+                               & (self.max_status == VALID))
+        if len(moves) == 0:
+            return
+
+        legal = np.zeros(len(self.unit), dtype=bool)
+        legal[moves[self.__routes__(moves, self.min_status)]] = True
+        illegal = np.zeros(len(self.unit), dtype=bool)
+        illegal[moves[~self.__routes__(moves, self.max_status)]] = True
+        illegal &= ~legal
+
+        self.__set_min__(legal, VALID)
+        self.__set_max__(illegal, ILLEGAL)
+        self.__set__('cutting', illegal, FALSE)
+        self.__set__('dislodging', illegal, FALSE)
+        self.__set__('failed', illegal, TRUE)
+
+    def __resolved_moves__(self):
+        """ Returns the mask of resolved moves; see Move.resolved.
+
+        """
+        return (self.move & (self.min_status == self.max_status)
+                & (self.decided | (self.max_status == ILLEGAL))
+                & (self.cutting != UNKNOWN) & (self.dislodging != UNKNOWN)
+                & (self.failed != UNKNOWN))
+
+    def __unresolved__(self):
+        """ Returns the mask of unresolved orders.
+
+        """
+        fallback = np.repeat(self.fallback, self.shape[1])
+        return self.unit & ~fallback & (
+            (self.move & ~self.__resolved_moves__())
+            | (~self.move & ((self.min_status != self.max_status)
+                             | ~self.decided))
+        )
+
+    def resolved(self):
+        """ Returns the mask of fully resolved positions.
+
+        """
+        return ~self.__positions__(self.__unresolved__())
+
+    def resolve(self):
+        """ Main method to resolve the batch. Sweeps over all orders until
+        no further progress is made. Then the circular movement rule is
+        applied to positions with unresolved moves, and we sweep again.
+        Positions which are stuck on an unresolved convoy or move via convoy
+        are left to the Szykman rule of the Game class.
+
+        """
+        while True:
+            state = self.__state__()
+            self.__resolve_supports__()
+            self.__resolve_convoys__()
+            self.__resolve_legality__()
+            self.__compute_strengths__()
+            self.__resolve_moves__()
+            changed = self.__positions__((self.__state__() != state).any(0))
+
+            stuck = ~changed & ~self.resolved() & ~self.circular
+            if not changed.any() and not stuck.any():
+                break
+
+            # Convoy paradoxes; see Game.__paradox__.
+            paradox = stuck & self.__positions__(
+                self.__unresolved__() & (self.convoy | self.convoyed)
+            )
+            self.fallback |= paradox
+            stuck &= ~paradox
+
+            # Circular movement; see Game.__resolve_circular_movement__.
+            rule = (np.repeat(stuck, self.shape[1])
+                    & self.move & ~self.__resolved_moves__())
+            for attr in ('cutting', 'dislodging', 'failed'):
+                self.__set__(attr, rule, FALSE)
+            self.circular |= stuck
+
+    def results(self):
+        """ Returns the arrays of successful orders and dislodged units, of
+        the shape of the batch.
+
+        """
+        moves = (self.move & (self.min_status == VALID)
+                 & (self.failed == FALSE))
+        succeeded = np.where(
+            self.move, moves,
+            np.where(self.support | self.convoy, self.min_status == VALID,
+                     self.unit)
+        )
+
+        dislodged = np.zeros(len(self.unit), dtype=bool)
+        dislodged[self.attacked[moves & (self.attacked >= 0)]] = True
+
+        return (succeeded.reshape(self.shape),
+                (dislodged & ~moves).reshape(self.shape))
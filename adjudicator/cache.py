@@ -0,0 +1,115 @@
+""" The AdjudicationCache class
+
+"""
+
+
+from collections import OrderedDict
+
+from adjudicator.orders import Retreat
+
+
+class AdjudicationCache:
+    """ A bounded cache of resolutions of diplomacy and retreat phases,
+    shared by any number of games of the same variant. When the least
+    recently used resolution does not fit in the cache, it is dropped.
+
+    Parameters
+    ----------
+    maxsize : integer, optional
+        The maximal number of resolutions held by the cache. Default is
+        1024.
+
+    Attributes
+    ----------
+    maxsize : integer
+        See Parameters.
+
+    hits : integer
+        The number of resolutions replayed from the cache.
+
+    misses : integer
+        The number of resolutions not found in the cache.
+
+    entries : OrderedDict
+        A dictionary whose keys are pairs of a position hash and a
+        canonical order set, and whose values are the resolution states of
+        the orders, in canonical order. The least recently used entry
+        comes first.
+
+    Notes
+    -----
+    The canonical order set is the sorted tuple of the descriptions of the
+    unresolved orders, together with the provinces retreats may not go to.
+    A hit restores the resolution state of every order, as given by their
+    `__state__` methods, such that the moves, dislodgements and archived
+    order strings are as if the orders had been resolved.
+
+    """
+
+    def __init__(self, maxsize=1024):
+        """ Constructor.
+
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.entries = OrderedDict()
+
+    def __len__(self):
+        """ Length.
+
+        """
+        return len(self.entries)
+
+    def clear(self):
+        """ Method to empty the cache and reset the counters.
+
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def __describe__(order):
+        """ Returns the description of an unresolved order.
+
+        """
+        if isinstance(order, Retreat):
+            return (str(order), tuple(sorted(province.name for province
+                                             in order.forbidden)))
+        return (str(order), ())
+
+    def resolve(self, game, resolve):
+        """ Method to resolve the orders of a game, either by replaying a
+        cached resolution or by calling `resolve`, whose resolution is then
+        cached.
+
+        Parameters
+        ----------
+        game : Game
+            A game in a diplomacy or retreat phase.
+
+        resolve : callable
+            The method resolving the orders of the game.
+
+        """
+        descriptions = [(self.__describe__(order), order)
+                        for order in game.orders]
+        descriptions.sort(key=lambda pair: pair[0])
+        key = (game.position_hash,
+               tuple(description for description, _ in descriptions))
+
+        states = self.entries.get(key)
+        if states is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            for (_, order), state in zip(descriptions, states):
+                order.__restore__(state)
+            return
+
+        self.misses += 1
+        resolve()
+        self.entries[key] = tuple(order.__state__()
+                                  for _, order in descriptions)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
@@ -0,0 +1,52 @@
+""" Compiles the artifacts of variants; see `Variant.compile`.
+
+Loading a variant never writes its artifact, so the artifacts are written
+by running, from the root of the repository, as the variants are read from
+`variants/` and `maps/` and the artifacts are written to
+`variants/compiled/`:
+
+    python3 -m adjudicator.compile [variant ...]
+
+Without names, every variant in `variants/` is compiled.
+
+"""
+
+
+import os
+import sys
+
+from adjudicator import Variant
+
+
+def compile_variants(names=None):
+    """ Compiles the artifacts of variants.
+
+    Parameters
+    ----------
+    names : list of strings, optional
+        The names of the variants. Default is None; every variant in the
+        `variants` folder.
+
+    Returns
+    -------
+    list of strings
+        The paths of the written artifacts.
+
+    """
+    if not names:
+        names = sorted(os.path.splitext(entry)[0]
+                       for entry in os.listdir('variants')
+                       if entry.endswith('.json'))
+
+    paths = []
+    for name in names:
+        variant = Variant(name)
+        variant.compile()
+        paths.append(variant.__artifact__())
+
+    return paths
+
+
+if __name__ == '__main__':
+    for path in compile_variants(sys.argv[1:]):
+        print(path)
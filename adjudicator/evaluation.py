@@ -0,0 +1,90 @@
+""" Evaluation of order sets of a power over a process pool.
+
+The order sets of a power are compared against fixed orders of the other
+units, as by `Game.evaluate`, with the order sets split among the worker
+processes. The orders are sent to the workers as pairs of a location id
+and the description of an order, such that they are only parsed once.
+
+Each worker loads the variant once, in a game which is restored to the
+position of the game for every chunk of order sets.
+
+"""
+
+
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+
+from adjudicator import Power, _workers
+
+from lib.errors import GameError
+
+
+def _evaluate(task):
+    """ Evaluates a chunk of order sets in the game of the worker process.
+    Returns the list of outcomes.
+
+    """
+    snapshot, power, candidates, fixed = task
+    game = _workers.game
+    game.restore(snapshot)
+
+    return game.__evaluate__(game.instance(power, Power), candidates, fixed)
+
+
+def evaluate(game, power, candidates, opponents=(), workers=None):
+    """ Evaluates order sets of a power against fixed orders of the other
+    units, as `Game.evaluate` does. The game is not changed.
+
+    Parameters
+    ----------
+    game : Game
+        A game at the start of a diplomacy phase.
+
+    power : Power
+        The power giving the order sets.
+
+    candidates : list of lists
+        The order sets; see `Game.evaluate`.
+
+    opponents : list, optional
+        The fixed orders; see `Game.evaluate`. Default is an empty tuple.
+
+    workers : integer, optional
+        The number of worker processes. If 0, the order sets are evaluated
+        in the current process. Default is None; the number of processors.
+
+    Returns
+    -------
+    list of dictionaries
+        The outcomes of the order sets, in order; see `Game.evaluate`.
+
+    """
+    if workers == 0:
+        return game.evaluate(power, candidates, opponents)
+
+    if game.season.phase != 'Diplomacy':
+        raise GameError('Order sets are only evaluated in diplomacy phases.')
+
+    # The workers start from the snapshot, in which every unit holds; the
+    # current orders are sent with the fixed orders.
+    fixed = dict(game.__order_pairs__([(order.unit, game.__spec__(order))
+                                       for order in game.orders]))
+    fixed.update(game.__order_pairs__(opponents))
+    fixed = list(fixed.items())
+    candidates = [game.__order_pairs__(candidate, power)
+                  for candidate in candidates]
+
+    snapshot = game.snapshot()
+    workers = os.cpu_count() if workers is None else workers
+    size = max(1, (len(candidates) + workers - 1) // workers)
+    tasks = [(snapshot, power.name, candidates[k:k + size], fixed)
+             for k in range(0, len(candidates), size)]
+    initargs = (game.variant.name, game.engine)
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_workers.initialize,
+                             initargs=initargs) as executor:
+        chunks = list(executor.map(_evaluate, tasks))
+
+    return [outcome for chunk in chunks for outcome in chunk]
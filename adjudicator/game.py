@@ -2,7 +2,11 @@
 
 """
 
+from collections import OrderedDict, deque
+from copy import copy
+
 import geopandas as geo
+import numpy as np
 from fiona.errors import DriverError
 
 import graphics.graphics as graphics
@@ -11,12 +15,13 @@ from adjudicator import (
     Force, Geography, Location, Power, Province, Season, Unit, Variant
 )
 from adjudicator.orders import (
-    Build, Disband, Hold, Move, Retreat, Support
+    Build, Convoy, Disband, Hold, Move, Retreat, Support
 )
 from adjudicator.orders.lib import (
     AdjustmentOrders, DiplomacyOrders, RetreatOrders
 )
-from adjudicator.lib import flatten, require
+from adjudicator.lib import components, flatten, require
+from adjudicator.kruijswijk import Kruijswijk
 
 from lib.lists import first
 from lib.errors import (OrderInputError, GameError, AdjudicationError)
@@ -43,7 +48,19 @@ class Game:
                    'A': 'army', 'F': 'fleet', 'St': 'Saint', 
                    'destroy': 'disband'}
 
-    def __init__(self, variant_name, page=None, identifier=None):
+    # Available engines for the adjudication of the diplomacy phase.
+    engines = ('default', 'kruijswijk')
+
+    # Number of units whose legal orders are cached; see `legal_orders`.
+    legal_orders_size = 4096
+
+    # Diplomacy orders parsed by any game of the process, and their number;
+    # see `order_many`.
+    parsed_orders = OrderedDict()
+    parsed_orders_size = 4096
+
+    def __init__(self, variant_name, page=None, identifier=None,
+                 engine='default', cache=None):
         """ Constructor.
 
         Parameters
@@ -53,18 +70,35 @@ class Game:
             The name of host of the game.
         identifier: string, optional
             The unique identifier of the game.
+        engine: string, optional
+            The engine used to adjudicate diplomacy phases; one of
+            `Game.engines`. Default is 'default'.
+        cache: AdjudicationCache, optional
+            A cache of resolutions of diplomacy and retreat phases, which
+            may be shared by several games of the same variant; see
+            :cls:`adjudicator.cache.AdjudicationCache`. Default is None,
+            in which case every phase is resolved.
 
         """
+        if engine not in self.engines:
+            raise GameError(f'Engine "{engine}" not recognized.')
         self.page = page
         self.identifier = identifier
-        self.variant = Variant(variant_name)
-        self.variant.load()
+        self.engine = engine
+        self.cache = cache
+        self.variant = Variant.get(variant_name)
         self.season = Season(self.variant.starting_year)
         # Immutables
         self.powers = self.variant.powers
         self.forces = self.variant.map.forces
         self.provinces = self.variant.map.provinces
         # Mutables; will be loaded once the game begins
+        self._shared = [1, self]
+        self._zobrist = 0
+        self._supply_centers = {}
+        self._located = {}
+        self._power_units = {}
+        self._unit_id = 0
         self.units = []
         self.home_centers = {}
         self.supply_centers = {}
@@ -72,10 +106,180 @@ class Game:
         self.winner = None
         self.position_archive = PositionArchive()
         self.order_archive = OrderArchive()
+        self._legal_orders = OrderedDict()
         # Graphic objects; will be loaded if needed
         self.graphics = None
         self.shift = None
 
+    @property
+    def units(self):
+        """ units getter.
+
+        """
+        return self._units
+
+    @units.setter
+    def units(self, value):
+        """ units setter.
+
+        """
+        self.__own__()
+        self._units = value
+        self.__index_units__()
+        self.__rehash__()
+
+    @property
+    def supply_centers(self):
+        """ supply_centers getter.
+
+        """
+        return self._supply_centers
+
+    @supply_centers.setter
+    def supply_centers(self, value):
+        """ supply_centers setter.
+
+        """
+        self._supply_centers = value
+        self.__rehash__()
+
+    @property
+    def orders(self):
+        """ orders getter.
+
+        """
+        return self._orders
+
+    @orders.setter
+    def orders(self, value):
+        """ orders setter.
+
+        """
+        self.__own__()
+        self._orders = value
+
+    def __own__(self):
+        """ Method to copy the units and orders if they are shared with a
+        clone of the game; see `clone`. Called by the methods changing the
+        units or orders, before any change. The attribute `_shared` is a
+        list holding the number of games sharing the units and orders, and
+        the game the units report their moves to.
+
+        Returns a dictionary whose keys are the shared units, and whose
+        values are their copies; empty if nothing was copied.
+
+        """
+        shared = self._shared
+        if shared[0] == 1:
+            if shared[1] is not self:  # The other games made their copies.
+                shared[1] = self
+                for unit in self._units:
+                    unit.game = self
+            return {}
+
+        shared[0] -= 1
+        self._shared = [1, self]
+
+        units = {unit: Unit(unit.id, unit.owner, unit.force, unit.location,
+                            self)
+                 for unit in self._units}
+        self._units = list(units.values())
+        self._orders = self._orders.clone(units)
+        self.__index_units__()
+
+        return units
+
+    def clone(self):
+        """ Returns a copy of the game, e.g. for tree searches.
+
+        The variant, map, graphics and the cache of legal orders are shared
+        with the copy, while the season, supply centers, home centers and
+        archives are copied. The units and orders, and the indexes of the
+        units, are copied on write: they are shared until either game
+        changes them, e.g. by `order`, `set_order`, `revise`, `add_unit`,
+        `delete_unit` or `adjudicate`, at which point that game makes its
+        own copy. Reads, such as `len(game.units)` or `unit_in`, do not
+        copy. The first change costs a full copy of the units and of the
+        orders, with their partial resolutions, and new indexes of the
+        units; about 160 microseconds for a started Classic game, against
+        about 17 for the clone itself.
+
+        The lists `units` and `orders` of a game, and the units and orders
+        in them, must only be changed directly, e.g. by
+        `game.orders.insert(order)`, in games which share them with no
+        clone.
+
+        """
+        game = copy(self)
+        game.season = copy(self.season)
+        game._supply_centers = {power: set(centers) for power, centers
+                                in self.supply_centers.items()}
+        game.home_centers = {power: set(centers) for power, centers
+                             in self.home_centers.items()}
+        game.position_archive = self.position_archive.copy()
+        game.order_archive = self.order_archive.copy()
+        self._shared[0] += 1
+
+        return game
+
+    @property
+    def position_hash(self):
+        """ The 64-bit Zobrist hash of the current position, i.e. of the
+        units, the supply center ownerships and the season phase. The keys
+        are taken from the `zobrist` table of the variant.
+
+        """
+        return self._zobrist ^ self.variant.zobrist.season(self.season)
+
+    def __rehash__(self):
+        """ Computes the hash of the units and supply center ownerships
+        from scratch.
+
+        """
+        zobrist = self.variant.zobrist
+        self._zobrist = 0
+        for unit in self._units:
+            unit.game = self
+            self._zobrist ^= zobrist.unit(unit)
+        for power, centers in self._supply_centers.items():
+            self.__toggle_centers__(power, centers)
+
+    def __index_units__(self):
+        """ Computes the indexes of the units by province and by power, and
+        the last unit id, from scratch.
+
+        """
+        self._located = {}
+        self._power_units = {power: [] for power in self.powers}
+        for unit in self._units:
+            self._located.setdefault(unit.province, []).append(unit)
+            self._power_units.setdefault(unit.owner, []).append(unit)
+        self._unit_id = max((unit.id for unit in self._units), default=0)
+
+    def __toggle_unit__(self, unit):
+        """ Toggles the key of a unit in the hash of the position, and the
+        unit in the index of the units by province. Called when a unit
+        appears, disappears, and before and after it moves.
+
+        """
+        self._zobrist ^= self.variant.zobrist.unit(unit)
+
+        located = self._located.setdefault(unit.province, [])
+        if unit in located:
+            located.remove(unit)
+            if len(located) == 0:
+                del self._located[unit.province]
+        else:
+            located.append(unit)
+
+    def __toggle_centers__(self, power, provinces):
+        """ Toggles the keys of a power owning supply centers in the hash
+        of the position.
+
+        """
+        for province in provinces:
+            self._zobrist ^= self.variant.zobrist.center(power, province)
+
     def __str__(self):
         """ Print method.
 
@@ -118,6 +322,7 @@ class Game:
             self.__sort_units__()
             return '\n'.join([f'{unit}' for unit in self.units])
         elif string == 'orders':
+            self.__own__()
             self.orders.sort()
             return '\n'.join([f'{order}' for order in self.orders])
         elif string == 'order archive':
@@ -140,6 +345,53 @@ class Game:
         """
         return self.position_archive.last()
 
+    def snapshot(self):
+        """ Returns the current position as a dictionary of names and
+        location ids, which may be pickled and restored by `restore` in a
+        game of the same variant, e.g. in another process.
+
+        The position should be at the start of a diplomacy or build phase;
+        the orders are not included.
+
+        """
+        if self.season.phase == 'Retreats':
+            raise GameError('Cannot take a snapshot in a retreat phase.')
+        return {
+            'season': (self.season.name, self.season.phase,
+                       self.season.year, self.season.count),
+            'units': [(unit.force.name, unit.owner.name, unit.location.id)
+                      for unit in self.units],
+            'centers': {power.name: [province.name for province in centers]
+                        for power, centers in self.supply_centers.items()},
+            'home': {power.name: [province.name for province in centers]
+                     for power, centers in self.home_centers.items()},
+        }
+
+    def restore(self, snapshot):
+        """ Resets the game and sets up the position of a snapshot taken by
+        `snapshot`. The archives are reset, and the restored position is
+        archived.
+
+        """
+        self.reset()
+        (self.season.name, self.season.phase,
+         self.season.year, self.season.count) = snapshot['season']
+        provinces = {province.name: province for province in self.provinces}
+        self.home_centers = {
+            self.instance(name, Power): {provinces[entry] for entry in names}
+            for name, names in snapshot['home'].items()
+        }
+        self.supply_centers = {
+            self.instance(name, Power): {provinces[entry] for entry in names}
+            for name, names in snapshot['centers'].items()
+        }
+        locations = self.variant.map.locations
+        for force, power, location in snapshot['units']:
+            self.add_unit(force, power, locations[location], overrule=True)
+        self.__setup__()
+        self.conclude(mute=True, assume=False)
+        self.__archive_position__()
+
     def __archive_position__(self):
         """ Archives the current position.
 
@@ -176,6 +428,7 @@ class Game:
         for power in self.powers:
             self.supply_centers[power] = set(self.occupied_provinces(power))
             self.home_centers[power] = self.supply_centers[power].copy()
+            self.__toggle_centers__(power, self.supply_centers[power])
         self.__archive_position__()
 
     def reset(self):
@@ -191,17 +444,21 @@ class Game:
         self.home_centers = {}
         self.winner = None
 
-    def rollback(self):
-        """ Rolls back the game one turn. 
+    def rollback(self, k=1):
+        """ Rolls back the game k phases. The position is restored by
+        undoing the changes of the last k positions archived; see
+        `PositionArchive`.
         
         """
-        self.season.rollback()  # Includes consistency check
-        orders = self.order_archive.last()  # Remember the last phase's orders
-        self.order_archive.rollback()
-        self.position_archive.rollback()
+        self.__own__()
+        self.season.rollback(k)  # Includes consistency check
+        orders = self.order_archive.loc(-k)  # Remember that phase's orders
+        for _ in range(k):
+            self.order_archive.rollback()
+        self.position_archive.rollback(k)
         self.position_archive.setup(self)  # Setup according to last archive
         self.conclude(mute=True, assume=False)  # Check for a winner
-        self.order(orders)  # Enter the last phase's orders
+        self.order_many(orders)  # Enter the phase's orders
 
     def __load_graphics__(self):
         """ Loads the GeoDataFrame from the graphics folder.
@@ -227,7 +484,9 @@ class Game:
         """ Sorts the list of units according to owner and unit id.
 
         """
+        self.__own__()
         self.units.sort(key=lambda unit: unit.sort_string())
+        self.__index_units__()
 
     def __province__(self, province):
         """ Tries to identify a province if input is a string.
@@ -254,8 +513,14 @@ class Game:
         """
         assert any_ or self.season.phase != 'Retreats'
         province = self.__province__(province)
-        generator = (unit for unit in self.units if unit.province is province)
-        return next(generator, None)
+        units = self._located.get(province)
+        if units is None:
+            return None
+        if len(units) == 1:
+            return units[0]
+        # A dislodged unit shares its province in retreat phases; return
+        # the unit which comes first, as listed in `units`.
+        return min(units, key=self._units.index)
 
     @builds
     @require
@@ -272,7 +537,7 @@ class Game:
         """ Returns a list of the units belonging to a power.
 
         """
-        return [unit for unit in self.units if unit.owner is power]
+        return list(self._power_units.get(power, ()))
 
     def occupied_provinces(self, power):
         """ Returns a list of the provinces occupied by the units of a power.
@@ -280,6 +545,138 @@ class Game:
         """
         return [unit.province for unit in self.units_of(power)]
 
+    def legal_orders(self, unit):
+        """ Generator of the legal diplomacy orders of a unit, in the
+        current position; that is, holds, moves to adjacent locations,
+        moves via convoy, supports and convoys. The orders are yielded one
+        at a time, such that callers may stop early.
+
+        Moves are given to specific locations, e.g. coasts. Supports of
+        moves are given once for each target province. Moves via convoy,
+        and convoys, are given to the provinces reachable through chains of
+        fleets in locations where convoys may be ordered; a convoy requires
+        the fleet to be part of such a chain.
+
+        The orders of a unit are cached by position hash and location once
+        they have all been yielded. The cache is shared with clones.
+
+        """
+        key = (self.position_hash, unit.location.id)
+        specs = self._legal_orders.get(key)
+        located = {other.location.id: other for other in self.units}
+
+        if specs is not None:
+            self._legal_orders.move_to_end(key)
+            for spec in specs:
+                yield self.__legal_order__(unit, spec, located)
+            return
+
+        specs = []
+        for spec in self.__legal_specs__(unit):
+            specs.append(spec)
+            yield self.__legal_order__(unit, spec, located)
+
+        self._legal_orders[key] = tuple(specs)
+        if len(self._legal_orders) > self.legal_orders_size:
+            self._legal_orders.popitem(last=False)
+
+    def legal_orders_of(self, power):
+        """ Generator of the legal diplomacy orders of the units of a power;
+        see `legal_orders`.
+
+        """
+        for unit in self.units_of(power):
+            yield from self.legal_orders(unit)
+
+    def __legal_order__(self, unit, spec, located):
+        """ Returns the order of a unit described by a tuple of an order
+        name, the location id of the object unit, the location id of the
+        target and whether the move is via convoy.
+
+        """
+        name, object_id, target_id, convoy = spec
+        locations = self.variant.map.locations
+
+        if name == 'hold':
+            return Hold(unit)
+        elif name == 'move':
+            return Move(unit, convoy, locations[target_id])
+
+        other = located[object_id]
+        if target_id is None:
+            object_order = Hold(other)
+        else:
+            object_order = Move(other, convoy, locations[target_id])
+
+        return (Support if name == 'support' else Convoy)(unit, object_order)
+
+    def __legal_specs__(self, unit):
+        """ Generator of the descriptions of the legal orders of a unit;
+        see `legal_orders` and `__legal_order__`.
+
+        """
+        game_map = self.variant.map
+        locations = game_map.locations
+        orders = unit.location.geography.orders
+        fleets = [other.location for other in self.units
+                  if 'Convoy' in other.location.geography.orders]
+        reaches = {}
+
+        def convoy_targets(army, fleet=None):
+            """ Returns the ids of the locations an army reaches via
+            convoy, optionally only if a given fleet can take part.
+
+            """
+            if army not in reaches:
+                reached = game_map.convoy_reach(army.province, fleets)
+                # Convoys are ordered at sea, in provinces of one location,
+                # whose rows of the province adjacency tables are exact.
+                provinces = np.zeros(len(game_map.provinces), dtype=bool)
+                for loc in reached:
+                    provinces |= game_map.province_adjacency[loc.force][
+                        game_map.location_provinces[loc.id]]
+                reaches[army] = (reached, [
+                    loc.id for loc in locations if loc.force is army.force
+                    and provinces[game_map.location_provinces[loc.id]]
+                    and loc.province is not army.province
+                ])
+            reached, targets = reaches[army]
+            return targets if fleet is None or fleet in reached else []
+
+        if 'Hold' in orders:
+            yield ('hold', None, None, False)
+
+        if 'Move' in orders:
+            for k in unit.location.connections:
+                yield ('move', None, k, False)
+            if 'Convoy' in unit.force.may_receive:
+                for k in convoy_targets(unit):
+                    yield ('move', None, k, True)
+
+        if 'Support' in orders:
+            reached = unit.location.reached
+            for other in self.units:
+                if other is unit or 'Support' not in other.force.may_receive:
+                    continue
+                if other.province in reached:
+                    yield ('support', other.location.id, None, False)
+                targets = list(other.location.connections)
+                if 'Convoy' in other.force.may_receive:
+                    targets += convoy_targets(other)
+                supported = set()
+                for k in targets:
+                    province = locations[k].province
+                    if province in reached and province not in supported:
+                        supported.add(province)
+                        yield ('support', other.location.id, k, False)
+
+        if 'Convoy' in orders:
+            for other in self.units:
+                if other is unit or 'Convoy' not in other.force.may_receive:
+                    continue
+                for k in convoy_targets(other, unit.location):
+                    yield ('convoy', other.location.id, k, True)
+
     @builds
     def build_orders_of(self, power):
         """ Returns a list of the adjustment orders given to the units of a
@@ -335,13 +732,12 @@ class Game:
         return len([order for order in self.orders if not order.resolved])
 
     def __next_unit_id__(self):
-        """ Retrieves the successor of the largest unit id.
+        """ Retrieves a new unit id; the successor of the largest unit id
+        given since the units were last set.
 
         """
-        try:
-            return max([unit.id for unit in self.units]) + 1
-        except ValueError:
-            return 1
+        self._unit_id += 1
+        return self._unit_id
 
     def add_unit(self, force, power, location, overrule=False):
         """ Adds a unit to the game in a given location. If we are in the
@@ -350,6 +746,7 @@ class Game:
         """
         message = 'You cannot manually add unit during the retreat phase.'
         assert overrule or self.season.phase != 'Retreats', message
+        self.__own__()
         # Retrieve classes if input was strings.
         if not isinstance(force, Force):
             force = self.instance(force, Force, require=True)
@@ -360,8 +757,10 @@ class Game:
         # Check that the given location is available.
         if not self.unit_in(location.province, any_=True) is None:
             raise GameError('Named province already contains a unit.')
-        unit = Unit(self.__next_unit_id__(), power, force, location)
+        unit = Unit(self.__next_unit_id__(), power, force, location, self)
         self.units.append(unit)
+        self._power_units.setdefault(power, []).append(unit)
+        self.__toggle_unit__(unit)
         if self.season.phase == 'Diplomacy':
             self.orders.insert(Hold(unit))
 
@@ -377,10 +776,14 @@ class Game:
         """ Deletes a unit from the game.
 
         """
+        unit = self.__own__().get(unit, unit)
         if self.season.phase != 'Builds':
             self.orders.remove_unit(unit)
 
         self.units.remove(unit)
+        self._power_units[unit.owner].remove(unit)
+        self.__toggle_unit__(unit)
+        unit.game = None
 
     def __adjust_supply_centers__(self):
         """ Adjusts the supply center count.
@@ -392,15 +795,26 @@ class Game:
             occupied = unit_locations.intersection(supply_centers)
             # It is important that the order is: first remove, then add.
             for second_power in self.powers:
-                self.supply_centers[second_power].difference_update(occupied)
+                lost = self.supply_centers[second_power].intersection(occupied)
+                self.__toggle_centers__(second_power, lost)
+                self.supply_centers[second_power].difference_update(lost)
+            self.__toggle_centers__(power, occupied)
             self.supply_centers[power].update(occupied)
 
     def clear(self):
         """ Method to clear the board from all units.
         
         """
-        while len(self.units) > 0:
-            self.delete_unit(self.units[0])
+        self.__own__()
+        units = self.units
+        if self.season.phase == 'Diplomacy':
+            self.orders = DiplomacyOrders(Hold)
+        elif self.season.phase != 'Builds':
+            for unit in units:
+                self.orders.remove_unit(unit)
+        for unit in units:
+            unit.game = None
+        self.units = []
 
     # Should be wrapped in a list_input wrapper
     def order(self, string_or_list):
@@ -409,6 +823,7 @@ class Game:
         (Retreat and Build phases) the relevant orders. 
 
         """
+        self.__own__()
         if isinstance(string_or_list, list):
             for string in string_or_list:
                 self.order(string)
@@ -424,6 +839,515 @@ class Game:
             else:
                 raise OrderInputError('No orders expected for the current phase.')
 
+    def order_many(self, strings):
+        """ Method to input a list of orders, as `order` does.
+
+        In diplomacy phases, the orders are parsed by `__parse_order__`, and
+        replace the orders of their units in one pass. If an order cannot
+        be parsed, the orders before it are entered before the error is
+        raised.
+
+        """
+        if self.season.phase != 'Diplomacy':
+            self.order(list(strings))
+            return
+
+        self.__own__()
+        located = {unit.location.id: unit for unit in self.units}
+        orders = []
+        try:
+            for string in strings:
+                orders.append(self.__parse_order__(string, located))
+
+        finally:
+            self.orders.replace(orders)
+
+    def __parse_order__(self, string, located):
+        """ Returns the diplomacy order given by a string.
+
+        Parsed orders are cached in `parsed_orders`, keyed by the variant
+        and the deabbreviated string, as the location, power and force of
+        the unit given the order and of the object unit, and the
+        description of the order used by `__legal_order__`. A cached order
+        is used only if units of the same powers and forces stand in these
+        locations; in any other position the string may be parsed
+        differently.
+
+        Parameters
+        ----------
+        string : string
+            The order.
+
+        located : dictionary
+            A dictionary whose keys are location ids, and whose values are
+            the units in the locations.
+
+        """
+        parser = Parser(string, self)
+        key = (self.variant.name, parser.string)
+        entry = self.parsed_orders.get(key)
+
+        if entry is not None:
+            units, spec = entry
+            if all(self.__unit_key__(located.get(location_id)) == unit
+                   for location_id, unit in units):
+                self.parsed_orders.move_to_end(key)
+                return self.__legal_order__(located[units[0][0]], spec,
+                                            located)
+
+        parser.old()
+        order = parser.new()
+
+        units = [order.unit]
+        if order.name in ('support', 'convoy'):
+            units.append(order.object_order.unit)
+        self.parsed_orders[key] = (
+            tuple((unit.location.id, self.__unit_key__(unit))
+                  for unit in units),
+            self.__spec__(order)
+        )
+        self.parsed_orders.move_to_end(key)
+        if len(self.parsed_orders) > self.parsed_orders_size:
+            self.parsed_orders.popitem(last=False)
+
+        return order
+
+    @staticmethod
+    def __unit_key__(unit):
+        """ Returns the names of the power and force of a unit, or None if
+        there is no unit; see `__parse_order__`.
+
+        """
+        return None if unit is None else (unit.owner.name, unit.force.name)
+
+    @staticmethod
+    def __spec__(order):
+        """ Returns the description of a diplomacy order used by
+        `__legal_order__` and `set_order`.
+
+        """
+        if order.name in ('hold', 'move'):
+            return (order.name, None,
+                    None if order.name == 'hold' else order.target.id,
+                    order.name == 'move' and order.ordered_convoy)
+
+        object_order = order.object_order
+        return (order.name, object_order.unit.location.id,
+                object_order.target.id if object_order.name == 'move'
+                else None, order.name == 'convoy')
+
+    def __location__(self, location_id):
+        """ Returns the location with a given id. Throws an error if there
+        is no such location.
+
+        """
+        locations = self.variant.map.locations
+        if (isinstance(location_id, bool) or not isinstance(location_id, int)
+                or not 0 <= location_id < len(locations)):
+            raise OrderInputError(f'Unknown location id {location_id!r}.')
+        return locations[location_id]
+
+    def __unit_at__(self, unit, message='Could not identify the unit.'):
+        """ Returns the unit of the game in the location of a unit, or in
+        the location with a given id. Throws an error if there is none.
+
+        """
+        if isinstance(unit, Unit):
+            unit = unit.location.id
+        location = self.__location__(unit)
+        for other in self._located.get(location.province, ()):
+            if other.location is location:
+                return other
+        raise OrderInputError(message)
+
+    def set_order(self, unit, spec):
+        """ Method to input a diplomacy order without parsing a string. The
+        order replaces the order of the unit.
+
+        The order is checked as the parser checks the orders it reads: the
+        unit, and the unit supported or convoyed, must be on the board,
+        only units which may be convoyed may move via convoy, only units in
+        locations where convoys may be ordered may convoy, and the target
+        must be a location of the force of the moving unit. Other illegal
+        orders, e.g. moves to locations which are not adjacent, are entered
+        and found illegal during adjudication.
+
+        Parameters
+        ----------
+        unit : Unit or integer
+            The unit given the order, or the id of its location.
+
+        spec : tuple
+            The description of the order, as given by `__legal_specs__`; a
+            tuple of an order name ('hold', 'move', 'support' or 'convoy'),
+            the location id of the unit supported or convoyed, the location
+            id of the target of the move ordered, supported or convoyed, and
+            whether the move is via convoy. The last flag is only read for
+            moves; supported moves are not via convoy, and convoyed moves
+            are.
+
+        Returns
+        -------
+        Order
+            The new order.
+
+        """
+        if self.season.phase != 'Diplomacy':
+            raise OrderInputError('Orders are only set in diplomacy phases.')
+
+        self.__own__()
+        name, object_id, target_id, convoy = spec
+        unit = self.__unit_at__(unit)
+        located = {}
+
+        if name == 'move':
+            mover, object_id = unit, None
+            if convoy and 'Convoy' not in unit.force.may_receive:
+                raise OrderInputError('Unit may not be convoyed.')
+        elif name in ('support', 'convoy'):
+            mover = self.__unit_at__(object_id,
+                                     'Could not identify the object unit.')
+            object_id = mover.location.id
+            located[object_id] = mover
+            convoy = name == 'convoy'
+            if convoy and 'Convoy' not in unit.location.geography.orders:
+                raise OrderInputError('Unit may not convoy.')
+            if convoy and 'Convoy' not in mover.force.may_receive:
+                raise OrderInputError('Object unit may not be convoyed.')
+        elif name == 'hold':
+            mover, object_id = None, None
+        else:
+            raise OrderInputError(f'Unknown order {name!r}.')
+
+        if mover is None or (name == 'support' and target_id is None):
+            target_id = None
+            convoy = False
+        elif target_id is None:
+            raise OrderInputError('The target of the move is missing.')
+        elif self.__location__(target_id).force is not mover.force:
+            raise OrderInputError('The target is not a location of the '
+                                  'force of the moving unit.')
+
+        order = self.__legal_order__(
+            unit, (name, object_id, target_id, convoy), located
+        )
+        self.orders.replace([order])
+
+        return order
+
+    def set_retreat(self, unit, target):
+        """ Method to input a retreat order without parsing a string.
+
+        Parameters
+        ----------
+        unit : Unit or integer
+            The dislodged unit, or the id of its location.
+
+        target : integer or None
+            The id of the location the unit retreats to, which must be a
+            location of its force, or None if the unit disbands.
+
+        """
+        if self.season.phase != 'Retreats':
+            raise OrderInputError('Retreats are only set in retreat phases.')
+
+        self.__own__()
+        if isinstance(unit, Unit):
+            unit = unit.location.id
+        location = self.__location__(unit)
+        retreat = next((order for order in self.orders
+                        if order.unit.location is location), None)
+        if retreat is None:
+            raise OrderInputError('Could not identify the dislodged unit.')
+
+        if target is None:
+            retreat.order = Disband(retreat.id, retreat.unit.owner,
+                                    retreat.unit)
+            return
+
+        target = self.__location__(target)
+        if target.force is not retreat.unit.force:
+            raise OrderInputError('The target is not a location of the '
+                                  'force of the retreating unit.')
+        retreat.order = Move(retreat.unit, False, target)
+
+    def set_adjustment(self, power, number, location):
+        """ Method to input a build or disband order without parsing a
+        string.
+
+        Parameters
+        ----------
+        power : Power
+            The power of the order.
+
+        number : integer
+            The id of the order, as listed by `build_orders_of`.
+
+        location : integer or None
+            For a build, the id of the location of the new unit, whose force
+            is the force of the location. For a disband, the id of the
+            location of the unit of the power to disband. None postpones the
+            order.
+
+        """
+        if self.season.phase != 'Builds':
+            raise OrderInputError('Adjustments are only set in build phases.')
+
+        self.__own__()
+        order = self.adjustment_order(number, power)
+        if order is None:
+            raise OrderInputError('Could not identify the adjustment order.')
+
+        if location is None:
+            order.postpone()
+        elif order.name == 'build':
+            order.location = self.__location__(location)
+            order.force = order.location.force
+        else:
+            unit = self.__unit_at__(location)
+            if unit.owner is not order.owner:
+                raise OrderInputError('The unit does not belong to the '
+                                      'power of the order.')
+            order.unit = unit
+
+    def revise(self, unit, spec):
+        """ Method to change the order of a unit after the orders of a
+        diplomacy phase were resolved, and resolve the orders again, e.g.
+        to compare orders in a search; see `revise_many`.
+
+        Parameters
+        ----------
+        unit : Unit or integer
+            The unit given the order, or the id of its location.
+
+        spec : tuple
+            The description of the order; see `set_order`.
+
+        Returns
+        -------
+        list of Orders
+            The orders which were resolved again.
+
+        """
+        return self.revise_many([(unit, spec)])
+
+    def revise_many(self, orders):
+        """ Method to change the orders of several units after the orders
+        of a diplomacy phase were resolved, and resolve the orders again
+        once, e.g. to compare order sets in a search. Only the orders whose
+        resolution may depend on the changed orders are resolved again;
+        that is, the orders depending on the orders replaced or on the new
+        orders, the supports and convoys of the units, the moves convoyed
+        by the orders replaced or by the new orders, and the orders
+        depending on these, transitively. If the orders were not resolved,
+        then all orders are resolved.
+
+        The phase is not adjudicated, and the order archive is not changed.
+        Revising the orders of the units again restores the earlier
+        resolution.
+
+        Parameters
+        ----------
+        orders : list of tuples
+            The orders, as pairs of a unit, or the id of its location, and
+            the description of the order; see `set_order`.
+
+        Returns
+        -------
+        list of Orders
+            The orders which were resolved again.
+
+        """
+        self.__own__()
+        if self.__unresolved_count__() != 0:
+            for unit, spec in orders:
+                self.set_order(unit, spec)
+            self.__resolve_diplomacy__()
+            return list(self.orders)
+
+        previous = self.orders.dependents()
+        units = []
+        changed = []
+        cone = {}
+        for unit, spec in orders:
+            unit = self.__unit_at__(unit)
+            replaced = self.orders.order_of(unit)
+            cone.update(dict.fromkeys(previous.get(replaced, [])))
+            order = self.set_order(unit, spec)
+            units.append(unit)
+            changed += [replaced, order]
+
+        orders = self.orders
+        orders.link()
+        dependents = orders.dependents()
+
+        # The legality of supports and convoys depends on the order of the
+        # unit they support or convoy, and whether a move is via convoy
+        # depends on its convoys; see `Move.__adjacent_convoy__`.
+        cone.update(dict.fromkeys(
+            entry for entry in orders
+            if entry in changed
+            or (entry.name in ('support', 'convoy')
+                and entry.object_order.unit in units)
+        ))
+        for entry in changed:
+            if entry.name == 'convoy':
+                move = orders.order_of(entry.object_order.unit)
+                if isinstance(move, Move):
+                    cone[move] = None
+
+        # Orders replaced later in the list are no longer given.
+        cone = dict.fromkeys(entry for entry in orders if entry in cone)
+        queue = deque(cone)
+        while queue:
+            for dependent in dependents[queue.popleft()]:
+                if dependent not in cone:
+                    cone[dependent] = None
+                    queue.append(dependent)
+        cone = [entry for entry in orders if entry in cone]
+
+        # Supports push their changes to the orders they aid; the strengths
+        # are recounted once every order of the cone is reset. Resetting a
+        # move restores the convoy it was ordered with.
+        for entry in cone:
+            entry.reset()
+        for entry in cone:
+            if isinstance(entry, Move):
+                entry.__adjacent_convoy__(orders)
+            else:
+                entry.__compute_hold_strengths__(orders)
+
+        if self.engine == 'default':
+            self.__resolve_default__(cone, dependents)
+        else:
+            getattr(self, f'__resolve_{self.engine}__')()
+
+        return cone
+
+    def __order_pairs__(self, orders, power=None):
+        """ Returns a list of diplomacy orders, given as strings or as pairs
+        of a location id and a description, as pairs of the location id of
+        the unit and the description of the order; see `set_order`. The
+        strings are parsed once, by `__parse_order__`.
+
+        If a power is given, the units must belong to the power.
+
+        """
+        located = {unit.location.id: unit for unit in self.units}
+        pairs = []
+        for entry in orders:
+            if isinstance(entry, str):
+                order = self.__parse_order__(entry, located)
+                unit, spec = order.unit, self.__spec__(order)
+            else:
+                unit, spec = entry
+                unit = self.__unit_at__(unit)
+            if power is not None and unit.owner is not power:
+                raise OrderInputError('The unit does not belong to the '
+                                      'power of the order set.')
+            pairs.append((unit.location.id, spec))
+
+        return pairs
+
+    def __outcome__(self, power):
+        """ Returns the outcome of the resolved orders of a diplomacy phase
+        for a power; see `evaluate`.
+
+        """
+        moves = 0
+        dislodged = 0
+        occupied = set()
+        for order in self.orders:
+            if order.unit.owner is not power:
+                continue
+            if isinstance(order, Move) and order.moves():
+                moves += 1
+                occupied.add(order.target.province)
+                continue
+            attack = next((entry for entry
+                           in self.orders.moves_to(order.province)
+                           if entry.moves()), None)
+            if attack is None:
+                occupied.add(order.province)
+            else:
+                dislodged += 1
+
+        centers = len([province for province in occupied
+                       if province.supply_center
+                       and province not in self.supply_centers[power]])
+
+        return {'moves': moves, 'dislodged': dislodged, 'centers': centers}
+
+    def evaluate(self, power, candidates, opponents=()):
+        """ Method to compare sets of diplomacy orders of a power, against
+        fixed orders of the other units. The game is not changed.
+
+        The fixed orders are entered and resolved once, in a copy of the
+        game, together with the current orders of the units of the power.
+        Each order set is then entered in a copy of the resolved game, and
+        only the orders depending on the orders changed are resolved again;
+        see `revise_many`. Order strings are parsed once.
+
+        The function `adjudicator.evaluation.evaluate` evaluates the order
+        sets over a process pool.
+
+        Parameters
+        ----------
+        power : Power
+            The power giving the order sets.
+
+        candidates : list of lists
+            The order sets, each a list of orders of units of the power,
+            given as strings or as pairs of a unit, or the id of its
+            location, and the description of the order; see `set_order`.
+            Units without orders in a set keep their current orders.
+
+        opponents : list, optional
+            The fixed orders, given as the orders of the order sets. Units
+            without fixed orders keep their current orders. Default is an
+            empty tuple.
+
+        Returns
+        -------
+        list of dictionaries
+            The outcomes of the order sets, in order. An outcome gives the
+            number of `moves` of the power which succeed, the number of
+            units of the power which are `dislodged`, and the number of
+            supply `centers` the power does not own which its units occupy
+            after the phase.
+
+        """
+        if self.season.phase != 'Diplomacy':
+            raise GameError('Order sets are only evaluated in diplomacy '
+                            'phases.')
+
+        opponents = self.__order_pairs__(opponents)
+        candidates = [self.__order_pairs__(candidate, power)
+                      for candidate in candidates]
+
+        return self.__evaluate__(power, candidates, opponents)
+
+    def __evaluate__(self, power, candidates, opponents):
+        """ Method to evaluate order sets given as lists of pairs of a
+        location id and the description of an order; see `evaluate`.
+
+        """
+        base = self.clone()
+        base.__own__()
+        for unit, spec in opponents:
+            base.set_order(unit, spec)
+        for order in base.orders:
+            order.reset()
+        base.__resolve_diplomacy__()
+
+        outcomes = []
+        for candidate in candidates:
+            game = base.clone()
+            game.revise_many(candidate)
+            outcomes.append(game.__outcome__(power))
+
+        return outcomes
+
     def __resolve_orders__(self):
         """ Method to resolve orders.
 
@@ -432,50 +1356,159 @@ class Game:
             if not(order.resolved):
                 order.resolve(self.variant, self.orders)
 
+    def __resolve_queue__(self, queue, dependents):
+        """ Method to resolve orders from a work list. An order is put back
+        on the work list only when the partial resolution of an order it
+        depends on has changed.
+
+        """
+        queued = set(queue)
+        while queue:
+            order = queue.popleft()
+            queued.discard(order)
+            if order.resolved:
+                continue
+            state = order.__state__()
+            order.resolve(self.variant, self.orders)
+            if order.__state__() == state:
+                continue
+            for entry in dependents[order] + [order]:
+                if entry not in queued and not entry.resolved:
+                    queue.append(entry)
+                    queued.add(entry)
+
     def __resolve_diplomacy__(self):
         """ Method to resolve orders during the diplomacy phase.
 
         """
+        self.__own__()
         self.orders.sort(by='relevance')
+        self.orders.paths.clear()
         for order in self.orders:
             if isinstance(order, Move):
                 order.__adjacent_convoy__(self.orders)
+        self.orders.link()
+
+        getattr(self, f'__resolve_{self.engine}__')()
+
+    def __resolve_default__(self, orders=None, dependents=None):
+        """ Method to resolve orders during the diplomacy phase, using the
+        default engine.
+
+        When the resolution stalls, the backup rules are applied to the
+        stalled components only; see `__stalled__`. The Szykman rule is
+        applied to components containing a move via convoy which may still
+        cut or dislodge, and the circular movement rule to the others. The
+        orders depending on them are then resolved, until the next stall.
+
+        Parameters
+        ----------
+        orders : list of Orders, optional
+            The orders to resolve, which include every unresolved order.
+            Default is None; all orders.
+
+        dependents : dictionary, optional
+            The dependents of the orders; see `DiplomacyOrders.dependents`.
+            Default is None; computed.
 
-        counter = 1
-        while counter < 3:
-            unresolved = self.__unresolved_count__()
-            # Set larger initial value  to start the second loop
-            previous = unresolved + 1
-            while previous > unresolved:
-                self.__resolve_orders__()
-                previous = unresolved
-                unresolved = self.__unresolved_count__()
-                if unresolved == 0:
-                    break
-            if unresolved == 0:
+        """
+        if dependents is None:
+            dependents = self.orders.dependents()
+        queue = deque(self.orders if orders is None else orders)
+        self.__resolve_queue__(queue, dependents)
+
+        while True:
+            stalled = self.__stalled__(dependents)
+            if len(stalled) == 0:
                 break
-            if counter == 1:
-                self.__resolve_paradoxes__()
-            if counter == 2:
-                self.__resolve_circular_movement__()
-            counter += 1
+            before = [[order.__state__() for order in component]
+                      for component in stalled]
+            for component in stalled:
+                if self.__paradox__(component):
+                    self.__resolve_paradoxes__(component)
+                else:
+                    self.__resolve_circular_movement__(component)
+            self.__resolve_queue__(deque(flatten(stalled)), dependents)
+            if before == [[order.__state__() for order in component]
+                          for component in stalled]:
+                # The game raises an AdjudicationError for the remaining
+                # orders.
+                break
+
+    def __stalled__(self, dependents):
+        """ Method to retrieve the components of unresolved orders which do
+        not depend on any other component of unresolved orders; that is,
+        the sources of the components, in topological order; see
+        `adjudicator.lib.components`. The components of more than one
+        order are the paradoxes and circular movements blocking the
+        resolution. Components of single orders are only returned if there
+        are no such components, in which case the circular movement rule
+        is applied to them, unless they are moves via convoy which may
+        still cut or dislodge.
+
+        """
+        unresolved = [order for order in self.orders if not order.resolved]
+        found = components(unresolved, dependents)
+        component_of = {order: k for k, component in enumerate(found)
+                        for order in component}
+
+        blocked = set()
+        for order in unresolved:
+            for entry in dependents[order]:
+                k = component_of.get(entry)
+                if k is not None and k != component_of[order]:
+                    blocked.add(k)
+
+        stalled = [component for k, component in enumerate(found)
+                   if k not in blocked]
+        cycles = [component for component in stalled if len(component) > 1]
+
+        return cycles if len(cycles) > 0 else stalled
+
+    def __paradox__(self, component):
+        """ Tests if the Szykman rule applies to a component; that is, if
+        the component contains a move via convoy that may still cut or
+        dislodge.
+
+        """
+        return next((True for order in component
+                     if isinstance(order, Move) and order.convoy
+                     and None in (order.cutting, order.dislodging)), False)
+
+    def __resolve_kruijswijk__(self):
+        """ Method to resolve orders during the diplomacy phase, using the
+        Kruijswijk engine.
+
+        """
+        Kruijswijk(self.variant, self.orders).resolve()
 
-    def __resolve_paradoxes__(self):
-        """ Method to resolve paradoxes.
+    def __resolve_paradoxes__(self, orders=None):
+        """ Method to resolve paradoxes, by the Szykman rule.
+
+        Parameters
+        ----------
+        orders : list of Orders, optional
+            The orders of the paradox. Default is None; all orders.
 
         """
         assert self.season.phase == 'Diplomacy'
-        for order in self.orders:
+        for order in self.orders if orders is None else orders:
             if isinstance(order, Move) and order.convoy and not order.resolved:
                 order.set_('cutting', False)
                 order.set_('dislodging', False)
 
-    def __resolve_circular_movement__(self, varbose=False):
+    def __resolve_circular_movement__(self, orders=None):
         """ Method to resolve circular movement.
 
+        Parameters
+        ----------
+        orders : list of Orders, optional
+            The orders of the circular movement. Default is None; all
+            orders.
+
         """
         assert self.season.phase == 'Diplomacy'
-        for order in self.orders:
+        for order in self.orders if orders is None else orders:
             if isinstance(order, Move) and not order.resolved:
                 order.set_('cutting', False)
                 order.set_('dislodging', False)
@@ -593,9 +1626,15 @@ class Game:
 
         """
         assert self.winner is None
+        self.__own__()
 
         # Resolve orders
-        getattr(self, f'__resolve_{self.season.phase.lower()}__')()
+        resolve = getattr(self, f'__resolve_{self.season.phase.lower()}__')
+        if (self.cache is None or self.season.phase == 'Builds'
+                or len(self.orders) == 0):
+            resolve()
+        else:
+            self.cache.resolve(self, resolve)
         self.__archive_orders__()
         if self.__unresolved_count__() != 0:
             raise AdjudicationError('Resolution ended with unresolved orders.')
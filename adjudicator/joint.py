@@ -0,0 +1,263 @@
+""" The JointOrders class
+
+"""
+
+
+class JointOrders:
+    """ The joint order sets of a power, i.e. the combinations of one
+    legal order for each of its units, enumerated as the digits of a mixed
+    radix number. The order sets are streamed, and any range of indices
+    may be enumerated on its own, e.g. to split the enumeration over a
+    process pool.
+
+    Parameters
+    ----------
+    game : Game
+        A game in a diplomacy phase.
+
+    power : Power
+        The power whose order sets are enumerated.
+
+    Attributes
+    ----------
+    game : Game
+        See Parameters.
+
+    power : Power
+        See Parameters.
+
+    units : list of Units
+        The units of the power; the first unit gives the most significant
+        digit.
+
+    specs : list of tuples
+        The descriptions of the legal orders of each unit, as given by
+        `Game.__legal_specs__`.
+
+    radices : list of integers
+        The numbers of legal orders of the units.
+
+    strides : list of integers
+        The values of the digits of the units.
+
+    Notes
+    -----
+    The following order sets are void, and pruned:
+        - sets supporting an order of a unit of the power which is not
+          given, or convoying a move of an army of the power which is not
+          given;
+        - sets with two units moving to the same province, when no third
+          unit supports either move;
+        - sets with a move via convoy which no fleet can convoy, as no
+          fleet of the power convoys it, and no fleet of another power is
+          adjacent to the army.
+    Supports and convoys of units of other powers are kept. When the digits
+    of the first units already give a void set, all indices sharing those
+    digits are skipped.
+
+    The last rule also groups equivalent sets: a move via convoy to an
+    adjacent province which no fleet can convoy is a land move, by the
+    webDip rule, and only the set with the land move is yielded. No other
+    equivalent sets are grouped. In particular, sets differing only in
+    a support or convoy of a unit of another power are all yielded, even
+    though such an order is a hold when that power gives another order,
+    since the orders of other powers are not known.
+
+    """
+
+    def __init__(self, game, power):
+        """ Constructor.
+
+        """
+        self.game = game
+        self.power = power
+        self.units = game.units_of(power)
+        self.specs = [tuple(game.__legal_specs__(unit)) for unit in self.units]
+        self.radices = [len(specs) for specs in self.specs]
+
+        self.strides = []
+        stride = 1
+        for radix in reversed(self.radices):
+            self.strides.insert(0, stride)
+            stride *= radix
+        self.size = stride
+
+        self.__compile__()
+
+    def __len__(self):
+        """ Length; the number of order sets before pruning.
+
+        """
+        return self.size
+
+    def __iter__(self):
+        """ Iterator.
+
+        """
+        return self.sets()
+
+    def __compile__(self):
+        """ Method to compute, for each order, the constraints it puts on
+        the orders of the other units of the power, and the provinces of
+        moves.
+
+        """
+        locations = self.game.variant.map.locations
+        columns = {unit.location.id: k for k, unit in enumerate(self.units)}
+        provinces = [[None if spec[0] != 'move' else locations[spec[2]].province
+                      for spec in specs] for specs in self.specs]
+        fleets = [unit.location for unit in self.game.units
+                  if unit.owner is not self.power
+                  and 'Convoy' in unit.location.geography.orders]
+
+        self.provinces = provinces
+        self.requires = []
+        self.unconvoyed = []
+
+        for k, (unit, specs) in enumerate(zip(self.units, self.specs)):
+            requires = []
+            unconvoyed = []
+            foreign = any(fleet.reaches_province(unit.province)
+                          for fleet in fleets)
+            for name, object_id, target_id, convoy in specs:
+                column = columns.get(object_id)
+                if name in ('support', 'convoy') and column is not None:
+                    requires.append((column, frozenset(
+                        j for j, spec in enumerate(self.specs[column])
+                        if self.__fits__(name, target_id, spec)
+                    )))
+                else:
+                    requires.append(None)
+
+                # Moves via convoy which only an adjacent fleet of the
+                # power may convoy.
+                unconvoyed.append(name == 'move' and convoy and not foreign)
+            self.requires.append(requires)
+            self.unconvoyed.append(unconvoyed)
+
+    def __fits__(self, name, target_id, spec):
+        """ Checks whether the order described by `spec` is the object of a
+        support or convoy, of a given name and target.
+
+        """
+        locations = self.game.variant.map.locations
+
+        if name == 'convoy':
+            return spec[0] == 'move' and spec[3] and spec[2] == target_id
+
+        if target_id is None:
+            return spec[0] != 'move'
+
+        return (spec[0] == 'move' and locations[spec[2]].province
+                is locations[target_id].province)
+
+    def digits(self, index):
+        """ Returns the digits of an index.
+
+        """
+        return [(index // stride) % radix
+                for stride, radix in zip(self.strides, self.radices)]
+
+    def index(self, digits):
+        """ Returns the index of a list of digits.
+
+        """
+        return sum(digit * stride for digit, stride in zip(digits, self.strides))
+
+    def orders(self, index):
+        """ Returns the order set of an index, as new orders.
+
+        """
+        located = {unit.location.id: unit for unit in self.game.units}
+
+        return tuple(self.game.__legal_order__(unit, specs[digit], located)
+                     for unit, specs, digit
+                     in zip(self.units, self.specs, self.digits(index)))
+
+    def __void_depth__(self, digits):
+        """ Returns the first unit at which the digits give a void set of
+        orders, or None.
+
+        """
+        depth = None
+        for k, digit in enumerate(digits):
+            requirement = self.requires[k][digit]
+            if requirement is None:
+                continue
+            column, allowed = requirement
+            if digits[column] not in allowed:
+                failed = max(k, column)
+                depth = failed if depth is None else min(depth, failed)
+
+        return depth
+
+    def __kept__(self, digits):
+        """ Checks whether a set of orders with no void supports or convoys
+        has neither a self bounce nor a move via convoy without convoys.
+
+        """
+        moves = {}
+        for k, digit in enumerate(digits):
+            province = self.provinces[k][digit]
+            if province is not None:
+                moves.setdefault(province, []).append(k)
+
+        for province, movers in moves.items():
+            if len(movers) < 2:
+                continue
+            if not any(self.requires[k][digit] is not None
+                       and self.requires[k][digit][0] in movers
+                       and self.specs[k][digit][0] == 'support'
+                       for k, digit in enumerate(digits)):
+                return False
+
+        for k, digit in enumerate(digits):
+            if self.unconvoyed[k][digit] and not self.__convoyed__(k, digits):
+                return False
+
+        return True
+
+    def __convoyed__(self, column, digits):
+        """ Checks whether the move of a unit is convoyed by an adjacent
+        fleet of the power.
+
+        """
+        province = self.units[column].province
+
+        return any(self.requires[k][digit] is not None
+                   and self.requires[k][digit][0] == column
+                   and self.specs[k][digit][0] == 'convoy'
+                   and self.units[k].location.reaches_province(province)
+                   for k, digit in enumerate(digits))
+
+    def sets(self, start=0, stop=None):
+        """ Generator of the order sets with indices in a range, which are
+        neither void nor grouped with an equivalent set; see Notes of the
+        class. Yields pairs of an index and a tuple of new orders, one for
+        each unit.
+
+        Parameters
+        ----------
+        start : integer, optional
+            The first index. Default is 0.
+
+        stop : integer, optional
+            The index after the last index. Default is the number of order
+            sets.
+
+        """
+        stop = self.size if stop is None else min(stop, self.size)
+        index = start
+
+        while index < stop:
+            digits = self.digits(index)
+            depth = self.__void_depth__(digits)
+
+            if depth is not None:
+                stride = self.strides[depth]
+                index = (index // stride + 1) * stride
+                continue
+
+            if self.__kept__(digits):
+                yield index, self.orders(index)
+            index += 1
@@ -0,0 +1,274 @@
+""" The Kruijswijk class
+
+"""
+
+
+from adjudicator.orders.lib import ILLEGAL, VALID
+
+from lib.lists import first
+
+
+class Kruijswijk:
+    """ An adjudication engine for the diplomacy phase, following the
+    recursive design of Kruijswijk:
+    http://uk.diplom.org/pouch/Zine/S2009M/Kruijswijk/DipMath_Chp1.htm.
+
+    Parameters
+    ----------
+    variant : Variant
+        The variant of the game.
+
+    orders : DiplomacyOrders
+        The orders of the current diplomacy phase.
+
+    Attributes
+    ----------
+    variant : Variant
+        See Parameters.
+
+    orders : DiplomacyOrders
+        See Parameters.
+
+    dependencies : dictionary
+        A dictionary whose keys are orders and whose values are the lists
+        of orders that the resolution of the key depends on.
+
+    cycles : list of lists of Orders
+        The cycles of unresolved orders met during the last recursive pass.
+
+    Notes
+    -----
+    The engine uses the same order classes, and hence the same rules, as
+    the default engine of :cls:`adjudicator.game.Game`. What differs is
+    the order of resolution and the handling of cyclic dependencies.
+
+    An order is resolved only after all orders it depends on have been
+    resolved as far as possible, recursively. When the recursion returns
+    to an order which is still being resolved, a cycle is detected. If a
+    pass over all orders makes no progress, then one of the cycles met is
+    broken. Cycles containing a move via convoy are paradoxes, and the
+    Szykman rule is applied to the orders of the cycle. Other cycles are
+    resolved by guess and check: we guess that a move of the cycle fails,
+    and that it succeeds, and resolve the remaining orders for both
+    guesses. If exactly one guess is consistent, then it is kept; if not,
+    then the circular movement rule is applied to the orders of the cycle.
+    Paradoxes are handled before circular movement, as for the default
+    engine.
+
+    """
+
+    def __init__(self, variant, orders):
+        """ Constructor.
+
+        """
+        self.variant = variant
+        self.orders = orders
+        self.dependencies = {
+            order: [entry for entry in order.__dependencies__(orders)
+                    if entry is not order]
+            for order in orders
+        }
+        self.cycles = []
+
+    def __unresolved__(self):
+        """ Returns the list of unresolved orders.
+
+        """
+        return [order for order in self.orders if not order.resolved]
+
+    def __visit__(self, order, stack, done):
+        """ Method to resolve an order after having resolved the orders it
+        depends on, depth first. Cycles are recorded when met.
+
+        The depth first search keeps its own stack of the iterators over
+        the dependencies of the orders in `stack`, rather than recursing,
+        such that long chains of dependencies do not exceed the recursion
+        limit.
+
+        """
+        if order in done or order.resolved:
+            return
+
+        if order in stack:
+            self.cycles.append(stack[stack.index(order):])
+            return
+
+        stack.append(order)
+        work = [iter(self.dependencies[order])]
+        while work:
+            entry = next(work[-1], None)
+
+            if entry is None:
+                work.pop()
+                entry = stack.pop()
+                entry.resolve(self.variant, self.orders)
+                done.add(entry)
+
+            elif entry in done or entry.resolved:
+                continue
+
+            elif entry in stack:
+                self.cycles.append(stack[stack.index(entry):])
+
+            else:
+                stack.append(entry)
+                work.append(iter(self.dependencies[entry]))
+
+    def __settle__(self):
+        """ Method to resolve orders recursively until no further progress
+        can be made.
+
+        """
+        progress = True
+        while progress:
+            self.cycles = []
+            before = [order.__state__() for order in self.orders]
+            done = set()
+            for order in self.orders:
+                self.__visit__(order, [], done)
+            after = [order.__state__() for order in self.orders]
+            progress = before != after
+
+    def __cycle__(self):
+        """ Returns the cycle to resolve next. Cycles containing a move via
+        convoy are returned first.
+
+        """
+        cycles = [cycle for cycle in self.cycles
+                  if True not in [order.resolved for order in cycle]]
+
+        if len(cycles) == 0:
+            # Should not happen; fall back on all unresolved orders.
+            return self.__unresolved__()
+
+        return next((cycle for cycle in cycles if self.__paradox__(cycle)),
+                    cycles[0])
+
+    def __paradox__(self, cycle):
+        """ Tests if the Szykman rule applies to a cycle; that is, if the
+        cycle contains a move via convoy that may still cut or dislodge.
+
+        """
+        return next((True for order in cycle
+                     if order.name == 'move' and order.convoy
+                     and None in (order.cutting, order.dislodging)), False)
+
+    def __convoyed__(self, move):
+        """ Tests if the convoy route of a move is undetermined.
+
+        """
+        return (move.convoy and move.min_status == ILLEGAL
+                and move.max_status > ILLEGAL)
+
+    def __impose__(self, move, guess):
+        """ Imposes a guessed outcome on a move. For moves via convoy with
+        an undetermined convoy route, the guess is whether the convoy
+        succeeds; otherwise the guess is whether the move succeeds.
+
+        """
+        if self.__convoyed__(move):
+            if guess:
+                move.min_status = VALID
+            else:
+                move.set_illegal()
+
+        elif guess:
+            move.set_('failed', False)
+
+        else:
+            move.set_('dislodging', False)
+            move.set_('failed', True)
+
+    def __consistent__(self, move, state, guess):
+        """ Tests whether a guessed outcome of a move agrees with the
+        outcome deduced from the orders it depends on.
+
+        """
+        convoyed = self.__convoyed__(move)
+        guessed = move.__state__()
+        move.__restore__(state)
+        move.resolve(self.variant, self.orders)
+
+        if convoyed:
+            consistent = (move.min_status == VALID if guess
+                          else move.max_status == ILLEGAL)
+        else:
+            consistent = move.failed is (not guess)
+
+        move.__restore__(guessed)
+
+        return consistent
+
+    def __guess__(self, cycle):
+        """ Method to resolve a cycle by guess and check. Returns True if
+        exactly one guess was consistent, in which case it is kept.
+
+        """
+        moves = [order for order in cycle if order.name == 'move']
+        move = next((order for order in moves if self.__convoyed__(order)),
+                    first(moves))
+
+        if move is None:
+            return False
+
+        cycles = self.cycles
+        unresolved = self.__unresolved__()
+        initial = {order: order.__state__() for order in unresolved}
+
+        outcomes = []
+        for guess in (False, True):
+            self.__impose__(move, guess)
+            self.__settle__()
+            if self.__consistent__(move, initial[move], guess):
+                outcomes.append({order: order.__state__()
+                                 for order in unresolved})
+            for order in unresolved:
+                order.__restore__(initial[order])
+
+        if len(outcomes) != 1:
+            self.cycles = cycles
+            return False
+
+        for order in unresolved:
+            order.__restore__(outcomes[0][order])
+
+        return True
+
+    def __backup__(self, cycle):
+        """ Method to apply the backup rule to a cycle.
+
+        """
+        moves = [order for order in cycle if order.name == 'move']
+
+        if self.__paradox__(cycle):
+            # Szykman rule.
+            for move in moves:
+                if move.convoy:
+                    move.set_('cutting', False)
+                    move.set_('dislodging', False)
+
+        else:
+            # Circular movement.
+            for move in moves:
+                move.set_('cutting', False)
+                move.set_('dislodging', False)
+                move.set_('failed', False)
+
+    def resolve(self):
+        """ Main method to resolve the orders.
+
+        """
+        self.__settle__()
+
+        while len(self.__unresolved__()) > 0:
+            before = [order.__state__() for order in self.orders]
+
+            cycle = self.__cycle__()
+            if self.__paradox__(cycle) or not self.__guess__(cycle):
+                self.__backup__(cycle)
+            self.__settle__()
+
+            if before == [order.__state__() for order in self.orders]:
+                # The cycle could not be broken; the game raises an
+                # AdjudicationError for the remaining orders.
+                break
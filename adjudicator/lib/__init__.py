@@ -3,10 +3,12 @@ functions used in the adjudicator module.
 
 """
 
+from ._components import components
 from ._flatten import flatten
 from ._require import require
 
 __all__ = [
+    "components",
     "flatten",
     "require"
 ]
@@ -0,0 +1,76 @@
+""" The function: components.
+
+"""
+
+
+def components(nodes, edges):
+    """ Returns the strongly connected components of a directed graph, in
+    topological order; that is, if an edge leads from a component to
+    another, then the first is listed before the second. Uses Tarjan's
+    algorithm, without recursion.
+
+    Parameters
+    ----------
+    nodes : iterable
+        The nodes of the graph, which must be hashable.
+
+    edges : dictionary
+        A dictionary whose keys are nodes and whose values are the lists of
+        nodes reached from the key. Nodes which are not keys, and reached
+        nodes which are not among the nodes, are ignored.
+
+    Returns
+    -------
+    list of lists
+        The components, each listing its nodes.
+
+    """
+    nodes = list(nodes)
+    included = set(nodes)
+    index = {}
+    lowlink = {}
+    stack = []
+    stacked = set()
+    found = []
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        stacked.add(root)
+        work = [(root, iter(edges.get(root, ())))]
+
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in included:
+                    continue
+                if successor not in index:
+                    index[successor] = lowlink[successor] = len(index)
+                    stack.append(successor)
+                    stacked.add(successor)
+                    work.append((successor,
+                                 iter(edges.get(successor, ()))))
+                    break
+                if successor in stacked:
+                    lowlink[node] = min(lowlink[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        entry = stack.pop()
+                        stacked.discard(entry)
+                        component.append(entry)
+                        if entry is node:
+                            break
+                    found.append(component)
+
+    # Tarjan's algorithm finds the components in reverse topological order.
+    found.reverse()
+
+    return found
@@ -6,7 +6,7 @@ import unittest
 
 from unittest.mock import Mock
 
-from adjudicator.lib import flatten, require
+from adjudicator.lib import components, flatten, require
 
 
 class TestAdjudicator(unittest.TestCase) :
@@ -31,6 +31,17 @@ class TestAdjudicator(unittest.TestCase) :
             [1,2,3,4]
         )
 
+    def test_components(self):
+        edges = {1: [2], 2: [3, 4], 3: [2], 4: [5], 5: [4, 6], 7: [1]}
+        self.assertEqual(
+            components([1, 2, 3, 4, 5, 6, 7], edges),
+            [[7], [1], [3, 2], [5, 4], [6]]
+        )
+        self.assertEqual(
+            components([2, 3, 4], edges),
+            [[3, 2], [4]]
+        )
+
     def test_require(self):
         @require
         def f(x, require=False):
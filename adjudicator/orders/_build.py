@@ -2,6 +2,10 @@
 
 """
 
+
+from copy import copy
+
+
 class Build:
     """ A Build is an order to add a new unit to the game.
 
@@ -94,6 +98,14 @@ class Build:
         except AttributeError:
             return None
 
+    def clone(self, units):
+        """ Returns a copy of the order. A build order has no unit, so the
+        parameter `units` is not used; it exists for consistency with the
+        other orders.
+
+        """
+        return copy(self)
+
     def postpone(self):
         """ Sets as a postponed order.
         
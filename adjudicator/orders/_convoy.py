@@ -4,7 +4,7 @@
 
 from yaml import load, Loader
 
-from adjudicator.orders.lib import Order
+from adjudicator.orders.lib import Order, ILLEGAL, BROKEN, VALID
 
 
 with open('adjudicator/config.yaml', 'r') as file:
@@ -68,6 +68,8 @@ class Convoy(Order):
 
     """
 
+    __slots__ = ('object_order', 'max_hold', 'min_hold')
+
     relevance = RELEVANCE['convoy']
 
     name = 'convoy'
@@ -79,8 +81,8 @@ class Convoy(Order):
         self.unit = unit
         self.object_order = object_order
 
-        self.max_status = 'valid'
-        self.min_status = 'illegal'
+        self._max_status = VALID
+        self._min_status = ILLEGAL
 
         self.max_hold = max_hold
         self.min_hold = 1
@@ -92,7 +94,7 @@ class Convoy(Order):
         if not(self.resolved):
             resolution = '[unresolved]'
 
-        elif self.min_status == 'valid':
+        elif self.min_status == VALID:
             resolution = '(succeeds)'
         
         else:
@@ -109,22 +111,22 @@ class Convoy(Order):
         convoyed = orders.order_of(self.object_order.unit)
 
         if convoyed is None or convoyed.unit.force.name == 'Fleet':
-            self.max_status = 'illegal'
+            self.max_status = ILLEGAL
 
         elif not convoyed.name == 'move':
-            self.max_status = 'illegal'
+            self.max_status = ILLEGAL
 
         elif convoyed.target is not self.object_order.target:
-            self.max_status = 'illegal'
+            self.max_status = ILLEGAL
 
         else:
-            self.min_status = 'broken'
+            self.min_status = BROKEN
 
     def resolve_dislodged(self, orders, verbose=False):
         """ Method to resolve dislodgement of a convoying fleet.
 
         """
-        if self.min_status < 'valid':
+        if self.min_status < VALID:
             results = orders.all_moves_to(self.province)
     
             return None if (None in results) else (False in results)
@@ -136,15 +138,15 @@ class Convoy(Order):
 
         """
         # Compute hold strengths
-        if not self.__resolved__('hold'):
+        if not orders.linked and not self.__resolved__('hold'):
             self.__compute_hold_strengths__(orders)
 
 		# Check legality
-        if self.min_status == 'illegal':
+        if self.min_status == ILLEGAL:
             self.__legalize__(orders)
 
 		# If legal, check dislodgement status
-        if self.min_status > 'illegal':
+        if self.min_status > ILLEGAL:
 
             # dislodged can be True, False, or None. If the value is None,
             # then whether the fleet is dislodged or not depends on other
@@ -153,7 +155,7 @@ class Convoy(Order):
             dislodged = self.resolve_dislodged(orders)
 
             if dislodged is True:
-                self.max_status = 'broken'
+                self.max_status = BROKEN
 
             elif dislodged is False:
-                self.min_status = 'valid'
+                self.min_status = VALID
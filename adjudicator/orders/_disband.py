@@ -3,6 +3,7 @@
 """
 
 
+from copy import copy
 from random import choice
 
 
@@ -82,6 +83,21 @@ class Disband:
         """
         return f'{self.owner}{self.id}'
 
+    def clone(self, units):
+        """ Returns a copy of the order, given to the copy of its unit.
+
+        Parameters
+        ----------
+        units : dictionary
+            A dictionary whose keys are units and whose values are their
+            copies.
+
+        """
+        order = copy(self)
+        order.unit = units.get(self.unit)
+
+        return order
+
     def postpone(self):
         """ Sets as a postponed order.
         
@@ -5,7 +5,7 @@
 
 from yaml import load, Loader
 
-from adjudicator.orders.lib import Order
+from adjudicator.orders.lib import Order, ILLEGAL, VALID
 
 
 with open('adjudicator/config.yaml', 'r') as file:
@@ -54,6 +54,8 @@ class Hold(Order):
 
     """
 
+    __slots__ = ('max_hold', 'min_hold')
+
     relevance = RELEVANCE['hold']
 
     name = 'hold'
@@ -63,8 +65,8 @@ class Hold(Order):
 
         """
         self.unit = unit
-        self.max_status = 'valid'
-        self.min_status = 'illegal'
+        self._max_status = VALID
+        self._min_status = ILLEGAL
         self.max_hold = max_hold
         self.min_hold = 1
 
@@ -87,8 +89,8 @@ class Hold(Order):
 
         """
         # Hold orders are always valid.
-        self.min_status = 'valid'
+        self.min_status = VALID
 
 		# Resolve hold strength.
-        if not self.__resolved__('hold'):
+        if not orders.linked and not self.__resolved__('hold'):
             self.__compute_hold_strengths__(orders)
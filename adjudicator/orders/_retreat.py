@@ -3,6 +3,8 @@
 """
 
 
+from copy import copy
+
 from adjudicator.orders import Disband, Move
 
 
@@ -155,6 +157,36 @@ class Retreat:
         """
         return self.unit.sort_string
 
+    def __state__(self):
+        """ Method to retrieve the resolution of the retreat as a tuple.
+
+        """
+        return (self.legal, self.disbands)
+
+    def __restore__(self, state):
+        """ Method to restore a resolution retrieved by the method
+        `__state__`.
+
+        """
+        self._legal, self._disbands = state
+
+    def clone(self, units):
+        """ Returns a copy of the retreat, given to the copy of its unit.
+
+        Parameters
+        ----------
+        units : dictionary
+            A dictionary whose keys are units and whose values are their
+            copies.
+
+        """
+        retreat = copy(self)
+        retreat.unit = units[self.unit]
+        retreat.order = self.order.clone(units)
+        retreat.forbidden = list(self.forbidden)
+
+        return retreat
+
     def resolve(self, variant, orders, verbose=False):
         """ Resolves a retreat order.
         
@@ -5,7 +5,7 @@
 
 from yaml import load, Loader
 
-from adjudicator.orders.lib import Order
+from adjudicator.orders.lib import Order, ILLEGAL, CUT, VALID
 
 
 with open('adjudicator/config.yaml', 'r') as file:
@@ -45,10 +45,10 @@ class Support(Order):
     object_order : Order
         The order to which support is given.
 
-    max_status : string
+    max_status : OrderStatus
         The maximal status of the move as currently known.
 
-    min_status : string
+    min_status : OrderStatus
         The minimal status of the move as currently known.
 
     max_hold : integer
@@ -57,11 +57,18 @@ class Support(Order):
     min_hold : integer
         The minimal hold strength of the unit.
 
+    supported : Order or None
+        The order the support aids, if the orders are linked; see
+        `DiplomacyOrders.link`. When the support is found valid, or found
+        not to be valid, the strengths of the order are updated.
+
     resolved : boolean or None
         Whether the move is resolved or not.
 
     """
 
+    __slots__ = ('object_order', 'max_hold', 'min_hold', 'supported')
+
     relevance = RELEVANCE['support']
 
     name = 'support'
@@ -72,10 +79,53 @@ class Support(Order):
         """
         self.unit = unit
         self.object_order = object_order
-        self.max_status = 'valid'
-        self.min_status = 'illegal'
+        self._max_status = VALID
+        self._min_status = ILLEGAL
         self.max_hold = max_hold
         self.min_hold = 1
+        self.supported = None
+
+    @property
+    def min_status(self):
+        """ min_status getter.
+
+        """
+        return self._min_status
+
+    @min_status.setter
+    def min_status(self, value):
+        """ min_status setter; see `Order.min_status`. Updates the strengths
+        of the supported order when the support is found valid.
+
+        """
+        known = self._min_status == VALID
+        Order.min_status.fset(self, value)
+        if (self.supported is not None and not known
+                and self._min_status == VALID):
+            self.supported.__add_support__(self.unit.owner, 1, 0)
+
+    @property
+    def max_status(self):
+        """ max_status getter.
+
+        """
+        return self._max_status
+
+    @max_status.setter
+    def max_status(self, value):
+        """ max_status setter; see `Order.max_status`. Updates the strengths
+        of the supported order when the support is found not to be valid.
+
+        """
+        known = self._min_status == VALID
+        possible = self._max_status == VALID
+        Order.max_status.fset(self, value)
+        if self.supported is not None:
+            known = (self._min_status == VALID) - known
+            possible = (self._max_status == VALID) - possible
+            if known or possible:
+                self.supported.__add_support__(self.unit.owner, known,
+                                               possible)
 
     def __str__(self):
         """ Method to print a support.
@@ -84,7 +134,7 @@ class Support(Order):
         if not(self.resolved):
             resolution = ' [unresolved]'
 
-        elif self.max_status < 'valid':
+        elif self.max_status < VALID:
             resolution = ' (fails)'
         
         else:
@@ -111,34 +161,33 @@ class Support(Order):
         # The `relevant` order is the order of the unit being supported
         relevant = orders.order_of(self.object_order.unit)
 
-        reached = [game_map.locations[k].province 
-                   for k in self.unit.location.connections]
+        reached = self.unit.location.reached
 
         # If the object order is a hold, then the support is legal
         # as long as the `relevant` order is not a move.
         if self.object_order.name == 'hold':
 
             if (relevant.province in reached) and (relevant.name != 'move'):
-                self.min_status = 'cut'
+                self.min_status = CUT
 
             else:
-                self.max_status = 'illegal'
+                self.max_status = ILLEGAL
 
         # If the object order is a move, then the support is legal only
         # if the `relevant` order is a move into the same province.
         elif self.object_order.name == 'move':
 
             if (relevant.name == 'move') and (relevant.target.province in reached):
-                self.min_status = 'cut'
+                self.min_status = CUT
 
             else:
-                self.max_status = 'illegal'
+                self.max_status = ILLEGAL
         
         # It is possible to, formally, support convoys and supports,
         # but such orders are not legal.
         else:
 
-            self.max_status = 'illegal'
+            self.max_status = ILLEGAL
 
     def __resolve_attacked__(self, orders):
         """ Method to resolve whether the support is cut.
@@ -152,21 +201,21 @@ class Support(Order):
 
         # If attacked, reduce max_status
         if True in relevant:
-            self.max_status = 'cut'
+            self.max_status = CUT
 
         # If not attacked, increase min_status
         elif None not in relevant:
-            self.min_status = 'valid'
+            self.min_status = VALID
 
     def resolve(self, variant, orders):
         """ Main method to resolve a support.
 
         """
-        if not self.__resolved__('hold'):
+        if not orders.linked and not self.__resolved__('hold'):
             self.__compute_hold_strengths__(orders)
 
-        if self.min_status == 'illegal':
+        if self.min_status == ILLEGAL:
             self.__legalize__(orders, variant.map)
 
-        if self.min_status > 'illegal':
+        if self.min_status > ILLEGAL:
             self.__resolve_attacked__(orders)
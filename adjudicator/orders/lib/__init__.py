@@ -4,7 +4,9 @@ and collections of orders.
 
 """
 
-from ._order_status import OrderStatus
+from ._order_status import (
+    OrderStatus, ILLEGAL, BROKEN, CUT, NO_EFFECT, VALID
+)
 from ._order import Order
 
 from ._order_collection import OrderCollection
@@ -16,7 +18,12 @@ __all__ = [
     "AdjustmentOrders",
     "DiplomacyOrders",
     "Order",
-    "OrderCollection"
+    "OrderCollection",
     "OrderStatus",
-    "RetreatOrders"
+    "RetreatOrders",
+    "ILLEGAL",
+    "BROKEN",
+    "CUT",
+    "NO_EFFECT",
+    "VALID"
 ]
@@ -3,8 +3,11 @@
 """
 
 
+from adjudicator.lib import require
 from adjudicator.orders.lib import OrderCollection
 
+from lib.lists import first
+
 
 class DiplomacyOrders(OrderCollection):
     """ An instance of DiplomacyOrders is a collection of orders
@@ -23,13 +26,199 @@ class DiplomacyOrders(OrderCollection):
     orders : List of Orders
         The list of orders of the units appearing in the current phase.
 
+    provinces : dictionary
+        Index whose keys are Provinces and whose values are the lists of
+        orders given to units in the province.
+
+    units : dictionary
+        Index whose keys are Units and whose values are the lists of
+        orders given to the unit.
+
+    targets : dictionary
+        Index whose keys are Provinces and whose values are the lists of
+        moves into the province.
+
+    objects : dictionary
+        Index whose keys are pairs of an order name and the object key of
+        an order, and whose values are the lists of orders of the given
+        name acting on that order. See `Order.__object_key__`.
+
+    paths : dictionary
+        A memo of the convoy routes found while resolving the orders; see
+        `Map.has_path`. Emptied at the start of every resolution.
+
+    linked : boolean
+        Whether the supports are linked to the orders they aid, and the
+        strengths of the orders are kept up to date by the supports; see
+        `link`. Any change to the collection unlinks it.
+
+    Notes
+    -----
+    The indexes are updated by the methods `insert`, `remove` and
+    `remove_unit`; the list `orders` should not be altered directly.
+
     """
 
     def __init__(self, hold, units=[]):
         """ Constructor.
  
         """
-        self.orders = [hold(unit) for unit in units]
+        self.orders = []
+        self.provinces = {}
+        self.units = {}
+        self.targets = {}
+        self.objects = {}
+        self.paths = {}
+        self.linked = False
+
+        self.insert([hold(unit) for unit in units])
+
+    def __indexes__(self, order):
+        """ Returns the keys under which an order is indexed, as pairs of
+        an index and a key.
+
+        """
+        indexes = [(self.provinces, order.province), (self.units, order.unit)]
+
+        if order.name == 'move':
+            indexes.append((self.targets, order.target.province))
+
+        elif order.name in ('support', 'convoy'):
+            key = (order.name, order.object_order.__object_key__())
+            indexes.append((self.objects, key))
+
+        return indexes
+
+    def insert(self, order):
+        """ Adds an order, or a list of orders, to the collection.
+
+        """
+        orders = order if isinstance(order, list) else [order]
+        self.linked = False
+
+        for entry in orders:
+            self.orders.append(entry)
+            for index, key in self.__indexes__(entry):
+                index.setdefault(key, []).append(entry)
+
+    def clone(self, units):
+        """ Returns a copy of the collection, with copies of all orders. See
+        `Order.clone`.
+
+        """
+        clones = {order: order.clone(units) for order in self.orders}
+        collection = DiplomacyOrders(None)
+        collection.insert(list(clones.values()))
+
+        # The supports aid the copies of their orders.
+        for order in clones.values():
+            if order.name == 'support':
+                order.supported = clones.get(order.supported)
+        collection.linked = self.linked
+
+        return collection
+
+    def remove(self, order):
+        """ Removes an order from the collection.
+
+        """
+        if order not in self.units.get(order.unit, []):
+            return
+
+        self.linked = False
+        self.orders.remove(order)
+        for index, key in self.__indexes__(order):
+            index[key].remove(order)
+            if len(index[key]) == 0:
+                del index[key]
+
+    def replace(self, orders):
+        """ Replaces the orders of the units of a list of orders by the
+        orders, as if the orders of the unit were removed before inserting
+        each order, but with one pass over the collection.
+
+        """
+        latest = {order.unit: order for order in orders}
+        orders = [order for order in orders if latest[order.unit] is order]
+
+        self.linked = False
+        kept = []
+        for order in self.orders:
+            if order.unit not in latest:
+                kept.append(order)
+                continue
+            for index, key in self.__indexes__(order):
+                index[key].remove(order)
+                if len(index[key]) == 0:
+                    del index[key]
+
+        self.orders = kept
+        self.insert(orders)
+
+    def link(self):
+        """ Links each support to the order it aids, if any, and computes
+        the hold strengths of the orders, once for the phase. The move
+        strengths are computed once the moves are found legal. While the
+        collection is linked, the supports update the strengths when their
+        statuses change, and the orders do not compute them again when
+        resolved.
+
+        """
+        for order in self.orders:
+            if order.name == 'support':
+                key = order.object_order.__object_key__()
+                supported = first(self.provinces.get(key[0]))
+                if (supported is not None
+                        and supported.__object_key__() != key):
+                    supported = None
+                order.supported = supported
+
+        for order in self.orders:
+            if order.name != 'move':
+                order.__compute_hold_strengths__(self)
+
+        self.linked = True
+
+    def remove_unit(self, unit):
+        """ Deletes the orders belonging to a specific unit.
+
+        """
+        for order in list(self.units.get(unit, [])):
+            self.remove(order)
+
+    @require
+    def order_in(self, province, orders=None):
+        """ Retrieves the order of a unit in a province. Throws an error if
+        an order is required but not available. You may restrict the search
+        to a specific set of orders.
+
+        """
+        if orders is not None:
+            return OrderCollection.order_in(self, province, orders=orders)
+
+        return first(self.provinces.get(province))
+
+    @require
+    def order_of(self, unit):
+        """ Retrieves the order of a given unit. Throws an error if an order
+        is required but not available.
+
+        """
+        return first(self.units.get(unit))
+
+    def aids(self, order, string, **kwargs):
+        """ Retrieves the list of orders of type `string` which are acting
+        on the given order.
+
+        """
+        return list(self.objects.get((string, order.__object_key__()), []))
+
+    def moves_to(self, province):
+        """ Retrieves the list of moves from the order collection whose
+        target is in the given province.
+
+        """
+        return list(self.targets.get(province, []))
 
     def sort(self, by='normal'):
         """ Sorts the list of orders.
@@ -38,4 +227,32 @@ class DiplomacyOrders(OrderCollection):
         if by == 'relevance':
             self.orders.sort(key=lambda order: order.relevance)
         else:
-            self.orders.sort(key=lambda order: order.sort_string())
\ No newline at end of file
+            self.orders.sort(key=lambda order: order.sort_string())
+
+    def dependents(self):
+        """ Returns a dictionary whose keys are the orders of the collection,
+        and whose values are the lists of orders whose resolution depends on
+        the partial resolution of the key.
+
+        If the collection is linked, a support changes the strengths of the
+        order it aids, so the orders depending on that order also depend on
+        the support; see `link`.
+
+        """
+        dependents = {order: {} for order in self.orders}
+
+        for order in self.orders:
+            for entry in order.__dependencies__(self):
+                if entry is not order:
+                    dependents[entry][order] = None
+
+        if self.linked:
+            direct = {key: list(value) for key, value in dependents.items()}
+            for order in self.orders:
+                supported = getattr(order, 'supported', None)
+                if supported in direct:
+                    for entry in direct[supported]:
+                        if entry is not order:
+                            dependents[order][entry] = None
+
+        return {key: list(value) for key, value in dependents.items()}
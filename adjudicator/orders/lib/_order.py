@@ -3,7 +3,9 @@
 """
 
 
-from adjudicator.orders.lib import OrderStatus
+from copy import copy
+
+from adjudicator.orders.lib import ILLEGAL, VALID
 
 
 class Order:
@@ -20,6 +22,12 @@ class Order:
     
     max_status : OrderStatus
         The maximum status of the order, as currently deduced.
+
+    max_hold : integer
+        The maximal hold strength of the unit.
+
+    min_hold : integer
+        The minimal hold strength of the unit.
     
     resolved : bool
         Whether the order is resolved or not.
@@ -30,6 +38,10 @@ class Order:
     
     """
 
+    # The hold strengths are slots of the subclasses, as they are class
+    # attributes of moves.
+    __slots__ = ('unit', '_min_status', '_max_status')
+
     @property
     def min_status(self):
         """ min_status getter.
@@ -39,25 +51,13 @@ class Order:
 
     @min_status.setter
     def min_status(self, value):
-        """ min_status setter.
+        """ min_status setter; raises the minimal status, but not above the
+        maximal status.
         
         """
-        try:
-            if self._max_status < value:
-                self._min_status = self._max_status
-
-            elif self._min_status < value:
-                self._min_status.set(value)
-        
-        except AttributeError:
-            self._min_status = OrderStatus(value)
-
-    @min_status.deleter
-    def min_status(self):
-        """ min_status deleter.
-        
-        """
-        del self._min_status
+        if value > self._min_status:
+            self._min_status = (value if value < self._max_status
+                                else self._max_status)
 
     @property
     def max_status(self):
@@ -68,25 +68,14 @@ class Order:
 
     @max_status.setter
     def max_status(self, value):
-        """ max_status setter.
+        """ max_status setter; lowers the maximal status, and the minimal
+        status if it is above it.
         
         """
-        try:
-            if self._min_status > value:
-                self._max_status = self.min_status
-
-            if self._max_status > value:
-                self._max_status.set(value)
-
-        except AttributeError:
-            self._max_status = OrderStatus(value)
-
-    @max_status.deleter
-    def max_status(self):
-        """ min_status deleter.
-        
-        """
-        del self._max_status
+        if value < self._max_status:
+            self._max_status = value
+            if value < self._min_status:
+                self._min_status = value
 
     @property
     def province(self):
@@ -121,10 +110,8 @@ class Order:
         """ Method to reset an order.
 
         """
-        del self.max_status, self.min_status
-
-        self.max_status = 'valid'
-        self.min_status = 'illegal'
+        self._max_status = VALID
+        self._min_status = ILLEGAL
         self.max_hold = max_hold
         self.min_hold = 1
 
@@ -143,12 +130,77 @@ class Order:
         if not self.__resolved__('hold'):
             supports = orders.aids(self, 'support')
             
-            possible = [order for order in supports if order.max_status == 'valid']
-            known = [order for order in supports if order.min_status == 'valid']
+            possible = [order for order in supports
+                        if order._max_status == VALID]
+            known = [order for order in supports
+                     if order._min_status == VALID]
     
             self.max_hold = 1 + len(possible)
             self.min_hold = 1 + len(known)
 
+    def __add_support__(self, power, known, possible):
+        """ Method to update the strengths when a support of a power is
+        found valid (`known` is 1), or found not to be valid (`possible` is
+        -1); see `Support.supported`.
+
+        The class :cls:adjudicator.Move overrides this method.
+
+        """
+        self.min_hold += known
+        self.max_hold += possible
+
+    def __dependencies__(self, orders):
+        """ Method to retrieve the orders whose partial resolution the
+        resolution of the order depends on; that is, the supports of the
+        order and the moves into the province of the order.
+
+        The class :cls:adjudicator.Move overrides this method.
+
+        """
+        return orders.aids(self, 'support') + orders.moves_to(self.province)
+
+    def __state__(self):
+        """ Method to retrieve the partial resolution of the order as a
+        tuple. Used to detect whether resolving the order made progress.
+
+        The class :cls:adjudicator.Move overrides this method.
+
+        """
+        return (self._min_status, self._max_status,
+                self.min_hold, self.max_hold)
+
+    def __restore__(self, state):
+        """ Method to restore a partial resolution retrieved by the method
+        `__state__`.
+
+        The class :cls:adjudicator.Move overrides this method.
+
+        """
+        (self._min_status, self._max_status,
+         self.min_hold, self.max_hold) = state
+
+    def clone(self, units):
+        """ Method to copy the order, including its partial resolution. The
+        copy is given to the copy of the unit of the order.
+
+        The class :cls:adjudicator.Move extends this method.
+
+        Parameters
+        ----------
+        units : dictionary
+            A dictionary whose keys are units and whose values are their
+            copies.
+
+        """
+        order = copy(self)
+        order.unit = units[self.unit]
+
+        object_order = getattr(self, 'object_order', None)
+        if object_order is not None:
+            order.object_order = object_order.clone(units)
+
+        return order
+
     def moves(self):
         """ Method to check whether the order is a successful move.
 
@@ -166,6 +218,15 @@ class Order:
         """
         return [self.province]
 
+    def __object_key__(self):
+        """ Method to retrieve a key such that two orders are equivalent as
+        objects of other orders if and only if their keys agree.
+
+        The class :cls:adjudicator.Move overrides this method.
+
+        """
+        return (self.province, None)
+
     def __object_equivalent__(self, order):
         """ Method to check whether the instance is equivalent to an order
         as objects of other orders.
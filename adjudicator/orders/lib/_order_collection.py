@@ -3,6 +3,8 @@
 """
 
 
+from copy import copy
+
 from adjudicator.lib import flatten, require
 
 
@@ -43,6 +45,16 @@ class OrderCollection:
         else:
             self.orders.append(order)
 
+    def clone(self, units):
+        """ Returns a copy of the collection, with copies of all orders. See
+        the `clone` methods of the orders.
+
+        """
+        collection = copy(self)
+        collection.orders = [order.clone(units) for order in self.orders]
+
+        return collection
+
     def remove(self, order):
         """ Removes an order from the collection.
         
@@ -87,15 +99,22 @@ class OrderCollection:
                 if entry.name == string
                 and order.__object_equivalent__(entry.object_order)]
 
+    def moves_to(self, province):
+        """ Retrieves the list of moves from the order collection whose
+        target is in the given province.
+
+        """
+        return [entry for entry in self.orders
+                if entry.name == 'move'
+                and entry.target.province is province]
+
     def all_moves_to(self, province, attr='failed', exclude_power=None):
         """ Retrieves the `failed` status for all moves form the order
         collection whose target is in the given province.
         
         """
-        return [getattr(entry, attr) for entry in self.orders
-                if entry.name == 'move'
-                and entry.target.province is province
-                and entry.unit.owner != exclude_power]
+        return [getattr(entry, attr) for entry in self.moves_to(province)
+                if entry.unit.owner != exclude_power]
 
     def blocks(self):
         """ Returns the list or provinces which are blocked by a set of
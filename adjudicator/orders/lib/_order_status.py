@@ -2,90 +2,53 @@
 
 """
 
+from enum import IntEnum
 
-class OrderStatus:
-    """ An instance is the min/max status of an order.
-    
-    Parameters
-    ----------
-    status : string
-        The status at instantiation.
-    
-    Attributes
-    ----------
-    status : string
-        See Parameters.
-    
-    statuses : dictionary
-        Keys are possible statuses, and values are their numerical
-        values (which determine the ordering).
-    
-    The main purpose of this class is to allow orders statuses to be
-    strings, while still comparing them.
+
+class OrderStatus(IntEnum):
+    """ The min/max status of an order.
+
+    The statuses are integers, ordered from illegal to valid, such that
+    they compare as integers. They print as the strings 'illegal',
+    'broken', 'cut', 'no effect' and 'valid', and may be retrieved from
+    these strings, e.g. `OrderStatus('no effect')`.
+
+    The statuses are also available as the module constants `ILLEGAL`,
+    `BROKEN`, `CUT`, `NO_EFFECT` and `VALID`, which are faster to look up
+    than the class attributes.
 
     """
 
-    statuses = {
-        'valid': 4,
-        'no effect': 3,
-        'cut': 2,
-        'broken': 1,
-        'illegal': 0
-    }
-
-    def __init__(self, status):
-        """ Constructor.
- 
-        """
-        self.set(status)
+    ILLEGAL = 0
+    BROKEN = 1
+    CUT = 2
+    NO_EFFECT = 3
+    VALID = 4
 
     def __str__(self):
         """ Print format.
-        
-        """
-        return self.status
 
-    def set(self, value):
-        """ Sets the status to the entered value.
-        
         """
-        assert value in self.statuses
+        return self.name.lower().replace('_', ' ')
 
-        self.status = value        
+    def __format__(self, spec):
+        """ Format method; formats the printed status.
 
-    @property
-    def value(self):
-        """ Returns the numerical value of the status.
-        
         """
-        return self.statuses[self.status]
+        return format(str(self), spec)
+
+    @classmethod
+    def _missing_(cls, value):
+        """ Returns the status printed as a given string.
 
-    def __lt__(self, other):
-        """ Less than operator.
-        
-        """
-        try:
-            return self.value < other.value
-        
-        except AttributeError:
-            return self.value < self.statuses[other]
-
-    def __gt__(self, other):
-        """ Greater than operator.
-        
-        """
-        try:
-            return self.value > other.value
-        
-        except AttributeError:
-            return self.value > self.statuses[other]
-
-    def __eq__(self, other):
-        """ Equal to operator.
-        
         """
-        try:
-            return self.value == other.value
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper().replace(' ', '_'))
+        return None
+
 
-        except AttributeError:
-            return self.value == self.statuses[other]
+ILLEGAL = OrderStatus.ILLEGAL
+BROKEN = OrderStatus.BROKEN
+CUT = OrderStatus.CUT
+NO_EFFECT = OrderStatus.NO_EFFECT
+VALID = OrderStatus.VALID
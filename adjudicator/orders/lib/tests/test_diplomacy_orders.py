@@ -62,5 +62,140 @@ class TestOrders(unittest.TestCase):
         )
 
 
+class TestIndexes(unittest.TestCase):
+
+    def setUp(self):
+        self.hold = Mock()
+        self.hold.name = 'hold'
+        self.hold.province = 'A'
+        self.hold.unit = 'a'
+        self.hold.__object_key__ = MagicMock(return_value=('A', None))
+
+        self.move = Mock()
+        self.move.name = 'move'
+        self.move.province = 'B'
+        self.move.unit = 'b'
+        self.move.target.province = 'A'
+        self.move.__object_key__ = MagicMock(return_value=('B', 'A'))
+
+        self.support = Mock()
+        self.support.name = 'support'
+        self.support.province = 'C'
+        self.support.unit = 'c'
+        self.support.object_order.__object_key__ = MagicMock(
+            return_value=('B', 'A')
+        )
+
+        self.orders = DiplomacyOrders(
+            lambda x: x,
+            [self.hold, self.move, self.support]
+        )
+
+    def test_order_in(self):
+        self.assertIs(
+            self.orders.order_in('B'),
+            self.move
+        )
+
+    def test_clone(self):
+        for order in (self.hold, self.move, self.support):
+            order.clone = MagicMock(return_value=order)
+        units = {'a': 'a', 'b': 'b', 'c': 'c'}
+        clone = self.orders.clone(units)
+        self.move.clone.assert_called_once_with(units)
+        self.assertIsNot(clone.orders, self.orders.orders)
+        self.assertIs(clone.order_in('B'), self.move)
+        self.assertEqual(clone.aids(self.move, 'support'), [self.support])
+
+    def test_link(self):
+        for order in (self.hold, self.support):
+            order.__compute_hold_strengths__ = MagicMock()
+        self.orders.link()
+        self.assertTrue(self.orders.linked)
+        self.assertIs(self.support.supported, self.move)
+        self.hold.__compute_hold_strengths__.assert_called_once_with(
+            self.orders
+        )
+        self.orders.remove(self.hold)
+        self.assertFalse(self.orders.linked)
+
+    def test_order_in_require(self):
+        with self.assertRaises(ValueError):
+            self.orders.order_in('D', require=True)
+
+    def test_order_of(self):
+        self.assertIs(
+            self.orders.order_of('c'),
+            self.support
+        )
+
+    def test_moves_to(self):
+        self.assertEqual(
+            self.orders.moves_to('A'),
+            [self.move]
+        )
+
+    def test_aids(self):
+        self.assertEqual(
+            self.orders.aids(self.move, 'support'),
+            [self.support]
+        )
+        self.assertEqual(
+            self.orders.aids(self.hold, 'support'),
+            []
+        )
+
+    def test_remove(self):
+        self.orders.remove(self.move)
+
+        self.assertEqual(
+            self.orders.orders,
+            [self.hold, self.support]
+        )
+        self.assertIsNone(self.orders.order_in('B'))
+        self.assertEqual(self.orders.moves_to('A'), [])
+
+    def test_remove_unit(self):
+        self.orders.remove_unit('c')
+
+        self.assertIsNone(self.orders.order_of('c'))
+        self.assertEqual(self.orders.aids(self.move, 'support'), [])
+
+    def test_replace(self):
+        first = Mock()
+        first.name = 'hold'
+        first.province = 'A'
+        first.unit = 'a'
+        second = Mock()
+        second.name = 'hold'
+        second.province = 'B'
+        second.unit = 'b'
+        third = Mock()
+        third.name = 'hold'
+        third.province = 'A'
+        third.unit = 'a'
+
+        self.orders.replace([first, second, third])
+
+        self.assertEqual(
+            self.orders.orders,
+            [self.support, second, third]
+        )
+        self.assertIs(self.orders.order_of('a'), third)
+        self.assertIs(self.orders.order_in('B'), second)
+        self.assertEqual(self.orders.moves_to('A'), [])
+        self.assertEqual(self.orders.aids(self.move, 'support'),
+                         [self.support])
+
+    def test_insert(self):
+        self.orders.remove(self.move)
+        self.orders.insert(self.move)
+
+        self.assertIs(
+            self.orders.order_in('B'),
+            self.move
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -11,6 +11,12 @@ from unittest.mock import Mock, MagicMock
 from adjudicator.orders.lib import Order, OrderStatus
 
 
+class Concrete(Order):
+    """ An order without slots, such that the tests may set any attribute.
+
+    """
+
+
 class TestBoard(unittest.TestCase):
 
     @classmethod
@@ -22,7 +28,7 @@ class TestBoard(unittest.TestCase):
         pass
     
     def setUp(self):
-        self.order = Order()
+        self.order = Concrete()
         self.order._min_status = OrderStatus('illegal')
         self.order._max_status = OrderStatus('valid')
 
@@ -35,37 +41,61 @@ class TestBoard(unittest.TestCase):
     def test_min_status_getter(self):
         self.assertEqual(
             self.order.min_status,
-            'illegal'
+            OrderStatus.ILLEGAL
         )
         
     def test_min_status_setter(self):
-        self.order.min_status = 'valid'
+        self.order.min_status = OrderStatus.VALID
         self.assertEqual(
             self.order.min_status,
-            'valid'
+            OrderStatus.VALID
         )
 
     def test_max_status_getter(self):
         self.assertEqual(
             self.order.max_status,
-            'valid'
+            OrderStatus.VALID
         )
 
     def test_max_status_setter(self):
-        self.order.max_status.set('illegal')
+        self.order.max_status = OrderStatus.CUT
         self.assertEqual(
-            self.order.max_status.status,
-            'illegal'
+            self.order.max_status,
+            OrderStatus.CUT
         )
 
+    def test_min_status_setter_clamped(self):
+        self.order.max_status = OrderStatus.CUT
+        self.order.min_status = OrderStatus.VALID
+        self.assertIs(self.order.min_status, OrderStatus.CUT)
+
+    def test_max_status_setter_clamped(self):
+        self.order.min_status = OrderStatus.VALID
+        self.order.max_status = OrderStatus.BROKEN
+        self.assertIs(self.order.min_status, OrderStatus.BROKEN)
+        self.assertIs(self.order.max_status, OrderStatus.BROKEN)
+
+    def test___state__(self):
+        self.order.min_hold = 1
+        self.order.max_hold = 2
+        state = self.order.__state__()
+        self.order.min_status = OrderStatus.VALID
+        self.order.__restore__(state)
+        self.assertEqual(self.order.__state__(), state)
+        self.assertIs(self.order.min_status, OrderStatus.ILLEGAL)
+
     def test_reset(self):
-        self.order.min_status = 'valid'
-        self.order.max_status = 'illegal'
+        self.order.min_status = OrderStatus.VALID
+        self.order.max_status = OrderStatus.ILLEGAL
         self.order.reset()
         
         self.assertEqual(
-            self.order.min_status.status,
-            'illegal'
+            self.order.min_status,
+            OrderStatus.ILLEGAL
+        )
+        self.assertEqual(
+            self.order.max_status,
+            OrderStatus.VALID
         )
 
     def test_set_(self):
@@ -83,7 +113,7 @@ class TestBoard(unittest.TestCase):
         )
 
     def test___resolved___2(self):
-        self.order.max_status = 'illegal'
+        self.order.max_status = OrderStatus.ILLEGAL
         self.assertTrue(
             self.order.__resolved__('status')
         )
@@ -107,6 +137,17 @@ class TestBoard(unittest.TestCase):
             2
         )
 
+    def test_clone(self):
+        self.order.min_hold = 1
+        self.order.max_hold = 2
+        unit = Mock()
+        clone = self.order.clone({self.order.unit: unit})
+        clone.min_status = OrderStatus.VALID
+
+        self.assertIs(clone.unit, unit)
+        self.assertEqual(clone.max_hold, 2)
+        self.assertEqual(self.order.min_status, OrderStatus.ILLEGAL)
+
     def test_moves(self):
         self.assertFalse(
             self.order.moves()
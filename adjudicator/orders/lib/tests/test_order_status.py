@@ -6,7 +6,9 @@ The tests should be run from the base directory.
 
 import unittest
 
-from adjudicator.orders.lib import OrderStatus
+from adjudicator.orders.lib import (
+    OrderStatus, ILLEGAL, BROKEN, CUT, NO_EFFECT, VALID
+)
 
 class TestOrders(unittest.TestCase):
 
@@ -25,12 +27,11 @@ class TestOrders(unittest.TestCase):
         pass
 
     def test___init__(self):
-        self.assertEqual(
-            self.status.status,
-            'illegal'
-        )
-        
-        with self.assertRaises(AssertionError):
+        self.assertIs(self.status, OrderStatus.ILLEGAL)
+        self.assertIs(OrderStatus('no effect'), OrderStatus.NO_EFFECT)
+        self.assertIs(OrderStatus(4), OrderStatus.VALID)
+
+        with self.assertRaises(ValueError):
             OrderStatus('nothing')
 
     def test___str___(self):
@@ -38,64 +39,39 @@ class TestOrders(unittest.TestCase):
             self.status.__str__(),
             'illegal'
         )
-
-    def test_set_accepted(self):
-        self.status.set('cut')
-        self.assertEqual(
-            self.status.status,
-            'cut'
-        )
-
-    def test_set_declined(self):
-        with self.assertRaises(AssertionError):
-            self.status.set('wrong')
+        self.assertEqual(str(OrderStatus.NO_EFFECT), 'no effect')
+        self.assertEqual(f'{OrderStatus.CUT}', 'cut')
 
     def test_value(self):
         self.assertEqual(
             self.status.value,
-            self.status.statuses['illegal']
-        )
-    
-    def test___lt__class(self):
-        self.assertTrue(
-            self.status < OrderStatus('valid')
+            0
         )
 
-    def test___lt__string(self):
+    def test___lt__(self):
         self.assertTrue(
-            self.status < 'valid'
+            self.status < OrderStatus.VALID
         )
+        self.assertTrue(OrderStatus.CUT < OrderStatus.NO_EFFECT)
 
-    def test___gt__class(self):
+    def test___gt__(self):
         self.assertFalse(
-            self.status > OrderStatus('valid')
+            self.status > OrderStatus.VALID
         )
 
-    def test___gt__string(self):
+    def test___eq___1(self):
         self.assertFalse(
-            self.status > 'valid'
+            self.status == OrderStatus.VALID
         )
 
-    def test___eq__class_1(self):
-        self.assertFalse(
-            self.status == OrderStatus('valid')
-        )
-
-    def test___eq__class_2(self):
+    def test___eq___2(self):
         self.assertTrue(
             self.status == OrderStatus('illegal')
         )
 
-    def test___eq__string_1(self):
-        self.assertFalse(
-            self.status == 'valid'
-        )
-
-    def test___eq__string_2(self):
-        self.assertTrue(
-            self.status == 'illegal'
-        )
-
+    def test_constants(self):
+        self.assertEqual([ILLEGAL, BROKEN, CUT, NO_EFFECT, VALID],
+                         sorted(OrderStatus))
 
 if __name__ == '__main__':
     unittest.main()
@@ -10,6 +10,7 @@ import unittest
 from unittest.mock import Mock, MagicMock
 
 from adjudicator.orders import Convoy
+from adjudicator.orders.lib import OrderStatus
 
 
 class TestOrders(unittest.TestCase):
@@ -52,13 +53,13 @@ class TestOrders(unittest.TestCase):
     def test___init___3(self):
         self.assertEqual(
             self.convoy.max_status,
-            'valid'
+            OrderStatus.VALID
         )
 
     def test___init___4(self):
         self.assertEqual(
             self.convoy.min_status,
-            'illegal'
+            OrderStatus.ILLEGAL
         )
 
     def test___init___5(self):
@@ -87,7 +88,7 @@ class TestOrders(unittest.TestCase):
         
         self.assertEqual(
             self.convoy.max_status,
-            'illegal'
+            OrderStatus.ILLEGAL
         )
 
     def test___legalize___2(self):
@@ -98,7 +99,7 @@ class TestOrders(unittest.TestCase):
         
         self.assertEqual(
             self.convoy.max_status,
-            'illegal'
+            OrderStatus.ILLEGAL
         )
 
     def test___legalize___3(self):
@@ -112,7 +113,7 @@ class TestOrders(unittest.TestCase):
         
         self.assertEqual(
             self.convoy.min_status,
-            'broken'
+            OrderStatus.BROKEN
         )
 
     def test_resolve_dislodged_1(self):
@@ -13,6 +13,7 @@ import unittest
 from unittest.mock import Mock, MagicMock
 
 from adjudicator.orders import Hold
+from adjudicator.orders.lib import OrderStatus
 
 
 class TestOrders(unittest.TestCase):
@@ -52,14 +53,14 @@ class TestOrders(unittest.TestCase):
 
     def test___init___3(self):
         self.assertEqual(
-            self.order.max_status.status,
-            'valid'
+            self.order.max_status,
+            OrderStatus.VALID
         )
 
     def test___init___4(self):
         self.assertEqual(
-            self.order.min_status.status,
-            'illegal'
+            self.order.min_status,
+            OrderStatus.ILLEGAL
         )
 
     def test___init___5(self):
@@ -98,7 +99,7 @@ class TestOrders(unittest.TestCase):
 
     def test_resolved_2(self):
         self.order.max_hold = 1
-        self.order.min_status = 'valid'
+        self.order.min_status = OrderStatus.VALID
 
         self.assertTrue(
             self.order.resolved
@@ -107,6 +108,7 @@ class TestOrders(unittest.TestCase):
     def test_resolve(self):
         self.mock = Mock()
         self.mock.aids = MagicMock(return_value=[])
+        self.mock.linked = False
         self.mock.__iter__=MagicMock(return_value=[self.order])
     
         self.order.resolve(None, self.mock)
@@ -103,6 +103,21 @@ class TestOrders(unittest.TestCase):
             self.retreat.resolved
         )
 
+    def test___state__(self):
+        self.retreat.legal = True
+        self.retreat.disbands = True
+        state = self.retreat.__state__()
+
+        retreat = Retreat(3, self.game.units[0], [])
+        retreat.__restore__(state)
+        self.assertTrue(
+            retreat.resolved
+        )
+        self.assertEqual(
+            retreat.__state__(),
+            (True, True)
+        )
+
     def test_sort_string(self):
         self.assertEqual(
             self.retreat.sort_string,
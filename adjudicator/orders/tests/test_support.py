@@ -10,6 +10,7 @@ import unittest
 from unittest.mock import Mock, MagicMock
 
 from adjudicator.orders import Support
+from adjudicator.orders.lib import OrderStatus
 
 
 class TestOrders(unittest.TestCase):
@@ -54,13 +55,13 @@ class TestOrders(unittest.TestCase):
     def test___init___3(self):
         self.assertEqual(
             self.support.max_status,
-            'valid'
+            OrderStatus.VALID
         )
 
     def test___init___4(self):
         self.assertEqual(
             self.support.min_status,
-            'illegal'
+            OrderStatus.ILLEGAL
         )
 
     def test___init___5(self):
@@ -110,7 +111,7 @@ class TestOrders(unittest.TestCase):
         
         self.assertEqual(
             self.support.max_status,
-            'illegal'
+            OrderStatus.ILLEGAL
         )
 
     def test___resolve_attacked___1(self):
@@ -121,7 +122,7 @@ class TestOrders(unittest.TestCase):
         
         self.assertEqual(
             self.support.max_status,
-            'cut'
+            OrderStatus.CUT
         )
 
     def test___resolve_attacked___2(self):
@@ -132,7 +133,7 @@ class TestOrders(unittest.TestCase):
         
         self.assertEqual(
             self.support.min_status,
-            'valid'
+            OrderStatus.VALID
         )
 
     
@@ -0,0 +1,155 @@
+""" Monte Carlo rollouts of games over a process pool.
+
+A rollout plays a game from a given position until a winner is found or a
+number of years has passed, with orders given by a policy. The policy is a
+callable taking the game and a random number generator, which enters the
+orders of the current phase into the game, e.g. `random_policy`. Policies
+run in worker processes, so they must be picklable; i.e. functions defined
+at the top level of a module.
+
+Each worker loads the variant once, in a game which is restored to the
+starting position for every rollout.
+
+"""
+
+
+import os
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from random import Random
+
+from adjudicator import _workers
+from adjudicator.orders import Move
+
+
+def random_policy(game, rng):
+    """ Policy giving random orders: a random legal order to each unit in
+    diplomacy phases, a random retreat (or disband) to each dislodged unit,
+    and random builds in open home centers and disbands.
+
+    """
+    if game.season.phase == 'Diplomacy':
+        for unit in game.units:
+            game.orders.remove(game.orders.order_of(unit))
+            game.orders.insert(rng.choice(list(game.legal_orders(unit))))
+
+    elif game.season.phase == 'Retreats':
+        locations = game.variant.map.locations
+        for retreat in game.orders:
+            targets = [locations[k] for k in retreat.unit.location.connections
+                       if locations[k].province not in retreat.forbidden]
+            target = rng.choice(targets + [None])
+            if target is not None:
+                retreat.order = Move(retreat.unit, False, target)
+
+    elif game.season.phase == 'Builds':
+        locations = game.variant.map.locations
+        disbanded = []
+        for order in game.orders:
+            if order.name == 'disband':
+                units = [unit for unit in game.units_of(order.owner)
+                         if unit not in disbanded]
+                order.unit = rng.choice(units)
+                disbanded.append(order.unit)
+                continue
+            provinces = sorted(game.open_home_centers(order.owner),
+                               key=lambda province: province.name)
+            if len(provinces) == 0:
+                continue
+            province = rng.choice(provinces)
+            location = rng.choice([location for location in locations
+                                   if location.province is province])
+            order.force = location.force
+            order.location = location
+
+
+def _rollout(task):
+    """ Plays one rollout in the game of the worker process. Returns the
+    supply center counts, the name of the winner or None, and the number of
+    adjudicated phases.
+
+    """
+    snapshot, policy, years, seed = task
+    game = _workers.game
+    game.restore(snapshot)
+    rng = Random(seed)
+    year = game.season.year + years
+    phases = 0
+
+    while game.winner is None and game.season.year < year:
+        policy(game, rng)
+        game.adjudicate(mute=True)
+        phases += 1
+
+    centers = {power.name: len(game.supply_centers[power])
+               for power in game.powers}
+    winner = None if game.winner is None else game.winner.name
+
+    return centers, winner, phases
+
+
+def rollouts(game, policy, n, years=10, workers=None, seed=0):
+    """ Plays rollouts from the current position of a game, which is not
+    changed, and returns aggregated statistics.
+
+    Parameters
+    ----------
+    game : Game
+        A game at the start of a diplomacy or build phase.
+
+    policy : callable
+        The policy giving the orders of every phase; see the module
+        documentation.
+
+    n : integer
+        The number of rollouts.
+
+    years : integer, optional
+        The number of years after which a rollout without winner is
+        stopped. Default is 10.
+
+    workers : integer, optional
+        The number of worker processes. If 0, the rollouts are played in
+        the current process. Default is None; the number of processors.
+
+    seed : integer, optional
+        The seed of the first rollout; rollout k uses `seed + k`, such that
+        the results do not depend on the number of workers. Default is 0.
+
+    Returns
+    -------
+    dictionary
+        A dictionary with the number of `rollouts`, the number of `wins` of
+        each power, the number of rollouts without winner as `unfinished`,
+        the mean supply center counts of the powers as `centers`, and the
+        mean number of adjudicated `phases`.
+
+    """
+    snapshot = game.snapshot()
+    tasks = [(snapshot, policy, years, seed + k) for k in range(n)]
+    initargs = (game.variant.name, game.engine)
+
+    if workers == 0:
+        _workers.initialize(*initargs)
+        results = [_rollout(task) for task in tasks]
+    else:
+        workers = os.cpu_count() if workers is None else workers
+        chunksize = max(1, n // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_workers.initialize,
+                                 initargs=initargs) as executor:
+            results = list(executor.map(_rollout, tasks,
+                                        chunksize=chunksize))
+
+    wins = Counter(winner for _, winner, _ in results if winner is not None)
+
+    return {
+        'rollouts': n,
+        'wins': {power.name: wins[power.name] for power in game.powers},
+        'unfinished': sum(1 for _, winner, _ in results if winner is None),
+        'centers': {power.name: sum(centers[power.name]
+                                    for centers, _, _ in results) / max(n, 1)
+                    for power in game.powers},
+        'phases': sum(phases for _, _, phases in results) / max(n, 1),
+    }
@@ -102,6 +102,17 @@ class TestBoard(unittest.TestCase):
             self.location.reaches_province(province)
         )
 
+    def test_reached(self):
+        self.assertEqual(
+            self.location.reached,
+            frozenset(self.map.locations[k].province
+                      for k in self.location.connections)
+        )
+        self.assertEqual(
+            self.location.connected,
+            frozenset(self.location.connections)
+        )
+
     def test_named(self):
         location = self.map.locations[-23]
         self.assertTrue(
@@ -223,6 +223,39 @@ class TestBoard(unittest.TestCase):
             'Spain (north coast)'
         )
 
+    def test_locate_abbreviation(self):
+        fleet = self.ClassicMap.instance(
+            'Fleet',
+            Force
+        )
+        army = self.ClassicMap.instance(
+            'Army',
+            Force
+        )
+
+        self.assertIs(
+            self.ClassicMap.locate(fleet, 'Nwy'),
+            self.ClassicMap.locate(fleet, 'Norway')
+        )
+        self.assertEqual(
+            [str(location) for location
+             in self.ClassicMap.located[fleet, 'Spa']],
+            ['Spain (north coast)', 'Spain (south coast)']
+        )
+        self.assertIsNone(
+            self.ClassicMap.locate(army, 'NTH')
+        )
+
+    def test_located(self):
+        game_map = self.ClassicMap
+        for force in game_map.forces:
+            for name in [location.name for location in game_map.locations]:
+                self.assertEqual(
+                    list(game_map.located.get((force, name), ())),
+                    [location for location in game_map.locations
+                     if location.named(name) and location.force is force]
+                )
+
     def test_one_adjacent(self):
         force = self.ClassicMap.instance(
             'Fleet',
@@ -279,5 +312,113 @@ class TestBoard(unittest.TestCase):
             self.ClassicMap.has_path(source, target, [])
         )
 
+    def test_has_path_bitset(self):
+        game_map = self.ClassicMap
+        source = game_map.instance('Brest', Province)
+        target = game_map.instance('Norway', Province)
+        force = game_map.instance('Fleet', Force)
+        channel, sea, baltic = [
+            game_map.locate(force, name) for name in
+            ('English Channel', 'North Sea', 'Baltic Sea')
+        ]
+        fleets = game_map.bitset([channel, sea])
+        self.assertEqual(fleets, (1 << channel.id) | (1 << sea.id))
+
+        memo = {}
+        self.assertTrue(game_map.has_path(source, target, fleets, memo))
+        self.assertEqual(memo, {(source, target, fleets): True})
+        self.assertFalse(game_map.has_path(source, target,
+                                           game_map.bitset([sea, baltic]),
+                                           memo))
+        self.assertEqual(len(memo), 2)
+
+        # The memo is trusted.
+        memo[source, target, fleets] = False
+        self.assertFalse(game_map.has_path(source, target, fleets, memo))
+
+    def test_convoy_path(self):
+        game_map = self.ClassicMap
+        source = game_map.instance('Brest', Province)
+        target = game_map.instance('Norway', Province)
+        force = game_map.instance('Fleet', Force)
+        channel, sea, baltic, irish = [
+            game_map.locate(force, name) for name in
+            ('English Channel', 'North Sea', 'Baltic Sea', 'Irish Sea')
+        ]
+        self.assertEqual(
+            game_map.convoy_path(source, target, [sea, baltic, irish, channel]),
+            [channel, sea]
+        )
+        self.assertIsNone(game_map.convoy_path(source, target, [sea, baltic]))
+
+    def test_convoy_reach(self):
+        source = self.ClassicMap.instance(
+            'Brest',
+            Province
+        )
+        force = self.ClassicMap.instance(
+            'Fleet',
+            Force
+        )
+        channel, sea, baltic = [
+            self.ClassicMap.locate(force, name) for name in
+            ('English Channel', 'North Sea', 'Baltic Sea')
+        ]
+
+        self.assertEqual(
+            self.ClassicMap.convoy_reach(source, [baltic, sea, channel]),
+            [channel, sea]
+        )
+
+    def test_neighbours(self):
+        game_map = self.ClassicMap
+        for location in game_map.locations:
+            self.assertEqual(game_map.neighbours[location.id],
+                             game_map.bitset([game_map.locations[k] for k
+                                              in location.connections]))
+        province = game_map.instance('Brest', Province)
+        self.assertEqual(
+            game_map.reaching[province],
+            game_map.bitset([location for location in game_map.locations
+                             if location.reaches_province(province)])
+        )
+
+    def test_tables(self):
+        game_map = self.ClassicMap
+        locations = len(game_map.locations)
+        provinces = len(game_map.provinces)
+
+        self.assertEqual(game_map.adjacency.shape, (locations, locations))
+        self.assertEqual(game_map.reaches.shape, (locations, provinces))
+        self.assertEqual(len(game_map.location_provinces), locations)
+
+        for location in game_map.locations:
+            for k in range(locations):
+                self.assertEqual(
+                    game_map.adjacency[location.id, k],
+                    location.reaches_location(k)
+                )
+            for k, province in enumerate(game_map.provinces):
+                self.assertEqual(
+                    game_map.reaches[location.id, k],
+                    location.reaches_province(province)
+                )
+
+    def test_province_adjacency(self):
+        game_map = self.ClassicMap
+        army = game_map.instance('Army', Force)
+        fleet = game_map.instance('Fleet', Force)
+        index = {province: k for k, province
+                 in enumerate(game_map.provinces)}
+        paris, picardy, brest, channel = [
+            index[game_map.instance(name, Province)] for name in
+            ('Paris', 'Picardy', 'Brest', 'English Channel')
+        ]
+
+        self.assertTrue(game_map.province_adjacency[army][paris, picardy])
+        self.assertFalse(game_map.province_adjacency[fleet][paris, picardy])
+        self.assertTrue(game_map.province_adjacency[fleet][brest, channel])
+        self.assertFalse(game_map.province_adjacency[army][brest, channel])
+
 if __name__ == '__main__':
     unittest.main()
@@ -64,6 +64,23 @@ class TestBoard(unittest.TestCase):
             'North Africa'
         )
 
+    def test_move_to_game(self):
+        locations = []
+
+        class Game:
+            def __toggle_unit__(self, unit):
+                locations.append(unit.location.name)
+
+        self.unit.game = Game()
+        self.unit.move_to(
+            self.variant.map.locations[65]
+        )
+
+        self.assertEqual(
+            locations,
+            ['Norway', 'North Africa']
+        )
+
     def test_reaches(self):
         lid = self.unit.location.connections[0]
         location = self.variant.map.locations[lid]
@@ -4,9 +4,12 @@ The tests should be run from the base directory.
 
 """
 
+import os
+import sys
+import tempfile
 import unittest
 
-from adjudicator import Power, Variant, Map
+from adjudicator import Map, Power, Season, Variant, Zobrist
 
 class TestBoard(unittest.TestCase):
 
@@ -87,5 +90,142 @@ class TestBoard(unittest.TestCase):
             'Germany'
         )
 
+    def test_get(self):
+        variant = Variant.get('Classic')
+        self.assertTrue(
+            variant.loaded
+        )
+        self.assertIs(
+            Variant.get('Classic'),
+            variant
+        )
+        self.assertIsNot(
+            Variant.get('RPS'),
+            variant
+        )
+
+    def test_compile(self):
+        with tempfile.TemporaryDirectory() as folder:
+            variant = Variant('Classic')
+            variant.artifacts = folder
+            variant.load()
+            self.assertEqual(
+                os.listdir(folder),
+                []
+            )
+
+            variant.matcher
+            variant.instance('France', Power)
+            variant.compile()
+            self.assertTrue(
+                os.path.isfile(variant.__artifact__())
+            )
+
+            compiled = Variant('Classic')
+            compiled.artifacts = folder
+            self.assertTrue(
+                compiled.__load_artifact__()
+            )
+            self.assertTrue(
+                compiled.loaded
+            )
+            self.assertNotIn(
+                '_matcher',
+                vars(compiled)
+            )
+            self.assertEqual(
+                compiled.names,
+                {}
+            )
+            self.assertEqual(
+                compiled.instance('France', Power).name,
+                'France'
+            )
+            self.assertEqual(
+                [location.name for location in compiled.map.locations],
+                [location.name for location in self.variant.map.locations]
+            )
+            self.assertEqual(
+                compiled.map.locations[5].connected,
+                self.variant.map.locations[5].connected
+            )
+            self.assertIs(
+                compiled.map.locations[5].map,
+                compiled.map
+            )
+            self.assertEqual(
+                compiled.zobrist.units[compiled.powers[1],
+                                       compiled.map.locations[7]],
+                self.variant.zobrist.units[self.variant.powers[1],
+                                           self.variant.map.locations[7]]
+            )
+
+    def test_compile_corrupt(self):
+        with tempfile.TemporaryDirectory() as folder:
+            variant = Variant('Classic')
+            variant.artifacts = folder
+            variant.compile()
+
+            with open(variant.__artifact__(), 'r+b') as file:
+                file.seek(-1, os.SEEK_END)
+                file.write(b'\x00')
+
+            compiled = Variant('Classic')
+            compiled.artifacts = folder
+            self.assertFalse(
+                compiled.__load_artifact__()
+            )
+
+            # Loading falls back to the JSON files, without recompiling.
+            compiled.load()
+            self.assertTrue(
+                compiled.loaded
+            )
+            self.assertFalse(
+                compiled.__load_artifact__()
+            )
+
+            compiled.compile()
+            self.assertTrue(
+                compiled.__load_artifact__()
+            )
+
+    def test_compile_stale(self):
+        with tempfile.TemporaryDirectory() as folder:
+            variant = Variant('Classic')
+            variant.artifacts = folder
+            variant.compile()
+
+            stale = Variant('Classic')
+            stale.artifacts = folder
+            stale.artifact_version = variant.artifact_version + 1
+            self.assertFalse(
+                stale.__load_artifact__()
+            )
+
+    def test_digest(self):
+        paths = [module.__file__ for module in Variant.__modules__()]
+        self.assertIn(
+            sys.modules[Season.__module__].__file__,
+            paths
+        )
+        self.assertIn(
+            sys.modules[Zobrist.__module__].__file__,
+            paths
+        )
+
+    def test_load_json(self):
+        with tempfile.TemporaryDirectory() as folder:
+            variant = Variant('Classic')
+            variant.artifacts = folder
+            variant.load(compiled=False)
+            self.assertTrue(
+                variant.loaded
+            )
+            self.assertEqual(
+                os.listdir(folder),
+                []
+            )
+
 if __name__ == '__main__':
     unittest.main()
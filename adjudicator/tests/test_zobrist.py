@@ -0,0 +1,82 @@
+""" Unittests for the Zobrist class.
+
+The tests should be run from the base directory.
+
+"""
+
+import unittest
+
+from adjudicator import Season, Unit, Variant, Zobrist
+
+class TestBoard(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.variant = Variant('Classic')
+        cls.variant.load()
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+    
+    def setUp(self):
+        self.zobrist = Zobrist(self.variant)
+    
+    def tearDown(self):
+        pass
+
+    def test__init__(self):
+        self.assertEqual(
+            len(self.zobrist.units),
+            len(self.variant.powers) * len(self.variant.map.locations)
+        )
+        self.assertEqual(
+            len(self.zobrist.centers),
+            len(self.variant.powers) * len(self.variant.map.supply_centers)
+        )
+        keys = (list(self.zobrist.units.values())
+                + list(self.zobrist.centers.values())
+                + list(self.zobrist.seasons.values()))
+        self.assertEqual(
+            len(set(keys)),
+            len(keys)
+        )
+        self.assertTrue(
+            all(0 <= key < 2**64 for key in keys)
+        )
+
+    def test_seed(self):
+        self.assertEqual(
+            Zobrist(self.variant).units,
+            self.zobrist.units
+        )
+        self.assertNotEqual(
+            Zobrist(self.variant, seed='other').units,
+            self.zobrist.units
+        )
+
+    def test_unit(self):
+        power = self.variant.powers[0]
+        location = self.variant.map.locations[68]
+        unit = Unit(1, power, location.force, location)
+        self.assertEqual(
+            self.zobrist.unit(unit),
+            self.zobrist.units[power, location]
+        )
+
+    def test_season(self):
+        season = Season(1901)
+        pregame = self.zobrist.season(season)
+        season.progress()
+        self.assertNotEqual(
+            self.zobrist.season(season),
+            pregame
+        )
+        season.progress(5)
+        self.assertEqual(
+            self.zobrist.season(season),
+            self.zobrist.seasons['Spring', 'Diplomacy']
+        )
+
+if __name__ == '__main__':
+    unittest.main()
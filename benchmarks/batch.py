@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" Benchmark comparing the batch adjudicator with the Game class.
+
+Random positions on the Classic map are generated from a seed, as in the
+engines benchmark, and given random orders, including convoys and moves via
+convoy. The positions are resolved one by one by the Game class, and all at
+once by the batch adjudicator, and the results are compared. The time of
+the batch adjudicator includes encoding the positions, and the positions
+it resolves with the Game class are counted.
+
+Run from the root of the repository:
+
+    python3 benchmarks/batch.py [positions] [seed]
+
+"""
+
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, '.')
+
+import adjudicator.game as gm
+
+from adjudicator.batch import BatchAdjudicator
+from adjudicator.orders.lib import OrderStatus
+from engines import random_position, random_orders
+
+
+def results(orders):
+    """ Function returning the successful orders and dislodged units of a
+    resolved list of orders, as encoded by the batch adjudicator.
+
+    """
+    cols = {order.province: col for col, order in enumerate(orders)}
+    succeeded = np.zeros(len(orders), dtype=bool)
+    dislodged = np.zeros(len(orders), dtype=bool)
+
+    for col, order in enumerate(orders):
+        if order.name == 'move':
+            succeeded[col] = order.moves()
+            attacked = cols.get(order.target.province)
+            if order.moves() and attacked is not None:
+                dislodged[attacked] = not orders[attacked].moves()
+        else:
+            succeeded[col] = order.name == 'hold' or (
+                order.resolved and order.max_status == OrderStatus.VALID
+            )
+
+    return succeeded, dislodged
+
+
+if __name__ == '__main__':
+    positions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    game = gm.Game('Classic')
+    game.start()
+    batch = BatchAdjudicator(game.variant)
+    rng = random.Random(seed)
+
+    elapsed = 0.
+    listed = []
+    for _ in range(positions):
+        random_position(game, rng)
+        for order in random_orders(game, rng):
+            game.orders.remove(game.orders.order_of(order.unit))
+            game.orders.insert(order)
+        listed.append(list(game.orders))
+
+        start = time.perf_counter()
+        game.__resolve_diplomacy__()
+        elapsed += time.perf_counter() - start
+
+    print(f'game         {1000 * elapsed:8.1f} ms ({positions} positions)')
+
+    start = time.perf_counter()
+    locations, owners, orders = batch.encode(listed)
+    succeeded, dislodged = batch.adjudicate(locations, owners, orders)
+    elapsed = time.perf_counter() - start
+
+    mismatches = 0
+    for row, entry in enumerate(listed):
+        success, dislodgement = results(entry)
+        if not (np.array_equal(succeeded[row, :len(entry)], success)
+                and np.array_equal(dislodged[row, :len(entry)], dislodgement)):
+            mismatches += 1
+
+    convoys = sum(any(order.name == 'convoy' for order in entry)
+                  for entry in listed)
+    print(f'batch        {1000 * elapsed:8.1f} ms '
+          f'({positions} positions, {convoys} with convoys, '
+          f'{batch.fallbacks} by the game, {mismatches} mismatches)')
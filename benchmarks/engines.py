@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" Benchmark comparing the adjudication engines of the Game class.
+
+Two workloads are timed. Random positions on the Classic map are
+generated from a seed and given random orders; each position is
+adjudicated by every engine, and the resulting order archives are compared.
+The DATC test cases of `tests/test_adjudicator_DATC.py` are run with every
+engine, timing the resolution of each case, and the failing cases are
+counted.
+
+Run from the root of the repository:
+
+    python3 benchmarks/engines.py [positions] [seed] [--cases]
+
+With `--cases`, the timings of the DATC cases are listed case by case.
+
+"""
+
+import random
+import sys
+import time
+import unittest
+
+sys.path.insert(0, '.')
+sys.path.insert(0, 'tests')
+
+import adjudicator.game as gm
+
+from adjudicator.orders import Hold, Move, Support, Convoy
+
+
+def random_position(game, rng):
+    """ Function to place random units on the map of a game.
+
+    """
+    game.clear()
+    provinces = list(game.variant.map.provinces)
+    rng.shuffle(provinces)
+
+    for province in provinces[:rng.randint(10, 34)]:
+        locations = [location for location in game.variant.map.locations
+                     if location.province is province]
+        location = rng.choice(locations)
+        game.add_unit(location.force, rng.choice(game.powers), location)
+
+
+def random_orders(game, rng):
+    """ Function returning a random order for each unit of a game.
+
+    """
+    locations = game.variant.map.locations
+    orders = []
+
+    for unit in game.units:
+        value = rng.random()
+        others = [other for other in game.units if other is not unit]
+
+        if value < 0.35 or len(others) == 0:
+            target = locations[rng.choice(unit.location.connections)]
+            orders.append(Move(unit, False, target))
+
+        elif value < 0.45 and unit.force.name == 'Army':
+            targets = [location for location in locations
+                       if location.force is unit.force
+                       and location is not unit.location]
+            orders.append(Move(unit, True, rng.choice(targets)))
+
+        elif value < 0.75:
+            other = rng.choice(others)
+            if rng.random() < 0.5:
+                orders.append(Support(unit, Hold(other)))
+            else:
+                target = locations[rng.choice(other.location.connections)]
+                orders.append(Support(unit, Move(other, False, target)))
+
+        elif value < 0.85 and 'Convoy' in unit.location.geography.orders:
+            armies = [other for other in others if other.force.name == 'Army']
+            if len(armies) == 0:
+                orders.append(Hold(unit))
+                continue
+            army = rng.choice(armies)
+            targets = [location for location in locations
+                       if location.force is army.force
+                       and location is not army.location]
+            orders.append(Convoy(unit, Move(army, True, rng.choice(targets))))
+
+        else:
+            orders.append(Hold(unit))
+
+    return orders
+
+
+def run(engine, positions, seed):
+    """ Function to resolve the orders of the random positions with an
+    engine. Returns the total time spent resolving and the order archives.
+
+    """
+    game = gm.Game('Classic', engine=engine)
+    game.start()
+    rng = random.Random(seed)
+    elapsed = 0.
+    archives = []
+
+    for _ in range(positions):
+        random_position(game, rng)
+        for order in random_orders(game, rng):
+            game.orders.remove(game.orders.order_of(order.unit))
+            game.orders.insert(order)
+
+        start = time.perf_counter()
+        game.__resolve_diplomacy__()
+        elapsed += time.perf_counter() - start
+
+        game.__archive_orders__()
+        archives.append(game.order_archive.last())
+
+    return elapsed, archives
+
+
+def run_datc(engine):
+    """ Function to run the DATC test cases with an engine. Returns a
+    dictionary whose keys are the names of the cases, and whose values are
+    pairs of the time spent resolving the orders of the case and whether
+    the case passed.
+
+    """
+    import test_adjudicator_DATC as datc
+
+    class Case(datc.TestAdjudicator):
+
+        @classmethod
+        def setUpClass(cls):
+            cls.gameFvA = gm.Game('ClassicFvA', 'Test', 0, engine=engine)
+            cls.game = gm.Game('Classic', 'Test', 0, engine=engine)
+
+    resolve = gm.Game.__resolve_diplomacy__
+    elapsed = [0.]
+
+    def timed(game):
+        start = time.perf_counter()
+        resolve(game)
+        elapsed[0] += time.perf_counter() - start
+
+    results = {}
+    gm.Game.__resolve_diplomacy__ = timed
+    try:
+        Case.setUpClass()
+        for name in unittest.TestLoader().getTestCaseNames(Case):
+            elapsed[0] = 0.
+            result = unittest.TestResult()
+            Case(name).run(result)
+            results[name] = (elapsed[0], result.wasSuccessful())
+    finally:
+        gm.Game.__resolve_diplomacy__ = resolve
+
+    return results
+
+
+if __name__ == '__main__':
+    cases = '--cases' in sys.argv
+    arguments = [entry for entry in sys.argv[1:] if entry != '--cases']
+    positions = int(arguments[0]) if len(arguments) > 0 else 200
+    seed = int(arguments[1]) if len(arguments) > 1 else 0
+
+    results = {engine: run(engine, positions, seed)
+               for engine in gm.Game.engines}
+    reference = results[gm.Game.engines[0]][1]
+
+    for engine, (elapsed, archives) in results.items():
+        mismatches = sum(1 for entry, other in zip(archives, reference)
+                         if entry != other)
+        print(f'{engine:<12} {1000 * elapsed:8.1f} ms '
+              f'({positions} positions, {mismatches} mismatches)')
+
+    datc = {engine: run_datc(engine) for engine in gm.Game.engines}
+
+    if cases:
+        print(f'{"case":<12}' + ''.join(f'{engine:>14}'
+                                        for engine in gm.Game.engines))
+        for name in datc[gm.Game.engines[0]]:
+            print(f'{name[5:]:<12}'
+                  + ''.join(f'{1000 * datc[engine][name][0]:11.3f} ms'
+                            for engine in gm.Game.engines))
+
+    for engine, results in datc.items():
+        elapsed = sum(entry for entry, _ in results.values())
+        failures = sum(1 for _, passed in results.values() if not passed)
+        print(f'{engine:<12} {1000 * elapsed:8.1f} ms '
+              f'({len(results)} DATC cases, {failures} failures)')
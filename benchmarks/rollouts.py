@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" Benchmark of the rollout throughput, in the current process and over a
+process pool with one worker per processor.
+
+Run from the root of the repository:
+
+    python3 benchmarks/rollouts.py [rollouts] [years]
+
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, '.')
+
+import adjudicator.game as gm
+
+from adjudicator.rollouts import random_policy, rollouts
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    years = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    game = gm.Game('Classic')
+    game.start()
+
+    for workers in (0, os.cpu_count()):
+        start = time.perf_counter()
+        results = rollouts(game, random_policy, n, years, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f'{workers:>2} workers {n / elapsed:8.1f} rollouts/s '
+              f'({results["phases"]:.1f} phases per rollout)')
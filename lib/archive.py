@@ -6,6 +6,11 @@ games.
 """
 
 
+from copy import copy
+
+from adjudicator import (Unit, Variant)
+
+
 class Archive:
     """ An Archive is a collection of entries, stored in a list.
 
@@ -23,6 +28,16 @@ class Archive:
         """
         self.entries = []
 
+    def copy(self):
+        """ Returns a copy of the archive. The entries are shared, but the
+        list of entries is not.
+
+        """
+        archive = copy(self)
+        archive.entries = list(self.entries)
+
+        return archive
+
     def __iter__(self):
         """ Iterator.
         
@@ -86,43 +101,239 @@ class OrderArchive(Archive):
                 for order in self.last()]
 
 class PositionArchive(Archive):
-    """ A PositionArchive is a collection of positions, stored as dictionaries
-    of strings.
-    
+    """ A PositionArchive is a collection of positions, stored as the
+    changes between consecutive positions, with every `interval`-th position
+    stored in full as a keyframe.
+
+    A position is a set of units and a set of supply center ownerships,
+    stored as integers: a unit of the power with index `p` in the location
+    with id `k` is `k * P + p`, where `P` is the number of powers, and the
+    power with index `p` owning the province with index `k` is `k * P + p`.
+    The force of a unit is given by its location.
+
+    Parameters
+    ----------
+    interval : integer, optional
+        The number of entries between keyframes. Default is 16. It is fixed
+        at construction, as the keyframes of the entries depend on it.
+
+    Attributes
+    ----------
+    entries : list of tuples
+        The entries; pairs of the season name, phase and year, and the
+        units removed, the units added, the ownerships removed and the
+        ownerships added since the previous position.
+
+    keyframes : dictionary
+        A dictionary whose keys are the indexes of the keyframes, and whose
+        values are pairs of the tuples of the units and the ownerships.
+
+    last_units : set
+        The units of the last position.
+
+    last_centers : set
+        The ownerships of the last position.
+
+    variant_name : string
+        The name of the variant of the positions, set by `enter`.
+
+    variant : Variant
+        The variant of the positions, whose powers and provinces are indexed
+        in the dictionaries `powers` and `provinces`. These are not pickled,
+        but retrieved again by `variant_name` when needed.
+
     """
 
+    def __init__(self, interval=16):
+        """ Constructor.
+
+        """
+        super().__init__()
+        self._interval = interval
+        self.variant_name = None
+        self.variant = None
+        self.powers = {}
+        self.provinces = {}
+        self.reset()
+
+    def reset(self):
+        """ Method to reset to an empty archive.
+
+        """
+        self.entries = []
+        self.keyframes = {}
+        self.last_units = set()
+        self.last_centers = set()
+
+    def copy(self):
+        """ Returns a copy of the archive. The entries are shared, but the
+        list of entries is not.
+
+        """
+        archive = Archive.copy(self)
+        # Copying goes through `__getstate__`, which drops the variant.
+        archive.variant = self.variant
+        archive.powers = self.powers
+        archive.provinces = self.provinces
+        archive.keyframes = dict(self.keyframes)
+        archive.last_units = set(self.last_units)
+        archive.last_centers = set(self.last_centers)
+
+        return archive
+
+    @property
+    def interval(self):
+        """ interval getter.
+
+        """
+        return self._interval
+
+    def __getstate__(self):
+        """ Returns the state to pickle, without the variant and its
+        indexes.
+
+        """
+        state = dict(self.__dict__)
+        state.update(variant=None, powers={}, provinces={})
+
+        return state
+
     def __str__(self, k=None):
         """ Print method.
         
         """
         if k is None:
-            return str(self.entries)
+            return str([self.loc(n) for n in range(len(self))])
         else:
             return str(self.loc(k))
 
+    def __tables__(self, variant):
+        """ Method to compute the indexes of the powers and provinces of a
+        variant, once.
+
+        """
+        if self.variant is variant:
+            return
+        self.variant_name = variant.name
+        self.variant = variant
+        self.powers = {power: k for k, power in enumerate(variant.powers)}
+        self.provinces = {province: k for k, province
+                          in enumerate(variant.map.provinces)}
+
+    def encode(self, game):
+        """ Returns the sets of the units and the ownerships of the current
+        position of a game.
+
+        """
+        self.__tables__(game.variant)
+        size = len(self.powers)
+        units = {unit.location.id * size + self.powers[unit.owner]
+                 for unit in game.units}
+        centers = {self.provinces[province] * size + self.powers[power]
+                   for power, provinces in game.supply_centers.items()
+                   for province in provinces}
+
+        return units, centers
+
     def enter(self, game):
-        """ Enters dictionary with the game's current position into the archive.
+        """ Enters the changes to the game's current position into the
+        archive.
 
         """
-        dcnry = {'season': game.season.name,
-                 'phase': game.season.phase,
-                 'year': game.season.year,
-                 'units': [{'force': str(unit.force), 'power': str(unit.owner),
-                            'location': unit.location.id} for unit in game.units],
-                 'centers': {str(power): [str(province) for province in
-                                          game.supply_centers[power]]
-                             for power in game.powers}}
-        self.entries.append(dcnry)
+        units, centers = self.encode(game)
+        self.entries.append(((game.season.name, game.season.phase,
+                              game.season.year),
+                             (tuple(self.last_units - units),
+                              tuple(units - self.last_units),
+                              tuple(self.last_centers - centers),
+                              tuple(centers - self.last_centers))))
+        if (len(self.entries) - 1) % self._interval == 0:
+            self.keyframes[len(self.entries) - 1] = (tuple(units),
+                                                     tuple(centers))
+        self.last_units = units
+        self.last_centers = centers
+
+    def rollback(self, k=1):
+        """ Rolls back k entries, by undoing their changes to the last
+        position.
+
+        """
+        for _ in range(k):
+            _, (removed, added, lost, won) = self.entries.pop()
+            self.keyframes.pop(len(self.entries), None)
+            self.last_units.difference_update(added)
+            self.last_units.update(removed)
+            self.last_centers.difference_update(won)
+            self.last_centers.update(lost)
+
+    def position(self, k):
+        """ Returns the sets of the units and the ownerships of the kth
+        entry, from the nearest keyframe before it, or from the last entry
+        if it is nearer.
+
+        """
+        k = k % len(self.entries)
+        start = k - k % self._interval
+        if len(self.entries) - 1 - k < k - start:
+            units, centers = set(self.last_units), set(self.last_centers)
+            for _, (removed, added, lost, won) in self.entries[:k:-1]:
+                units.difference_update(added)
+                units.update(removed)
+                centers.difference_update(won)
+                centers.update(lost)
+            return units, centers
+
+        units, centers = (set(entry) for entry in self.keyframes[start])
+        for _, (removed, added, lost, won) in self.entries[start + 1:k + 1]:
+            units.difference_update(removed)
+            units.update(added)
+            centers.difference_update(lost)
+            centers.update(won)
+
+        return units, centers
+
+    def loc(self, k):
+        """ Retrieves the kth entry as a dictionary of strings and location
+        ids.
+
+        """
+        (name, phase, year), _ = self.entries[k]
+        units, centers = self.position(k)
+        if self.variant is None:
+            self.__tables__(Variant.get(self.variant_name))
+        powers = self.variant.powers
+        provinces = self.variant.map.provinces
+        locations = self.variant.map.locations
+        size = len(powers)
+
+        owned = {str(power): [] for power in powers}
+        for entry in sorted(centers):
+            province, power = divmod(entry, size)
+            owned[str(powers[power])].append(str(provinces[province]))
+
+        return {'season': name,
+                'phase': phase,
+                'year': year,
+                'units': [{'force': str(locations[location].force),
+                           'power': str(powers[power]),
+                           'location': location}
+                          for location, power
+                          in (divmod(entry, size) for entry in sorted(units))],
+                'centers': owned}
 
     def centers(self, game):
-        """ Returns the dictionary of supply centers with all entries into
-        classes.
+        """ Returns the dictionary of supply centers of the last entry.
         
         """
-        dcnry = self.last()['centers']
-        return {game.variant.instance(key, 'powers'):
-                set(game.variant.map.instances(dcnry[key], 'provinces'))
-                for key in dcnry}
+        self.__tables__(game.variant)
+        powers = game.variant.powers
+        provinces = game.variant.map.provinces
+        dcnry = {power: set() for power in powers}
+        for entry in self.last_centers:
+            province, power = divmod(entry, len(powers))
+            dcnry[powers[power]].add(provinces[province])
+
+        return dcnry
 
     def units(self):
         """ Returns the list of units in the last entry of the archive.
@@ -131,11 +342,25 @@ class PositionArchive(Archive):
         return self.last()['units']
 
     def setup(self, game):
-        """ Setup the game according to the last entry in the archive.
+        """ Setup the game according to the last entry in the archive. The
+        units of the game which are in the last entry are kept, and only
+        the other units are created.
         
         """
+        units, _ = self.encode(game)
+        size = len(self.powers)
+        powers = game.variant.powers
+        locations = game.variant.map.locations
+
+        kept = [unit for unit in game.units
+                if unit.location.id * size + self.powers[unit.owner]
+                in self.last_units]
+        for entry in self.last_units - units:
+            location, power = divmod(entry, size)
+            location = locations[location]
+            kept.append(Unit(game.__next_unit_id__(), powers[power],
+                             location.force, location, game))
+
         game.supply_centers = self.centers(game)
-        game.units = []
+        game.units = kept
         game.__setup__()
-        for entry in self.units():
-            game.add_unit(**entry, overrule=True)
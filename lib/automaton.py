@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" This module contains the Automaton class, which finds the appearances
+of many words in a string in a single pass, by the algorithm of Aho and
+Corasick.
+
+"""
+
+from collections import deque
+
+
+class Automaton:
+    """ An Aho-Corasick automaton of a set of words.
+
+    Parameters
+    ----------
+    words : iterable of strings
+        The words to be found.
+
+    Attributes
+    ----------
+    words : frozenset of strings
+        See Parameters.
+
+    goto : list of dictionaries
+        The transitions of the states of the automaton; the dictionary of
+        a state maps characters to states. State 0 is the root.
+
+    fail : list of integers
+        The state reached from each state on a character without
+        transition, i.e. the state of the longest proper suffix.
+
+    output : list of tuples
+        The words ending in each state.
+
+    """
+
+    def __init__(self, words):
+        """ Constructor.
+
+        """
+        self.words = frozenset(words)
+        self.goto = [{}]
+        self.output = [()]
+
+        for word in sorted(self.words):
+            state = 0
+            for char in word:
+                following = self.goto[state].get(char)
+                if following is None:
+                    following = len(self.goto)
+                    self.goto[state][char] = following
+                    self.goto.append({})
+                    self.output.append(())
+                state = following
+            self.output[state] += (word,)
+
+        # Compute the failure transitions in breadth first order, such that
+        # the failure transitions of shorter suffixes are known.
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while len(queue) > 0:
+            state = queue.popleft()
+            for char, following in self.goto[state].items():
+                queue.append(following)
+                fail = self.fail[state]
+                while fail != 0 and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+                if state != 0:
+                    self.fail[following] = self.goto[fail].get(char, 0)
+                self.output[following] += self.output[self.fail[following]]
+
+    def find(self, string):
+        """ Returns the appearances of the words in a string; see `Matches`.
+
+        """
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        found = Matches(self.words)
+
+        state = 0
+        for end, char in enumerate(string, 1):
+            while state != 0 and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for word in output[state]:
+                try:
+                    found[word].append(end - len(word))
+                except KeyError:
+                    found[word] = [end - len(word)]
+
+        return found
+
+
+class Matches(dict):
+    """ A dictionary whose keys are the words of an automaton appearing in a
+    string, and whose values are the (possibly overlapping) positions of
+    their appearances, in increasing order.
+
+    Parameters / Attributes
+    -----------------------
+    words : frozenset of strings
+        The words of the automaton.
+
+    """
+
+    def __init__(self, words):
+        """ Constructor.
+
+        """
+        super().__init__()
+        self.words = words
@@ -8,6 +8,7 @@ the position of the object in the string.
 """
 
 import re
+from functools import lru_cache
 from lib.errors import OrderInputError
 
 
@@ -39,6 +40,16 @@ class DecoratedItem:
             pass
 
 
+@lru_cache(maxsize=None)
+def literal(word):
+    """ Returns the lower case string matched by a word when searched for as
+    a regular expression. The only special characters appearing in the
+    words of the variants are the parentheses of specifiers, such as
+    '(south coast)', which are not matched.
+
+    """
+    return word.lower().replace('(', '').replace(')', '')
+
 def __appearances__(string, words):
     """ Returns the appearances of words in a string as a (unsorted) list of 
     decorated items.
@@ -65,19 +76,72 @@ def __first_appearances__(string, words):
     return answer
 
 
+def __matched_appearances__(literals, matches, first=False):
+    """ Returns the (first) appearances of words as a list of decorated
+    items, given the positions of their literals, as found by an automaton;
+    see `lib.automaton.Automaton.find`. The literals are given as a
+    dictionary whose values are the lists of pairs of the index and the
+    word of a literal. The items are sorted by position, and then by index,
+    as if the words had been searched for one by one.
+
+    """
+    answer = []
+    for string, positions in matches.items():
+        for index, word in literals.get(string, ()):
+            if first:
+                answer.append((positions[0], index, word))
+                continue
+            # The matches may overlap, unlike those of `re.finditer`.
+            end = 0
+            for pos in positions:
+                if pos >= end:
+                    answer.append((pos, index, word))
+                    end = pos + len(string)
+    answer.sort()
+    return [DecoratedItem(word, pos) for pos, _, word in answer]
+
+# The words of immutable collections of objects; see `__vocabulary__`.
+__vocabularies__ = {}
+
+def __vocabulary__(objects):
+    """ Returns the words of a collection of objects, the dictionary of the
+    objects by word, and the dictionary of the words by literal. Cached for
+    immutable collections, e.g. the tuples of provinces of the maps.
+
+    """
+    try:
+        return __vocabularies__[objects]
+    except (KeyError, TypeError):
+        pass
+    words = [str(obj) for obj in objects]
+    literals = {}
+    for index, word in enumerate(words):
+        literals.setdefault(literal(word), []).append((index, word))
+    vocabulary = (words, dict(zip(words, objects)), literals)
+    if isinstance(objects, (tuple, range)):
+        __vocabularies__[objects] = vocabulary
+    return vocabulary
+
+
 class ItemList:
     """ An iterable collection of decorated items, initiated from a string
     and a collection of objects.
+
+    The appearances of the objects may be given as `matches`, the result of
+    `lib.automaton.Automaton.find` on the lower case string, which is used
+    if the literals of all words are words of the automaton. Otherwise, the
+    string is searched for each word.
     
     """
 
-    def __init__(self, string, objects, first=False):
+    def __init__(self, string, objects, first=False, matches=None):
         """ Constructor.
         
         """
-        self.words = [str(obj) for obj in objects]
-        self.dictionary = dict(zip(self.words, objects))
-        if first:
+        self.words, self.dictionary, literals = __vocabulary__(objects)
+        if matches is not None and literals.keys() <= matches.words:
+            self.item_list = __matched_appearances__(literals, matches, first)
+        elif first:
             self.item_list = __first_appearances__(string, self.words)
         else:
             self.item_list = __appearances__(string, self.words)
@@ -29,6 +29,19 @@ def first_named(objects, name):
 
 
 
+def name_index(objects):
+    """ From a list of objects, return a dictionary whose keys are names
+    and whose values are the first objects with the given names.
+
+    """
+    index = {}
+    for obj in objects:
+        index.setdefault(obj.name, obj)
+    return index
+
+
+
+
 def flatten(lists):
     """ Flattens a list of lists on the first level.
 
@@ -17,6 +17,10 @@ class Parser:
 
     """
 
+    # The translations of words by the dictionaries of abbreviations, by
+    # map; see `__translation__`.
+    translations = {}
+
     def __init__(self, string, game):
         """ Constructor.
  
@@ -25,17 +29,45 @@ class Parser:
         self.map = game.variant.map
         self.string = self.__deabbreviate__(string)
 
+    @property
+    def matches(self):
+        """ The appearances of the words of the variant in the string; see
+        `lib.itemlist.ItemList`. Found on first use.
+
+        """
+        try:
+            return self._matches
+
+        except AttributeError:
+            self._matches = self.game.variant.matcher.find(self.string)
+            return self._matches
+
+    def __translation__(self):
+        """ Returns a dictionary translating words as `translate` does with
+        the dictionaries of the game and the map, in one lookup.
+
+        """
+        orders_dict, translation = self.translations.get(self.map,
+                                                         (None, None))
+        if orders_dict is not self.game.orders_dict:
+            orders_dict = self.game.orders_dict
+            dicts = (orders_dict, self.map.abbreviations,
+                     self.map.force_abbreviations)
+            keys = [key for dictionary in dicts for key in dictionary]
+            translation = dict(zip(keys, translate(list(keys), *dicts)))
+            self.translations[self.map] = (orders_dict, translation)
+
+        return translation
+
     def __deabbreviate__(self, string):
         """ Takes a string input form a user and adjusts to the format assumed
         by the formatting methods. Also replaces abbreviations with their
         full lenght counterparts.
 
         """
+        translation = self.__translation__()
         words = [word.replace('.', '') for word in string.split(' ')]
-        words = translate(words, 
-                          self.game.orders_dict, 
-                          self.map.abbreviations,
-                          self.map.force_abbreviations)        
+        words = [translation.get(word, word) for word in words]
         # Due to spaces in province names, we need the whole string.
         return ' '.join(words).lower()
 
@@ -51,7 +83,8 @@ class Parser:
                 try:
                     obj.orders
                 except AttributeError:
-                    obj.orders = ItemList(obj.string, obj.map.orders)
+                    obj.orders = ItemList(obj.string, obj.map.orders,
+                                          matches=obj.matches)
                 return func(*args, **kwargs)
             return load_orders_wrapper
 
@@ -65,7 +98,8 @@ class Parser:
                 try:
                     obj.provinces
                 except AttributeError:
-                    obj.provinces = ItemList(obj.string, obj.map.provinces, first=True)
+                    obj.provinces = ItemList(obj.string, obj.map.provinces,
+                                             first=True, matches=obj.matches)
                 return func(*args, **kwargs)
             return load_provinces_wrapper
 
@@ -79,7 +113,8 @@ class Parser:
                 try:
                     obj.powers
                 except AttributeError:
-                    obj.powers = ItemList(obj.string, obj.game.powers)
+                    obj.powers = ItemList(obj.string, obj.game.powers,
+                                          matches=obj.matches)
                 return func(*args, **kwargs)
             return load_powers_wrapper
 
@@ -96,7 +131,8 @@ class Parser:
                 try:
                     obj.numbers
                 except AttributeError:
-                    obj.numbers = ItemList(obj.string, range(10))
+                    obj.numbers = ItemList(obj.string, range(10),
+                                           matches=obj.matches)
                 return func(*args, **kwargs)
             return load_numbers_wrapper
 
@@ -116,7 +152,8 @@ class Parser:
                         specifiers = obj.previous.unit.specifiers
                     else:
                         specifiers = obj.forces.loc(0).specifiers
-                obj.specifiers = ItemList(obj.string, specifiers)
+                obj.specifiers = ItemList(obj.string, specifiers,
+                                          matches=obj.matches)
                 return func(*args, **kwargs)
             return load_specifiers_wrapper
 
@@ -130,7 +167,8 @@ class Parser:
                 try:
                     obj.forces
                 except AttributeError:
-                    obj.forces = ItemList(obj.string, obj.game.forces)
+                    obj.forces = ItemList(obj.string, obj.game.forces,
+                                          matches=obj.matches)
                 return func(*args, **kwargs)
             return load_forces_wrapper
 
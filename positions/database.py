@@ -8,7 +8,7 @@
 import pandas as pd
 
 from positions.parser import GameFile
-from adjudicator.variant import Variant
+from adjudicator import Variant
 from lib.errors import OrderInputError
 
 
@@ -29,8 +29,7 @@ class PositionsDB():
         """ Constructor.
 
         """
-        self.variant = Variant(variant)
-        self.variant.load()
+        self.variant = Variant.get(variant)
         self.folder = folder
         self.host = host
         self.powers = [power.name for power in self.variant.powers]
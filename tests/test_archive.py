@@ -3,9 +3,13 @@
 """ Unittests for the archive module.
 """
 
+import pickle
 import unittest
 import adjudicator.game as gm
 
+from adjudicator import Force
+from lib.archive import PositionArchive
+
 
 class TestAdjudicator(unittest.TestCase) :
 
@@ -29,6 +33,59 @@ class TestAdjudicator(unittest.TestCase) :
         for key in centers:
             self.assertEqual(centers[key], self.game.supply_centers[key])
 
+    def test_PositionArchive_loc(self):
+        self.game.order(['A Par - Bur', 'A Mun - Ruh', 'F Kie - Den'])
+        self.game.adjudicate()
+        self.game.order(['A Bur - Bel', 'F Den S A Ruh - Hol',
+                         'A Ruh - Hol'])
+        self.game.adjudicate()
+        archive = self.game.position_archive
+        self.assertEqual(len(archive), 5)
+        self.assertEqual(archive.loc(0)['phase'], 'Diplomacy')
+        self.assertEqual(archive.loc(0)['year'], 1901)
+        units = {unit['location'] for unit in archive.loc(0)['units']}
+        army = self.game.instance('Army', Force)
+        self.assertIn(self.game.locate(army, 'Paris').id, units)
+        self.assertEqual(archive.last()['phase'], 'Builds')
+        self.assertIn('Holland', archive.last()['centers']['Germany'])
+        units = {unit['location'] for unit in archive.last()['units']}
+        self.assertEqual(
+            units, {unit.location.id for unit in self.game.units}
+        )
+
+    def test_PositionArchive_keyframes(self):
+        original = self.game.position_archive
+        self.addCleanup(setattr, self.game, 'position_archive', original)
+        archive = self.game.position_archive = PositionArchive(interval=2)
+        archive.enter(self.game)
+        for _ in range(2):
+            self.game.adjudicate()
+        self.assertEqual(sorted(archive.keyframes), [0, 2, 4])
+        positions = [archive.loc(k) for k in range(len(archive))]
+        archive.rollback(2)
+        self.assertEqual(sorted(archive.keyframes), [0, 2])
+        self.assertEqual(archive.last(), positions[-3])
+        with self.assertRaises(AttributeError):
+            archive.interval = 16
+
+    def test_PositionArchive_pickle(self):
+        self.game.adjudicate()
+        archive = self.game.position_archive
+        state = pickle.dumps(archive)
+        self.assertNotIn(b'Variant', state)
+        restored = pickle.loads(state)
+        self.assertEqual(restored.variant_name, 'Classic')
+        self.assertEqual([restored.loc(k) for k in range(len(restored))],
+                         [archive.loc(k) for k in range(len(archive))])
+
+    def test_PositionArchive_copy(self):
+        self.game.adjudicate()
+        archive = self.game.position_archive.copy()
+        archive.rollback()
+        self.assertEqual(len(self.game.position_archive), 3)
+        self.assertEqual(self.game.position_archive.last()['season'],
+                         'Fall')
+
 if __name__ == '__main__':
     unittest.main()
         
\ No newline at end of file
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" Unittests for the automaton module.
+"""
+
+import unittest
+
+from lib.automaton import Automaton, Matches
+
+
+class TestAutomaton(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pass
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+    
+    def setUp(self):
+        self.automaton = Automaton(['he', 'she', 'his', 'hers'])
+    
+    def tearDown(self):
+        pass
+
+    def test_find(self):
+        matches = self.automaton.find('ushers and his sheep')
+        self.assertIsInstance(matches, Matches)
+        self.assertEqual(matches, {'she': [1, 15], 'he': [2, 16],
+                                   'hers': [2], 'his': [11]})
+        self.assertEqual(matches.words, {'he', 'she', 'his', 'hers'})
+
+    def test_find_overlapping(self):
+        automaton = Automaton(['aa', 'a'])
+        self.assertEqual(automaton.find('aaa'),
+                         {'a': [0, 1, 2], 'aa': [0, 1]})
+
+    def test_find_none(self):
+        self.assertEqual(self.automaton.find(''), {})
+        self.assertEqual(self.automaton.find('xyz'), {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" Unittests for the batch module. The DATC tests are re-run, and for
+every adjudicated diplomacy phase the results of the batch adjudicator are
+compared with the results of the game.
+"""
+
+import unittest
+
+import numpy as np
+
+import adjudicator.game as gm
+import test_adjudicator_DATC as datc
+
+from adjudicator.batch import BatchAdjudicator
+from adjudicator.orders.lib import OrderStatus
+
+
+class TestBatchAdjudicator(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.game = gm.Game('Classic')
+        cls.batch = BatchAdjudicator(cls.game.variant)
+
+    def setUp(self):
+        self.game.reset()
+        self.game.start()
+
+    def locate(self, name):
+        army = self.game.instance('Army', 'force')
+        return self.game.locate(army, name).id
+
+    def test_encode(self):
+        self.game.order(['Berlin move to Kiel',
+                         'Munich supports Berlin move to Kiel',
+                         'Kiel supports Munich holds'])
+        locations, owners, orders = self.batch.encode([self.game.orders])
+        self.assertEqual(locations.shape, (1, 22))
+        self.assertEqual(orders.shape, (1, 22, 3))
+        moves = orders[0, :, 0] == BatchAdjudicator.MOVE
+        self.assertEqual(list(locations[0][moves]), [self.locate('Berlin')])
+        self.assertEqual(list(orders[0][moves][0]),
+                         [BatchAdjudicator.MOVE, -1, self.locate('Kiel')])
+
+    def test_adjudicate(self):
+        berlin, kiel, munich = (self.locate(name) for name in
+                                ('Berlin', 'Kiel', 'Munich'))
+        burgundy, ruhr = self.locate('Burgundy'), self.locate('Ruhr')
+        move, support = BatchAdjudicator.MOVE, BatchAdjudicator.SUPPORT
+        locations = [[berlin, munich, burgundy, ruhr],
+                     [berlin, munich, burgundy, -1]]
+        owners = [[0, 0, 1, 0], [0, 0, 1, 0]]
+        orders = [[[move, -1, kiel], [move, -1, burgundy],
+                   [move, -1, munich], [support, munich, burgundy]],
+                  [[move, -1, munich], [move, -1, burgundy],
+                   [move, -1, munich], [-1, -1, -1]]]
+        succeeded, dislodged = self.batch.adjudicate(locations, owners, orders)
+        np.testing.assert_array_equal(succeeded, [[1, 1, 0, 1], [0, 0, 0, 0]])
+        np.testing.assert_array_equal(dislodged, [[0, 0, 1, 0], [0, 0, 0, 0]])
+
+    def test_adjudicate_convoy(self):
+        fleet = self.game.instance('Fleet', 'force')
+        london, norway = self.locate('London'), self.locate('Norway')
+        belgium = self.locate('Belgium')
+        north_sea = self.game.locate(fleet, 'North Sea').id
+        moves, convoy = BatchAdjudicator.CONVOYED_MOVE, BatchAdjudicator.CONVOY
+        locations = [[london, north_sea], [london, north_sea], [london, -1]]
+        owners = [[0, 0], [0, 0], [0, 0]]
+        orders = [[[moves, -1, norway], [convoy, london, norway]],
+                  [[moves, -1, norway], [convoy, london, belgium]],
+                  [[moves, -1, norway], [-1, -1, -1]]]
+        succeeded, dislodged = self.batch.adjudicate(locations, owners, orders)
+        np.testing.assert_array_equal(succeeded, [[1, 1], [0, 0], [0, 0]])
+        np.testing.assert_array_equal(dislodged, [[0, 0], [0, 0], [0, 0]])
+        self.assertEqual(self.batch.fallbacks, 0)
+
+
+class TestBatchDATC(datc.TestAdjudicator):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.batches = {game: BatchAdjudicator(game.variant)
+                       for game in (cls.game, cls.gameFvA)}
+
+    def setUp(self):
+        super().setUp()
+        for game in (self.game, self.gameFvA):
+            game.adjudicate = self.checked(game)
+
+    def tearDown(self):
+        for game in (self.game, self.gameFvA):
+            del game.adjudicate
+
+    def checked(self, game):
+        """ Wraps the adjudicate method of a game, such that the results of
+        diplomacy phases are compared with those of the batch adjudicator.
+
+        """
+        def adjudicate(*args, **kwargs):
+            if game.season.phase != 'Diplomacy':
+                return gm.Game.adjudicate(game, *args, **kwargs)
+
+            orders = game.orders
+            listed = list(orders)
+            cols = {order.unit: col for col, order in enumerate(listed)}
+            batch = self.batches[game]
+            succeeded, dislodged = batch.adjudicate(*batch.encode([listed]))
+            gm.Game.adjudicate(game, *args, **kwargs)
+
+            for col, order in enumerate(listed):
+                if order.name == 'move':
+                    expected = order.moves()
+                    attacked = orders.order_in(order.target.province)
+                    if expected and attacked is not None:
+                        self.assertEqual(dislodged[0, cols[attacked.unit]],
+                                         not attacked.moves())
+                elif order.name == 'hold':
+                    expected = True
+                else:
+                    expected = order.resolved and order.max_status == OrderStatus.VALID
+                self.assertEqual(succeeded[0, col], expected, str(order))
+
+        return adjudicate
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" Unittests for the cache module.
+"""
+
+import unittest
+
+import adjudicator.game as gm
+
+from adjudicator.cache import AdjudicationCache
+
+
+class TestAdjudicationCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.game = gm.Game('Classic')
+
+    def setUp(self):
+        self.cache = AdjudicationCache(maxsize=2)
+        self.game.cache = self.cache
+        self.game.reset()
+        self.game.start()
+
+    def tearDown(self):
+        self.game.cache = None
+
+    def play(self, orders, game=None):
+        game = self.game.clone() if game is None else game
+        game.order(orders)
+        game.adjudicate(mute=True)
+        return game
+
+    def test_hit(self):
+        orders = ['A Ber - Sil', 'A Mun S A Ber - Sil', 'A War - Sil']
+        first = self.play(orders)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+        second = self.play(orders)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(second.order_archive.entries,
+                         first.order_archive.entries)
+        self.assertEqual([str(unit) for unit in second.units],
+                         [str(unit) for unit in first.units])
+        self.assertEqual(second.position_hash, first.position_hash)
+
+    def test_order_set(self):
+        self.play(['A Ber - Sil'])
+        self.play(['A Ber - Kie'])
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+        game = self.play(['A Ber - Sil', 'A Mun - Ruh'])
+        self.assertEqual(self.cache.hits, 0)
+        self.assertIn('German Army in Munich move to Ruhr (succeeds).',
+                      game.order_archive.loc(0))
+
+    def test_retreats(self):
+        orders = ['A Par - Pic', 'A Mar - Gas', 'A Mun - Bur']
+        spring = [self.play(orders) for _ in range(2)]
+        orders = ['A Pic - Bur', 'A Gas S A Pic - Bur']
+        fall = [self.play(orders, game) for game in spring]
+        self.assertEqual(fall[1].season.phase, 'Retreats')
+        for game in fall:
+            self.play('A Bur - Ruh', game)
+        self.assertEqual((self.cache.hits, self.cache.misses), (3, 3))
+        self.assertEqual(fall[1].order_archive.entries,
+                         fall[0].order_archive.entries)
+        self.assertEqual([str(unit) for unit in fall[1].units],
+                         [str(unit) for unit in fall[0].units])
+        self.assertIn('German Army in Ruhr.',
+                      [str(unit) for unit in fall[1].units])
+
+    def test_maxsize(self):
+        for orders in ('A Ber - Sil', 'A Ber - Kie', 'A Ber - Pru'):
+            self.play(orders)
+        self.assertEqual(len(self.cache), 2)
+        self.play('A Ber - Sil')
+        self.play('A Ber - Pru')
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 4))
+
+    def test_builds(self):
+        self.play(['F Kie - Den'], self.game)
+        game = self.play(['F Den H'], self.game)
+        self.assertEqual(game.season.phase, 'Builds')
+        misses = self.cache.misses
+        game.order('Germany B 1 A Kie')
+        game.adjudicate(mute=True)
+        self.assertEqual(self.cache.misses, misses)
+
+    def test_clear(self):
+        self.play('A Ber - Sil')
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
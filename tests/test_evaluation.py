@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" Unittests for the evaluation module.
+"""
+
+import unittest
+
+import adjudicator.game as gm
+
+from adjudicator import Power
+from adjudicator.evaluation import evaluate
+
+
+class TestEvaluation(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.game = gm.Game('Classic')
+
+    def setUp(self):
+        self.game.reset()
+        self.game.start()
+        self.france = self.game.instance('France', Power)
+        self.candidates = [['A Par - Bur', 'A Mar - Spa', 'F Bre - MAO'],
+                           ['A Par - Bur', 'A Mar S A Par - Bur',
+                            'F Bre - ENG'],
+                           ['A Par - Pic']]
+        self.opponents = ['A Mun - Bur', 'F Lon - ENG']
+
+    def test_evaluate(self):
+        outcomes = evaluate(self.game, self.france, self.candidates,
+                            self.opponents, workers=0)
+        self.assertEqual(outcomes, [
+            {'moves': 2, 'dislodged': 0, 'centers': 1},
+            {'moves': 1, 'dislodged': 0, 'centers': 0},
+            {'moves': 1, 'dislodged': 0, 'centers': 0},
+        ])
+        self.assertEqual(self.game.__unresolved_count__(), 22)
+
+    def test_evaluate_convoy(self):
+        self.game.delete_unit('Brest')
+        self.game.delete_unit('London')
+        self.game.add_unit('Army', 'France', 'Brest')
+        self.game.add_unit('Fleet', 'France', 'English Channel')
+        candidate = ['A Bre - Lon via convoy', 'F ENG C A Bre - Lon']
+        outcomes = evaluate(self.game, self.france,
+                            [candidate, candidate[::-1]], workers=0)
+        self.assertEqual(outcomes, [
+            {'moves': 1, 'dislodged': 0, 'centers': 1},
+            {'moves': 1, 'dislodged': 0, 'centers': 1},
+        ])
+
+    def test_workers(self):
+        local = evaluate(self.game, self.france, self.candidates,
+                         self.opponents, workers=0)
+        pooled = evaluate(self.game, self.france, self.candidates,
+                          self.opponents, workers=2)
+        self.assertEqual(local, pooled)
+
+
+if __name__ == '__main__':
+    unittest.main()
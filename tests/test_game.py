@@ -23,6 +23,8 @@ import unittest
 import io
 import sys
 
+from collections import deque
+
 import adjudicator.game as gm
 
 from geopandas import GeoDataFrame
@@ -33,10 +35,12 @@ from adjudicator import (
 from adjudicator.orders import (
     Build, Disband
 )
+from adjudicator.orders.lib import OrderStatus
 
 from lib.itemlist import ItemList
 from lib.archive import (OrderArchive, PositionArchive)
 from lib.classes import dict_string
+from lib.errors import OrderInputError
 
 
 class TestAdjudicator(unittest.TestCase) :
@@ -149,12 +153,208 @@ class TestAdjudicator(unittest.TestCase) :
         self.assertIn(order, orders)
         self.assertEqual(self.gameRPS.season.name, 'Spring')
 
+    def test_rollback_phases(self):
+        self.game.order(['A Par - Bur', 'F Kie - Den'])
+        self.game.adjudicate()
+        self.game.order(['A Bur - Bel', 'F Den - Swe'])
+        self.game.adjudicate()
+        self.assertEqual(self.game.season.phase, 'Builds')
+        self.game.rollback(4)
+        units = [unit.__str__() for unit in self.game.units]
+        self.assertIn('French Army in Paris.', units)
+        self.assertNotIn('German Fleet in Denmark.', units)
+        self.assertEqual(len(self.game.position_archive), 1)
+        self.assertEqual(len(self.game.order_archive), 0)
+        orders = [order.__str__() for order in self.game.orders]
+        self.assertIn('French Army in Paris move to Burgundy [unresolved].',
+                      orders)
+        self.assertEqual(self.game.position_archive.last(),
+                         self.game.current_position())
+
     def test_rollback_winner(self):
         self.game.adjudicate()
         self.game.winner = self.game.powers[0]
         self.game.rollback()
         self.assertIsNone(self.game.winner)
 
+    def test_shared_variant(self):
+        game = gm.Game('Classic')
+        self.assertIs(game.variant, self.game.variant)
+        self.assertIs(game.variant, gm.Variant.get('Classic'))
+        self.assertIsNot(game.variant, self.gameFvA.variant)
+        self.assertIsNot(game.units, self.game.units)
+
+    def test_clone(self):
+        self.gameRPS.order('A Mon - Fre')
+        clone = self.gameRPS.clone()
+        self.assertIs(clone.variant, self.gameRPS.variant)
+        self.assertIs(clone.units, self.gameRPS.units)  # Reads do not copy.
+        self.assertIs(clone.unit_in('Monrovia'),
+                      self.gameRPS.unit_in('Monrovia'))
+        clone.adjudicate()
+        self.assertIsNot(clone.units, self.gameRPS.units)
+        self.assertIsNot(clone.orders, self.gameRPS.orders)
+        units = [unit.__str__() for unit in clone.units]
+        self.assertIn('Liberian Army in Freetown.', units)
+        units = [unit.__str__() for unit in self.gameRPS.units]
+        self.assertIn('Liberian Army in Monrovia.', units)
+        self.assertEqual(self.gameRPS.season.__str__(),
+                         'Diplomacy in Spring 1990.')
+        self.assertEqual(len(self.gameRPS.position_archive), 1)
+        self.assertEqual(len(self.gameRPS.order_archive), 0)
+
+    def test_clone_orders(self):
+        self.gameRPS.order('A Mon - Fre')
+        clone = self.gameRPS.clone()
+        clone.order('A Mon H')
+        self.gameRPS.adjudicate()
+        orders = [order.__str__() for order in clone.orders]
+        self.assertIn('Liberian Army in Monrovia holds [unresolved].', orders)
+        for order in clone.orders:
+            self.assertIn(order.unit, clone.units)
+
+    def test_clone_delete_unit(self):
+        clone = self.gameRPS.clone()
+        unit = clone.unit_in('Monrovia')  # Shared with the game.
+        clone.delete_unit(unit)
+        self.assertIsNone(clone.unit_in('Monrovia'))
+        self.assertIs(self.gameRPS.unit_in('Monrovia'), unit)
+        self.assertIs(unit.game, self.gameRPS)
+        self.assertEqual(len(self.gameRPS.orders), len(clone.orders) + 1)
+
+    def test_clone_supply_centers(self):
+        clone = self.gameRPS.clone()
+        power = self.gameRPS.powers[0]
+        clone.supply_centers[power].clear()
+        self.assertEqual(len(self.gameRPS.supply_centers[power]), 1)
+
+    def test_position_hash(self):
+        start = self.game.position_hash
+        self.game.order(['A Ber - Sil', 'F Kie - Den'])
+        self.game.adjudicate()
+        self.assertNotEqual(self.game.position_hash, start)
+        moved = self.game.position_hash
+        self.game.__rehash__()
+        self.assertEqual(self.game.position_hash, moved)
+        season = self.game.variant.zobrist.season(self.game.season)
+        self.assertEqual(self.game.position_hash ^ season, self.game._zobrist)
+
+    def test_position_hash_transposition(self):
+        game = gm.Game('Classic')
+        game.start()
+        self.assertEqual(game.position_hash, self.game.position_hash)
+        self.game.clear()
+        game.clear()
+        for entry in self.game.variant.starting_positions[:3]:
+            self.game.add_unit(**entry)
+        for entry in reversed(game.variant.starting_positions[:3]):
+            game.add_unit(**entry)
+        self.assertEqual(game.position_hash, self.game.position_hash)
+        game.delete_unit(game.units[0])
+        self.assertNotEqual(game.position_hash, self.game.position_hash)
+
+    def test_position_hash_clone(self):
+        start = self.gameRPS.position_hash
+        self.gameRPS.order('A Mon - Fre')
+        clone = self.gameRPS.clone()
+        self.assertEqual(clone.position_hash, start)
+        self.gameRPS.order('A Mon H')  # The game copies, the clone does not.
+        clone.adjudicate()
+        moved = clone.position_hash
+        clone.__rehash__()
+        self.assertEqual(clone.position_hash, moved)
+        self.assertNotEqual(moved, start)
+        self.assertEqual(self.gameRPS.position_hash, start)
+
+    def test_legal_orders(self):
+        unit = self.game.unit_in('Marseilles')
+        orders = [order.__str__() for order in self.game.legal_orders(unit)]
+        self.assertEqual(orders[:4], [
+            'French Army in Marseilles holds [unresolved].',
+            'French Army in Marseilles move to Burgundy [unresolved].',
+            'French Army in Marseilles move to Gascony [unresolved].',
+            'French Army in Marseilles move to Piedmont [unresolved].'
+        ])
+        self.assertIn('French Army in Marseilles supports the move Paris to '
+                      'Burgundy [unresolved].', orders)
+        self.assertIn('French Army in Marseilles move to Spain '
+                      '[unresolved].', orders)
+        self.assertEqual(len(orders), 10)
+        unit = self.game.unit_in('Saint Petersburg')
+        targets = [order.target.name for order in
+                   self.game.legal_orders(unit) if order.name == 'move']
+        self.assertEqual(sorted(targets),
+                         ['Finland', 'Gulf of Bothnia', 'Livonia'])
+
+    def test_legal_orders_convoy(self):
+        self.game.clear()
+        self.game.add_units([['Army', 'England', 'London'],
+                             ['Fleet', 'England', 'North Sea'],
+                             ['Fleet', 'France', 'Brest'],
+                             ['Fleet', 'France', 'Mid-Atlantic Ocean']])
+        army, fleet, _, atlantic = self.game.units
+        targets = [order.target.name for order in
+                   self.game.legal_orders(atlantic) if order.name == 'move']
+        self.assertIn('Spain (north coast)', targets)
+        self.assertIn('Spain (south coast)', targets)
+        moves = [order for order in self.game.legal_orders(army)
+                 if order.name == 'move' and order.convoy]
+        self.assertIn('Norway', [order.target.name for order in moves])
+        self.assertNotIn('Brest', [order.target.name for order in moves])
+        convoys = list(self.game.legal_orders(fleet))
+        convoys = [order for order in convoys if order.name == 'convoy']
+        self.assertEqual(len(convoys), len(moves))
+        self.game.order(['A Lon - Nwy via convoy', 'F North Sea C A Lon - Nwy'])
+        self.game.adjudicate()
+        self.assertEqual(army.location.name, 'Norway')
+
+    def test_legal_orders_moves(self):
+        for power in self.game.powers:
+            for order in self.game.legal_orders_of(power):
+                if order.name != 'move':
+                    continue
+                game = self.game.clone()
+                order = game.set_order(order.unit, gm.Game.__spec__(order))
+                game.__resolve_diplomacy__()
+                self.assertNotEqual(order.max_status, OrderStatus.ILLEGAL,
+                                    str(order))
+
+    def test_legal_orders_cache(self):
+        unit = self.game.units[0]
+        next(self.game.legal_orders(unit))
+        self.assertEqual(len(self.game._legal_orders), 0)
+        orders = [order.__str__() for order in self.game.legal_orders(unit)]
+        self.assertEqual(len(self.game._legal_orders), 1)
+        clone = self.game.clone()
+        self.assertEqual(
+            [order.__str__() for order in clone.legal_orders(clone.units[0])],
+            orders
+        )
+        self.assertIs(next(clone.legal_orders(clone.units[0])).unit,
+                      clone.units[0])
+        self.assertEqual(len(self.game._legal_orders), 1)
+
+    def test_snapshot(self):
+        self.game.order(['A Ber - Kie', 'F Kie - Den'])
+        self.game.adjudicate()
+        self.game.order(['F Den H'])
+        self.game.adjudicate()
+        snapshot = self.game.snapshot()
+        game = gm.Game('Classic')
+        game.restore(snapshot)
+        self.assertEqual(game.season.__str__(), 'Builds in Fall 1901.')
+        self.assertEqual(game.position_hash, self.game.position_hash)
+        self.assertEqual(game.info('center counts'),
+                         self.game.info('center counts'))
+        self.assertEqual([order.__str__() for order in game.orders],
+                         [order.__str__() for order in self.game.orders])
+        self.assertEqual(len(game.position_archive), 1)
+
+    def test_snapshot_retreats(self):
+        self.game.season.progress()
+        with self.assertRaises(gm.GameError):
+            self.game.snapshot()
+
     def test_load_graphics(self):
         self.assertIsNone(self.game.graphics)
         self.game.__load_graphics__()
@@ -178,6 +378,20 @@ class TestAdjudicator(unittest.TestCase) :
         with self.assertRaises(ValueError):
             self.game.unit_in(province, require=True)
 
+    def test_unit_in_retreats(self):
+        self.game.order(['A Mun - Bur'])
+        self.game.adjudicate()
+        self.game.order(['A Par - Bur', 'A Mar S A Par - Bur'])
+        self.game.adjudicate()
+        self.assertEqual(self.game.season.phase, 'Retreats')
+        burgundy = self.game.instance('Burgundy', Province)
+        units = [unit for unit in self.game.units
+                 if unit.province is burgundy]
+        self.assertEqual(len(units), 2)
+        self.assertIs(self.game.unit_in(burgundy, any_=True), units[0])
+        self.game.adjudicate()
+        self.assertEqual(self.game.unit_in(burgundy).owner.name, 'France')
+
     def test_adjustment_order(self):
         self.game.order(['A Ber - Sil', 'A War - Pru'])
         self.game.adjudicate()
@@ -197,6 +411,23 @@ class TestAdjudicator(unittest.TestCase) :
         self.assertIn('Kiel', units)
         self.assertIn('Munich', units)
 
+    def test_units_of_clone(self):
+        germany = self.game.instance('Germany', Power)
+        clone = self.game.clone()
+        clone.order(['A Ber - Pru'])
+        clone.adjudicate()
+        clone.delete_unit('Kiel')
+        self.assertEqual(
+            [unit.province.name for unit in clone.units_of(germany)],
+            ['Prussia', 'Munich']
+        )
+        self.assertEqual(
+            [unit.province.name for unit in self.game.units_of(germany)],
+            ['Berlin', 'Kiel', 'Munich']
+        )
+        self.assertIsNone(clone.unit_in('Berlin'))
+        self.assertIs(self.game.unit_in('Berlin').game, self.game)
+
     def test_occupied_provinces(self):
         power = next((p for p in self.game.powers if p.name == 'Germany'))
         provs = [p.name for p in self.game.occupied_provinces(power)]
@@ -256,11 +487,45 @@ class TestAdjudicator(unittest.TestCase) :
         count = self.game.__unresolved_count__()
         self.assertEqual(count, 0)       
 
+    def test___stalled__(self):
+        self.game.order(['A Ber - Mun', 'A Mun - Kie', 'F Kie - Ber',
+                         'A War - Sil'])
+        dependents = self.game.orders.dependents()
+        self.game.__resolve_queue__(deque(self.game.orders), dependents)
+        stalled = self.game.__stalled__(dependents)
+        self.assertEqual(len(stalled), 1)
+        self.assertEqual(
+            sorted(order.unit.location.name for order in stalled[0]),
+            ['Berlin', 'Kiel', 'Munich']
+        )
+        self.assertFalse(self.game.__paradox__(stalled[0]))
+        self.game.__resolve_diplomacy__()
+        self.assertEqual(self.game.__stalled__(dependents), [])
+        self.assertTrue(all(order.moves() for order in stalled[0]))
+
     def test___next_unit_id__(self):
         number = self.game.__next_unit_id__()
         exist = [unit.id for unit in self.game.units]
         self.assertEqual(number, max(exist)+1)
 
+    def test___next_unit_id___deleted(self):
+        unit = max(self.game.units, key=lambda unit: unit.id)
+        self.game.delete_unit(unit)
+        self.game.add_unit('Army', 'Germany', 'Armenia')
+        self.assertGreater(self.game.unit_in('Armenia').id, unit.id)
+
+    def test_clear(self):
+        germany = self.game.instance('Germany', Power)
+        units = self.game.units
+        self.game.clear()
+        self.assertEqual(len(self.game.units), 0)
+        self.assertEqual(len(self.game.orders), 0)
+        self.assertEqual(self.game.units_of(germany), [])
+        self.assertIsNone(self.game.unit_in('Berlin'))
+        self.assertIsNone(units[0].game)
+        self.game.add_unit('Army', 'Germany', 'Berlin')
+        self.assertEqual(len(self.game.orders), 1)
+
     def test_add_unit(self):
         self.game.add_unit('Army', 'Germany', 'Armenia')
         unit = self.game.unit_in('Armenia')
@@ -301,6 +566,224 @@ class TestAdjudicator(unittest.TestCase) :
         self.assertIn('French Army in Marseilles supports the move Paris '
                       'to Burgundy [unresolved].', order)
 
+    def test_order_many(self):
+        strings = ['A Ber - Sil', 'A Mar S A Par - Bur', 'A Par - Bur',
+                   'F Lon - NTH', 'A Ber - Pru']
+        clone = self.game.clone()
+        clone.order(strings)
+        self.game.order_many(strings)
+        self.assertEqual([str(order) for order in self.game.orders],
+                         [str(order) for order in clone.orders])
+        self.assertEqual(len(self.game.orders), 22)
+
+    def test_order_many_cache(self):
+        gm.Game.parsed_orders.clear()
+        self.game.order_many(['A Mar S A Par - Bur', 'F Bre - MAO'])
+        self.assertEqual(len(gm.Game.parsed_orders), 2)
+
+        game = gm.Game('Classic')
+        game.start()
+        game.order_many(['A Mar S A Par - Bur', 'F Bre - MAO'])
+        order = game.orders.order_in(game.instance('Marseilles', Province))
+        self.assertEqual(str(order), 'French Army in Marseilles supports the '
+                         'move Paris to Burgundy [unresolved].')
+        self.assertIs(order.unit, game.unit_in('Marseilles'))
+        self.assertIs(order.object_order.unit, game.unit_in('Paris'))
+
+        # Without the object unit, the cached order is not used.
+        game.delete_unit('Paris')
+        with self.assertRaises(OrderInputError):
+            game.order_many(['A Mar S A Par - Bur'])
+
+    def test_order_many_cache_units(self):
+        gm.Game.parsed_orders.clear()
+        self.game.order_many(['A Ber - Sil'])
+        key = next(iter(gm.Game.parsed_orders))
+        units, _ = gm.Game.parsed_orders[key]
+        self.assertEqual(units[0][1], ('Germany', 'Army'))
+
+        # A unit of another power in the location is parsed again.
+        game = gm.Game('Classic')
+        game.start()
+        game.delete_unit('Berlin')
+        game.add_unit('Army', 'France', 'Berlin')
+        game.order_many(['A Ber - Sil'])
+        units, _ = gm.Game.parsed_orders[key]
+        self.assertEqual(units[0][1], ('France', 'Army'))
+        order = game.orders.order_in(game.instance('Berlin', Province))
+        self.assertEqual(str(order), 'French Army in Berlin move to Silesia '
+                         '[unresolved].')
+
+    def test_order_many_error(self):
+        with self.assertRaises(OrderInputError):
+            self.game.order_many(['A Ber - Sil', 'A Fin - Swe'])
+        order = self.game.orders.order_in(self.game.instance('Berlin',
+                                                             Province))
+        self.assertEqual(order.name, 'move')
+
+    def test_set_order(self):
+        locate = lambda name: self.game.locate(
+            self.game.instance('Army', Force), name).id
+        north_sea = self.game.locate(self.game.instance('Fleet', Force),
+                                     'North Sea').id
+        strings = ['A Par - Bur', 'A Mar S A Par - Bur', 'A Mun S A Ber H',
+                   'F Lon - NTH', 'A Lvp - Bel via convoy',
+                   'F IRI C A Lvp - Bel']
+        specs = [('move', None, locate('Burgundy'), False),
+                 ('support', locate('Paris'), locate('Burgundy'), False),
+                 ('support', locate('Berlin'), None, False),
+                 ('move', None, north_sea, False),
+                 ('move', None, locate('Belgium'), True),
+                 ('convoy', locate('Liverpool'), locate('Belgium'), True)]
+        self.game.add_unit('Fleet', 'England', 'Irish Sea')
+        game = self.game.clone()
+        game.order(strings)
+
+        units = [locate('Paris'), locate('Marseilles'), locate('Munich'),
+                 self.game.unit_in('London'), locate('Liverpool'),
+                 self.game.unit_in('Irish Sea')]
+        for unit, spec in zip(units, specs):
+            order = self.game.set_order(unit, spec)
+            self.assertIs(self.game.orders.order_of(order.unit), order)
+
+        self.assertEqual([str(order) for order in self.game.orders],
+                         [str(order) for order in game.orders])
+
+    def test_revise(self):
+        locate = lambda name: self.game.locate(
+            self.game.instance('Army', Force), name).id
+        self.game.order(['A Par - Bur', 'A Mun - Bur'])
+        self.game.__resolve_diplomacy__()
+        paris = self.game.orders.order_of(self.game.unit_in('Paris'))
+        munich = self.game.orders.order_of(self.game.unit_in('Munich'))
+        self.assertFalse(paris.moves())
+
+        cone = self.game.revise(
+            locate('Marseilles'),
+            ('support', locate('Paris'), locate('Burgundy'), False)
+        )
+        support = self.game.orders.order_of(self.game.unit_in('Marseilles'))
+        self.assertEqual(set(cone), {support, paris, munich})
+        self.assertTrue(paris.moves())
+        self.assertFalse(munich.moves())
+        self.assertEqual(self.game.__unresolved_count__(), 0)
+
+        self.game.revise(locate('Marseilles'), ('hold', None, None, False))
+        self.assertFalse(paris.moves())
+        self.assertFalse(munich.moves())
+
+    def test_revise_convoy(self):
+        for engine in ('default', 'kruijswijk'):
+            game = gm.Game('Classic', engine=engine)
+            game.start()
+            game.delete_unit('Brest')
+            game.delete_unit('London')
+            game.add_unit('Army', 'France', 'Brest')
+            game.add_unit('Fleet', 'France', 'English Channel')
+            game.order(['A Bre - Lon via convoy'])
+            game.__resolve_diplomacy__()
+            brest = game.orders.order_of(game.unit_in('Brest'))
+            self.assertFalse(brest.convoy)
+
+            army = game.instance('Army', Force)
+            game.revise(game.unit_in('English Channel'),
+                        ('convoy', game.locate(army, 'Brest').id,
+                         game.locate(army, 'London').id, True))
+            self.assertEqual(str(brest), 'French Army in Brest move via '
+                             'convoy to London (succeeds).')
+
+            game.revise(game.unit_in('English Channel'),
+                        ('hold', None, None, False))
+            self.assertEqual(str(brest), 'French Army in Brest move to '
+                             'London (fails).')
+
+    def test_evaluate(self):
+        locate = lambda name: self.game.locate(
+            self.game.instance('Army', Force), name).id
+        france = self.game.instance('France', Power)
+        self.game.order('A Par - Pic')
+        outcomes = self.game.evaluate(
+            france,
+            [[], ['A Mar - Bur'], [(locate('Paris'), ('hold', None, None,
+                                                      False))]],
+            ['A Mun - Bur', 'A Ber - Mun']
+        )
+        self.assertEqual(outcomes, [
+            {'moves': 1, 'dislodged': 0, 'centers': 0},
+            {'moves': 1, 'dislodged': 0, 'centers': 0},
+            {'moves': 0, 'dislodged': 0, 'centers': 0},
+        ])
+        self.assertEqual(str(self.game.orders.order_of(
+            self.game.unit_in('Munich'))), 'German Army in Munich holds '
+            '[unresolved].')
+        with self.assertRaises(OrderInputError):
+            self.game.evaluate(france, [['A Mun - Bur']])
+
+    def test_set_order_error(self):
+        army = self.game.instance('Army', Force)
+        fleet = self.game.instance('Fleet', Force)
+        paris = self.game.locate(army, 'Paris').id
+        burgundy = self.game.locate(army, 'Burgundy').id
+        with self.assertRaises(OrderInputError):
+            self.game.set_order(self.game.locate(army, 'Picardy').id,
+                                ('hold', None, None, False))
+        with self.assertRaises(OrderInputError):
+            self.game.set_order(paris, ('move', None, -1, False))
+        with self.assertRaises(OrderInputError):
+            self.game.set_order(paris, ('move', None,
+                                        self.game.locate(fleet, 'Picardy').id,
+                                        False))
+        with self.assertRaises(OrderInputError):
+            self.game.set_order(self.game.unit_in('Brest'),
+                                ('move', None, self.game.locate(
+                                    fleet, 'English Channel').id, True))
+        with self.assertRaises(OrderInputError):
+            self.game.set_order(self.game.locate(army, 'Marseilles').id,
+                                ('convoy', paris, burgundy, True))
+        with self.assertRaises(OrderInputError):
+            self.game.set_order(paris, ('move', None, None, False))
+        self.assertEqual(self.game.orders.order_of(
+            self.game.unit_in('Paris')).name, 'hold')
+
+    def test_set_retreat(self):
+        self.game.order(['A Mun - Bur'])
+        self.game.adjudicate()
+        self.game.order(['A Par - Bur', 'A Mar S A Par - Bur'])
+        self.game.adjudicate()
+        army = self.game.instance('Army', Force)
+        burgundy = self.game.locate(army, 'Burgundy').id
+        self.game.set_retreat(burgundy, self.game.locate(army, 'Ruhr').id)
+        self.assertEqual(str(self.game.orders.orders[0]),
+                         'The Army in Burgundy retreats to Ruhr.')
+        self.game.set_retreat(burgundy, None)
+        self.assertEqual(self.game.orders.orders[0].order.name, 'disband')
+        with self.assertRaises(OrderInputError):
+            self.game.set_retreat(self.game.locate(army, 'Paris').id, None)
+        self.game.adjudicate()
+        self.assertIsNone(self.game.unit_in('Munich'))
+
+    def test_set_adjustment(self):
+        self.game.order(['A Ber - Sil', 'A War - Pru'])
+        self.game.adjudicate()
+        self.game.order(['A Sil - War'])
+        self.game.adjudicate()
+        army = self.game.instance('Army', Force)
+        germany = self.game.instance('Germany', Power)
+        russia = self.game.instance('Russia', Power)
+        self.game.set_adjustment(germany, 1,
+                                 self.game.locate(army, 'Berlin').id)
+        self.assertEqual(str(self.game.adjustment_order(1, germany)),
+                         'German build no. 1 is Army in Berlin.')
+        self.game.set_adjustment(germany, 1, None)
+        self.assertIsNone(self.game.adjustment_order(1, germany).location)
+        with self.assertRaises(OrderInputError):
+            self.game.set_adjustment(russia, 1,
+                                     self.game.locate(army, 'Warsaw').id)
+        self.game.set_adjustment(russia, 1,
+                                 self.game.locate(army, 'Moscow').id)
+        self.assertEqual(str(self.game.adjustment_order(1, russia)),
+                         "Russian disband no. 1 is Army in Moscow.")
+
     def test___resolve_builds__(self):
         self.game.delete_unit('Berlin')
         self.game.adjudicate()
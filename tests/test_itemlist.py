@@ -7,7 +7,7 @@ import unittest
 import adjudicator.game as gm
 
 from lib.itemlist import (__first_appearances__, __appearances__, 
-                          DecoratedItem, ItemList)
+                          DecoratedItem, ItemList, literal)
 from lib.errors import OrderInputError
 
 
@@ -93,6 +93,25 @@ class TestBoard(unittest.TestCase):
         i_l = ItemList('  ', ['Par', 'Bur', 'Mar'])
         self.assertEqual(i_l.first(after=1, before=5), None)
 
+    def test_literal(self):
+        self.assertEqual(literal('Mid-Atlantic Ocean'), 'mid-atlantic ocean')
+        self.assertEqual(literal('(south coast)'), 'south coast')
+
+    def test_ItemList_matches(self):
+        game_map = self.game.variant.map
+        string = 'fleet spain (south coast) move to spain south coast 1 1'
+        matches = self.game.variant.matcher.find(string)
+        for objects, first in [(game_map.provinces, True),
+                               (game_map.provinces, False),
+                               (game_map.forces[1].specifiers, False),
+                               (range(10), False),
+                               (['Spain', 'ain', 'Paris'], False)]:
+            i_l = ItemList(string, objects, first=first, matches=matches)
+            self.assertEqual(
+                str(i_l),
+                str(ItemList(string, objects, first=first))
+            )
+
     def test_ItemList_getitme_(self):
         i_l = ItemList('Burgundy Paris Burgundy',
                        self.game.variant.map.provinces)   
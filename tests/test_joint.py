@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" Unittests for the joint module.
+"""
+
+import unittest
+
+import adjudicator.game as gm
+
+from adjudicator.joint import JointOrders
+
+
+class TestJointOrders(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.game = gm.Game('ClassicFvA')
+
+    def setUp(self):
+        self.game.reset()
+        self.game.start()
+        self.power = self.game.powers[1]
+        self.joint = JointOrders(self.game, self.power)
+
+    def test_digits(self):
+        self.assertEqual(len(self.joint), 8 * 8 * 10)
+        self.assertEqual(self.joint.digits(0), [0, 0, 0])
+        self.assertEqual(self.joint.digits(83), [1, 0, 3])
+        self.assertEqual(self.joint.index([1, 0, 3]), 83)
+
+    def test_orders(self):
+        orders = self.joint.orders(0)
+        self.assertEqual([order.name for order in orders], ['hold'] * 3)
+        self.assertEqual([order.unit for order in orders], self.joint.units)
+        self.assertIsNot(self.joint.orders(0)[0], orders[0])
+
+    def test_pruned(self):
+        for _, orders in self.joint.sets():
+            moves = {order.unit: order for order in orders
+                     if order.name == 'move'}
+            targets = [order.target.province for order in moves.values()]
+            for order in orders:
+                if order.name not in ('support', 'convoy'):
+                    continue
+                other = order.object_order
+                if other.name == 'hold':
+                    self.assertNotIn(other.unit, moves)
+                else:
+                    self.assertIs(moves[other.unit].target.province,
+                                  other.target.province)
+            if len(set(targets)) < len(targets):
+                self.assertIn('support', [order.name for order in orders])
+
+    def test_shards(self):
+        indices = [index for index, _ in self.joint.sets()]
+        self.assertLess(len(indices), len(self.joint))
+        sharded = []
+        for start in range(0, len(self.joint), 97):
+            sharded += [index for index, _ in
+                        self.joint.sets(start, start + 97)]
+        self.assertEqual(sharded, indices)
+
+    def test_convoy(self):
+        self.game.clear()
+        self.game.add_units([['Army', 'France', 'Brest'],
+                             ['Fleet', 'France', 'English Channel'],
+                             ['Fleet', 'France', 'Mid-Atlantic Ocean']])
+        joint = JointOrders(self.game, self.power)
+        convoyed = []
+        for _, orders in joint.sets():
+            army = orders[0]
+            if army.name == 'move' and army.convoy:
+                convoyed.append(army.target.name)
+                self.assertIn('convoy', [order.name for order in orders])
+        self.assertIn('London', convoyed)
+        self.assertIn('Picardy', convoyed)
+        self.game.delete_unit('English Channel')
+        self.game.delete_unit('Mid-Atlantic Ocean')
+        joint = JointOrders(self.game, self.power)
+        self.assertEqual(len(list(joint.sets())), len(joint))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" Module to perform the DATC tests with the Kruijswijk engine.
+"""
+
+import adjudicator.game as gm
+import sys
+import unittest
+
+from adjudicator.kruijswijk import Kruijswijk
+
+import test_adjudicator_DATC as datc
+
+
+class TestKruijswijk(datc.TestAdjudicator):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.gameFvA = gm.Game('ClassicFvA', 'Test', 0, engine='kruijswijk')
+        cls.game = gm.Game('Classic', 'Test', 0, engine='kruijswijk')
+
+    def test_engine(self):
+        self.assertEqual(self.game.engine, 'kruijswijk')
+
+    def test_visit_depth(self):
+        class Link:
+            """ An order depending on the next order of a chain. """
+            def __init__(self):
+                self.resolved = False
+                self.next = None
+
+            def __dependencies__(self, orders):
+                return [] if self.next is None else [self.next]
+
+            def resolve(self, variant, orders):
+                self.resolved = self.next is None or self.next.resolved
+
+        chain = [Link() for _ in range(2 * sys.getrecursionlimit())]
+        for order, entry in zip(chain, chain[1:]):
+            order.next = entry
+        engine = Kruijswijk(None, chain)
+        engine.__visit__(chain[0], [], set())
+        self.assertTrue(all(order.resolved for order in chain))
+
+    def test_unknown_engine(self):
+        with self.assertRaises(gm.GameError):
+            gm.Game('Classic', engine='unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
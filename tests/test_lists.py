@@ -7,7 +7,8 @@ import unittest
 
 from adjudicator import Map, Province, Season
 
-from lib.lists import (first, first_named, flatten, attr_select, translate)
+from lib.lists import (first, first_named, name_index, flatten, attr_select,
+                       translate)
 
 
 class TestBoard(unittest.TestCase):
@@ -41,6 +42,12 @@ class TestBoard(unittest.TestCase):
         self.assertIsInstance(first, Province)
         self.assertFalse(first.supply_center)
 
+    def test_name_index(self):
+        index = name_index(self.map.provinces)
+        self.assertIs(index['Burgundy'],
+                      first_named(self.map.provinces, 'Burgundy'))
+        self.assertEqual(len(index), len(self.map.provinces))
+
     def test_flatten(self):
         answer = flatten([[1], [2, 3], [[4]]])
         self.assertEqual(answer, [1,2,3,[4]])
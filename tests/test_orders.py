@@ -37,6 +37,7 @@ import unittest
 from adjudicator import Force
 
 from adjudicator.orders import Build, Convoy, Hold, Move
+from adjudicator.orders.lib import CUT, VALID
 
 
 class TestOrders(unittest.TestCase):
@@ -74,6 +75,19 @@ class TestOrders(unittest.TestCase):
                                              self.game.orders)
         self.assertEqual(list(self.move.max_move.values()), [2,2,2,2,1,2,2,2])
 
+    def test___add_support__(self):
+        self.game.order('F Kie S Mun - Ber')
+        support = self.game.orders.order_of(self.game.unit_in('Kiel'))
+        move = self.game.orders.order_of(self.game.unit_in('Munich'))
+        self.game.orders.link()
+        self.assertIs(support.supported, move)
+        move.__compute_move_strengths__(self.game.powers, self.game.orders)
+        support.min_status = VALID
+        self.assertEqual(list(move.min_move.values()), [2,2,2,2,1,2,2,2])
+        support.max_status = CUT
+        self.assertEqual(list(move.max_move.values()), [1]*8)
+        self.assertEqual(list(move.min_move.values()), [1]*8)
+
     def test___convoy__(self):
         order = self.game.orders.order_of(self.game.unit_in('Marseilles'))
         self.assertFalse(order.__convoy__(self.game.variant.map,
@@ -81,6 +95,16 @@ class TestOrders(unittest.TestCase):
         self.assertTrue(order.__convoy__(self.game.variant.map,
                                          self.game.orders, 'max_status'))
 
+    def test_convoy_path(self):
+        order = self.game.orders.order_of(self.game.unit_in('Marseilles'))
+        self.assertIsNone(order.convoy_path(self.game.variant.map,
+                                            self.game.orders))
+        self.game.__resolve_diplomacy__()
+        self.assertEqual(order.convoy_path(self.game.variant.map,
+                                           self.game.orders),
+                         [self.game.unit_in('Gulf of Lyon').location])
+        self.assertTrue(self.game.orders.paths)
+
     def test___repels__(self):
         order = self.game.orders.order_of(self.game.unit_in('Munich'))
         move = self.game.orders.order_of(self.game.unit_in('Berlin'))
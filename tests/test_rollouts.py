@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" Unittests for the rollouts module.
+"""
+
+import unittest
+
+import adjudicator.game as gm
+
+from adjudicator.rollouts import random_policy, rollouts
+
+
+def hold_policy(game, rng):
+    """ Policy keeping the default orders.
+
+    """
+    pass
+
+
+class TestRollouts(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.game = gm.Game('Classic')
+
+    def setUp(self):
+        self.game.reset()
+        self.game.start()
+
+    def test_hold_policy(self):
+        results = rollouts(self.game, hold_policy, 2, years=1, workers=0)
+        self.assertEqual(results['rollouts'], 2)
+        self.assertEqual(results['unfinished'], 2)
+        self.assertEqual(results['centers']['Russia'], 4)
+        self.assertEqual(results['phases'], 2)
+        self.assertEqual(sum(results['wins'].values()), 0)
+
+    def test_random_policy(self):
+        results = rollouts(self.game, random_policy, 3, years=2, workers=0)
+        self.assertEqual(list(results['centers']),
+                         [power.name for power in self.game.powers])
+        self.assertLessEqual(sum(results['centers'].values()), 34)
+        self.assertEqual(self.game.season.year, 1901)
+        self.assertEqual(len(self.game.order_archive), 0)
+
+    def test_workers(self):
+        local = rollouts(self.game, random_policy, 4, years=1, workers=0)
+        pooled = rollouts(self.game, random_policy, 4, years=1, workers=2)
+        self.assertEqual(local, pooled)
+
+
+if __name__ == '__main__':
+    unittest.main()